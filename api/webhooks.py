@@ -7,11 +7,18 @@ Receives webhooks, validates them, and routes to appropriate handlers.
 Deployed as a Vercel serverless function at /api/webhooks
 """
 
+import asyncio
 import hmac
 import hashlib
-from typing import Dict, Any
-from fastapi import FastAPI, Request, HTTPException, Response
-from fastapi.responses import JSONResponse
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi import FastAPI, Request, HTTPException, Response, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
 from src.config.settings import get_settings
 from src.utils.logger import configure_logging, get_logger
@@ -38,44 +45,206 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="OSOrganicAI Webhook Handler",
     description="GitHub webhook handler for autonomous AI agents",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Largest webhook body accepted. GitHub caps payloads at 25MB, but the
+# issue, comment and PR events handled here are far below 1MB.
+MAX_WEBHOOK_BODY_BYTES = 2_000_000
 
-def verify_github_signature(payload: bytes, signature: str, secret: str) -> bool:
+# Reply to GitHub's ping event; it never changes, so it is encoded once
+_PING_BODY = orjson.dumps({"status": "success", "message": "Pong!"})
+
+# Delivery IDs this instance handled recently, oldest first. GitHub
+# redelivers on timeouts and 5xx; these are dropped without a database call.
+DELIVERY_CACHE_SIZE = 10_000
+DELIVERY_CACHE_TTL = 3600.0
+_recent_deliveries: "OrderedDict[str, float]" = OrderedDict()
+
+
+async def read_webhook_body(
+    request: Request,
+    max_bytes: int = MAX_WEBHOOK_BODY_BYTES,
+    mac: Optional[hmac.HMAC] = None
+) -> bytes:
     """
-    Verify GitHub webhook signature.
+    Read the request body, rejecting it as soon as it exceeds max_bytes.
+
+    The declared Content-Length is checked before anything is read, and
+    the streamed size is checked while reading, so oversized payloads are
+    never fully buffered. When mac is given, each chunk is fed to it as
+    it arrives, so the signature is computed in the same pass.
 
     Args:
-        payload: Request body as bytes
-        signature: X-Hub-Signature-256 header value
-        secret: Webhook secret
+        request: Incoming request
+        max_bytes: Maximum accepted body size
+        mac: Optional HMAC to update with the body
 
     Returns:
-        bool: True if signature is valid
+        bytes: Request body
 
-    Example:
-        >>> is_valid = verify_github_signature(body, signature, secret)
+    Raises:
+        HTTPException: 413 if the body is larger than max_bytes
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if mac is not None:
+            mac.update(chunk)
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def _seen_recently(delivery_id: str) -> bool:
+    """Check and record a delivery ID in the local cache (expired entries are evicted)."""
+    now = time.monotonic()
+
+    while _recent_deliveries:
+        oldest_seen_at = next(iter(_recent_deliveries.values()))
+        if (
+            now - oldest_seen_at < DELIVERY_CACHE_TTL
+            and len(_recent_deliveries) < DELIVERY_CACHE_SIZE
+        ):
+            break
+        _recent_deliveries.popitem(last=False)
+
+    if delivery_id in _recent_deliveries:
+        return True
+
+    _recent_deliveries[delivery_id] = now
+    return False
+
+
+async def is_duplicate_delivery(delivery_id: Optional[str], event_type: str) -> bool:
+    """
+    Check whether a webhook delivery has already been handled.
+
+    The local cache answers redeliveries to the same instance; the
+    webhook_deliveries table answers across instances. If the database
+    check fails the delivery is treated as new, so an outage never drops
+    events.
+
+    Args:
+        delivery_id: X-GitHub-Delivery header value
+        event_type: X-GitHub-Event header value
+
+    Returns:
+        bool: True if the delivery should be skipped
     """
-    if not signature:
+    if not delivery_id:
         return False
 
-    # GitHub sends signature as "sha256=<hash>"
-    if not signature.startswith("sha256="):
+    if _seen_recently(delivery_id):
+        return True
+
+    db_client = create_supabase_client(
+        url=settings.supabase_url,
+        key=settings.supabase_service_role_key
+    )
+
+    try:
+        claimed = await asyncio.to_thread(
+            db_client.claim_webhook_delivery, delivery_id, event_type
+        )
+    except Exception as e:
+        logger.warning(
+            "Delivery deduplication unavailable, processing anyway",
+            delivery_id=delivery_id,
+            error=str(e)
+        )
         return False
 
-    expected_signature = signature.split("=")[1]
+    return not claimed
+
+
+async def release_delivery(delivery_id: Optional[str]) -> None:
+    """
+    Drop a delivery's claim so GitHub can redeliver it.
+
+    Deliveries are claimed before processing and acknowledged before it
+    finishes, so a failed event would otherwise block its own manual
+    redelivery as a duplicate.
+
+    Args:
+        delivery_id: X-GitHub-Delivery header value
+    """
+    if not delivery_id:
+        return
+
+    _recent_deliveries.pop(delivery_id, None)
 
-    # Compute HMAC
-    mac = hmac.new(
-        secret.encode(),
-        msg=payload,
-        digestmod=hashlib.sha256
+    db_client = create_supabase_client(
+        url=settings.supabase_url,
+        key=settings.supabase_service_role_key
     )
-    computed_signature = mac.hexdigest()
+
+    try:
+        await asyncio.to_thread(db_client.release_webhook_delivery, delivery_id)
+    except Exception as e:
+        logger.warning(
+            "Failed to release delivery claim",
+            delivery_id=delivery_id,
+            error=str(e)
+        )
+
+
+@lru_cache(maxsize=8)
+def _hmac_prototype(secret: str) -> hmac.HMAC:
+    """
+    Get an HMAC-SHA256 object already keyed with the webhook secret.
+
+    Keying pads the secret and hashes the inner/outer blocks; doing that
+    once and copy()-ing the state per request skips it on every delivery.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def signature_matches(mac: hmac.HMAC, signature: Optional[str]) -> bool:
+    """
+    Check a GitHub signature header against an HMAC of the body.
+
+    Args:
+        mac: HMAC keyed with the webhook secret and fed the whole body
+        signature: X-Hub-Signature-256 header value
+
+    Returns:
+        bool: True if signature is valid
+    """
+    # GitHub sends signature as "sha256=<hash>"
+    if not signature or not signature.startswith("sha256="):
+        return False
 
     # Constant-time comparison
-    return hmac.compare_digest(computed_signature, expected_signature)
+    return hmac.compare_digest(mac.hexdigest(), signature[7:])
+
+
+def verify_github_signature(payload: bytes, signature: str, secret: str) -> bool:
+    """
+    Verify GitHub webhook signature.
+
+    Args:
+        payload: Request body as bytes
+        signature: X-Hub-Signature-256 header value
+        secret: Webhook secret
+
+    Returns:
+        bool: True if signature is valid
+
+    Example:
+        >>> is_valid = verify_github_signature(body, signature, secret)
+    """
+    mac = _hmac_prototype(secret).copy()
+    mac.update(payload)
+    return signature_matches(mac, signature)
 
 
 def create_agents():
@@ -85,8 +254,9 @@ def create_agents():
     Returns:
         Tuple of (ProductOwnerAgent, DeveloperAgent)
     """
-    # Create LLM
+    # Create LLM, and open its provider connection while the rest is built
     llm = LLMFactory.from_settings(settings)
+    LLMFactory.prewarm([settings.ai_model_provider])
 
     # Create clients
     github_client = create_github_client(
@@ -115,16 +285,34 @@ def create_agents():
     return po_agent, dev_agent
 
 
+@lru_cache(maxsize=None)
+def get_orchestrator():
+    """
+    Get the workflow orchestrator shared by all webhook deliveries.
+
+    Agents, the LLM and the GitHub/Supabase clients are created on the
+    first delivery and reused afterwards, so connection pools stay warm
+    across webhooks instead of being rebuilt per request.
+
+    Returns:
+        IssueWorkflowOrchestrator: Shared orchestrator
+    """
+    po_agent, dev_agent = create_agents()
+    return create_workflow_orchestrator(po_agent, dev_agent)
+
+
 @app.post("/api/webhooks/github")
-async def github_webhook(request: Request):
+async def github_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Handle GitHub webhook events.
 
-    This endpoint receives all GitHub webhook events and routes them
-    to the appropriate handlers.
+    This endpoint receives all GitHub webhook events, verifies them and
+    acknowledges supported events with 202 right away. The agent work
+    (LLM analysis, database writes, GitHub updates) runs after the
+    response is sent, so deliveries stay well inside GitHub's timeout.
 
     Returns:
-        JSONResponse: Processing status
+        ORJSONResponse: Acceptance status
     """
     try:
         # Get headers
@@ -138,41 +326,53 @@ async def github_webhook(request: Request):
             delivery_id=delivery_id
         )
 
-        # Read body
-        body = await request.body()
+        # Read body (size-capped), computing its signature on the way
+        mac = _hmac_prototype(settings.github_webhook_secret).copy()
+        body = await read_webhook_body(request, mac=mac)
 
         # Verify signature
-        if not verify_github_signature(body, signature, settings.github_webhook_secret):
+        if not signature_matches(mac, signature):
             logger.warning(
                 "Invalid webhook signature",
                 delivery_id=delivery_id
             )
             raise HTTPException(status_code=401, detail="Invalid signature")
 
-        # Parse JSON payload
-        payload = await request.json()
-
-        # Create agents
-        po_agent, dev_agent = create_agents()
-
-        # Create orchestrator
-        orchestrator = create_workflow_orchestrator(po_agent, dev_agent)
-
-        # Route based on event type
-        if event_type == "issues":
-            return await handle_issues_event(payload, orchestrator)
-
-        elif event_type == "issue_comment":
-            return await handle_issue_comment_event(payload, orchestrator)
-
-        elif event_type == "pull_request":
-            return await handle_pull_request_event(payload, orchestrator)
+        # Only events with a route are parsed; the route is picked by action
+        if event_type in ROUTED_EVENTS:
+            payload = orjson.loads(body)
+            action = payload.get("action", "")
+            route = ROUTES.get((event_type, action))
+
+            if route is None:
+                return ORJSONResponse(
+                    content={"status": "ignored", "message": f"Action '{action}' not handled"},
+                    status_code=200
+                )
+
+            if await is_duplicate_delivery(delivery_id, event_type):
+                logger.info(
+                    "Duplicate delivery ignored",
+                    event_type=event_type,
+                    delivery_id=delivery_id
+                )
+                return ORJSONResponse(
+                    content={"status": "duplicate", "delivery_id": delivery_id},
+                    status_code=200
+                )
+
+            background_tasks.add_task(process_event, route, payload, delivery_id)
+            return ORJSONResponse(
+                content={"status": "accepted", "delivery_id": delivery_id},
+                status_code=202
+            )
 
         elif event_type == "ping":
             logger.info("Ping event received")
-            return JSONResponse(
-                content={"status": "success", "message": "Pong!"},
-                status_code=200
+            return Response(
+                content=_PING_BODY,
+                status_code=200,
+                media_type="application/json"
             )
 
         else:
@@ -180,7 +380,7 @@ async def github_webhook(request: Request):
                 "Unsupported event type",
                 event_type=event_type
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"status": "ignored", "message": f"Event type '{event_type}' not handled"},
                 status_code=200
             )
@@ -194,103 +394,143 @@ async def github_webhook(request: Request):
             error=str(e),
             exc_info=True
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "error", "message": str(e)},
             status_code=500
         )
 
 
-async def handle_issues_event(
+async def process_event(
+    route: Callable[[Dict[str, Any], Any], Awaitable[ORJSONResponse]],
     payload: Dict[str, Any],
-    orchestrator
-) -> JSONResponse:
+    delivery_id: str
+) -> None:
     """
-    Handle 'issues' event.
+    Process an accepted webhook delivery in the background.
+
+    Failures are logged and the delivery's claim is released, since it
+    has already been acknowledged and can only be retried by redelivery.
+
+    Args:
+        route: Handler selected from ROUTES
+        payload: GitHub webhook payload
+        delivery_id: X-GitHub-Delivery header value
+    """
+    try:
+        # The first call builds the agents and clients (module imports,
+        # network setup), so it runs off the event loop
+        orchestrator = await asyncio.to_thread(get_orchestrator)
+        response = await route(payload, orchestrator)
 
-    Processes: opened, labeled, etc.
+        logger.info(
+            "Webhook processed",
+            handler=route.__name__,
+            delivery_id=delivery_id,
+            status_code=response.status_code
+        )
+
+    except Exception as e:
+        logger.error(
+            "Webhook processing failed",
+            handler=route.__name__,
+            delivery_id=delivery_id,
+            error=str(e),
+            exc_info=True
+        )
+        await release_delivery(delivery_id)
+
+
+async def handle_issue_opened(
+    payload: Dict[str, Any],
+    orchestrator
+) -> ORJSONResponse:
+    """
+    Handle 'issues' / 'opened': analyze the new issue.
 
     Args:
         payload: GitHub webhook payload
         orchestrator: Workflow orchestrator
 
     Returns:
-        JSONResponse: Processing status
+        ORJSONResponse: Processing status
     """
-    action = payload.get("action")
     issue = payload.get("issue", {})
-    repository = payload.get("repository", {})
 
-    issue_number = issue.get("number")
-    issue_id = issue.get("id")
-    issue_title = issue.get("title")
-    issue_body = issue.get("body", "")
-    repo_full_name = repository.get("full_name")
+    logger.info(
+        "Processing issues event",
+        action="opened",
+        issue_number=issue.get("number")
+    )
+
+    state = await orchestrator.handle_new_issue(
+        issue_number=issue.get("number"),
+        issue_id=issue.get("id"),
+        issue_title=issue.get("title"),
+        issue_body=issue.get("body", ""),
+        repo_full_name=payload.get("repository", {}).get("full_name")
+    )
+
+    return ORJSONResponse(
+        content={
+            "status": "success",
+            "message": "Issue analyzed",
+            "conversation_status": state.status
+        },
+        status_code=200
+    )
+
+
+async def handle_issue_labeled(
+    payload: Dict[str, Any],
+    orchestrator
+) -> ORJSONResponse:
+    """
+    Handle 'issues' / 'labeled': trigger development on ready-for-dev.
+
+    Args:
+        payload: GitHub webhook payload
+        orchestrator: Workflow orchestrator
+
+    Returns:
+        ORJSONResponse: Processing status
+    """
+    issue_number = payload.get("issue", {}).get("number")
 
     logger.info(
         "Processing issues event",
-        action=action,
+        action="labeled",
         issue_number=issue_number
     )
 
-    if action == "opened":
-        # New issue created
-        state = orchestrator.handle_new_issue(
-            issue_number=issue_number,
-            issue_id=issue_id,
-            issue_title=issue_title,
-            issue_body=issue_body,
-            repo_full_name=repo_full_name
-        )
+    result = await orchestrator.handle_label_added(
+        issue_number=issue_number,
+        label_name=payload.get("label", {}).get("name"),
+        repo_full_name=payload.get("repository", {}).get("full_name")
+    )
 
-        return JSONResponse(
+    if result:
+        return ORJSONResponse(
             content={
                 "status": "success",
-                "message": "Issue analyzed",
-                "conversation_status": state.status
+                "message": "Development triggered",
+                "pr_created": result.pr_number is not None,
+                "pr_number": result.pr_number
             },
             status_code=200
         )
-
-    elif action == "labeled":
-        # Label added to issue
-        label = payload.get("label", {})
-        label_name = label.get("name")
-
-        result = orchestrator.handle_label_added(
-            issue_number=issue_number,
-            label_name=label_name,
-            repo_full_name=repo_full_name
-        )
-
-        if result:
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Development triggered",
-                    "pr_created": result.pr_number is not None,
-                    "pr_number": result.pr_number
-                },
-                status_code=200
-            )
-        else:
-            return JSONResponse(
-                content={"status": "ignored", "message": "Label not a trigger"},
-                status_code=200
-            )
-
     else:
-        return JSONResponse(
-            content={"status": "ignored", "message": f"Action '{action}' not handled"},
+        return ORJSONResponse(
+            content={"status": "ignored", "message": "Label not a trigger"},
             status_code=200
         )
 
 
-async def handle_issue_comment_event(
+async def handle_issue_comment_created(
     payload: Dict[str, Any],
     orchestrator
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
-    Handle 'issue_comment' event.
+    Handle 'issue_comment' / 'created'.
 
     Processes user responses to clarifying questions.
 
@@ -299,113 +539,98 @@ async def handle_issue_comment_event(
         orchestrator: Workflow orchestrator
 
     Returns:
-        JSONResponse: Processing status
+        ORJSONResponse: Processing status
     """
-    action = payload.get("action")
-    issue = payload.get("issue", {})
     comment = payload.get("comment", {})
-    repository = payload.get("repository", {})
 
     # Skip if comment is from a bot (avoid loops)
     if comment.get("user", {}).get("type") == "Bot":
         logger.info("Ignoring bot comment")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "ignored", "message": "Bot comment"},
             status_code=200
         )
 
-    if action == "created":
-        issue_number = issue.get("number")
-        comment_body = comment.get("body", "")
-        repo_full_name = repository.get("full_name")
+    issue_number = payload.get("issue", {}).get("number")
 
-        logger.info(
-            "Processing issue comment",
-            issue_number=issue_number
-        )
-
-        state = orchestrator.handle_issue_comment(
-            issue_number=issue_number,
-            comment_body=comment_body,
-            repo_full_name=repo_full_name
-        )
-
-        if state:
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Comment processed",
-                    "conversation_status": state.status
-                },
-                status_code=200
-            )
-        else:
-            return JSONResponse(
-                content={"status": "ignored", "message": "No active conversation"},
-                status_code=200
-            )
+    logger.info(
+        "Processing issue comment",
+        issue_number=issue_number
+    )
 
-    return JSONResponse(
-        content={"status": "ignored", "message": f"Action '{action}' not handled"},
-        status_code=200
+    state = await orchestrator.handle_issue_comment(
+        issue_number=issue_number,
+        comment_body=comment.get("body", ""),
+        repo_full_name=payload.get("repository", {}).get("full_name")
     )
 
+    if state:
+        return ORJSONResponse(
+            content={
+                "status": "success",
+                "message": "Comment processed",
+                "conversation_status": state.status
+            },
+            status_code=200
+        )
+    else:
+        return ORJSONResponse(
+            content={"status": "ignored", "message": "No active conversation"},
+            status_code=200
+        )
+
 
-async def handle_pull_request_event(
+async def handle_pull_request_opened(
     payload: Dict[str, Any],
     orchestrator
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
-    Handle 'pull_request' event.
+    Handle 'pull_request' / 'opened'.
 
-    Updates conversation state when PR is opened/merged.
+    Updates conversation state for the issue the PR closes.
 
     Args:
         payload: GitHub webhook payload
         orchestrator: Workflow orchestrator
 
     Returns:
-        JSONResponse: Processing status
+        ORJSONResponse: Processing status
     """
-    action = payload.get("action")
     pr = payload.get("pull_request", {})
-    repository = payload.get("repository", {})
-
-    pr_number = pr.get("number")
-    repo_full_name = repository.get("full_name")
-
-    # Extract linked issue number from PR body
-    pr_body = pr.get("body", "")
-    issue_number = None
-
-    # Simple parsing of "Closes #123" format
-    if "Closes #" in pr_body or "closes #" in pr_body:
-        import re
-        match = re.search(r"[Cc]loses #(\d+)", pr_body)
-        if match:
-            issue_number = int(match.group(1))
-
-    if action == "opened":
-        orchestrator.handle_pr_opened(
-            pr_number=pr_number,
-            issue_number=issue_number,
-            repo_full_name=repo_full_name
-        )
 
-        return JSONResponse(
-            content={
-                "status": "success",
-                "message": "PR event processed"
-            },
-            status_code=200
-        )
+    # Extract linked issue number from PR body ("Closes #123" format)
+    match = _CLOSES_ISSUE_RE.search(pr.get("body") or "")
+    issue_number = int(match.group(1)) if match else None
 
-    return JSONResponse(
-        content={"status": "ignored", "message": f"Action '{action}' not handled"},
+    await orchestrator.handle_pr_opened(
+        pr_number=pr.get("number"),
+        issue_number=issue_number,
+        repo_full_name=payload.get("repository", {}).get("full_name")
+    )
+
+    return ORJSONResponse(
+        content={
+            "status": "success",
+            "message": "PR event processed"
+        },
         status_code=200
     )
 
 
+_CLOSES_ISSUE_RE = re.compile(r"[Cc]loses #(\d+)")
+
+# (event type, action) -> handler run in the background for accepted deliveries
+ROUTES: Dict[Tuple[str, str], Callable[[Dict[str, Any], Any], Awaitable[ORJSONResponse]]] = {
+    ("issues", "opened"): handle_issue_opened,
+    ("issues", "labeled"): handle_issue_labeled,
+    ("issue_comment", "created"): handle_issue_comment_created,
+    ("pull_request", "opened"): handle_pull_request_opened,
+}
+
+# Event types whose payload is parsed to look up a route
+ROUTED_EVENTS = frozenset(event_type for event_type, _ in ROUTES)
+
+
 # Vercel serverless function handler
 # This is the actual entry point for Vercel
 handler = app
@@ -14,16 +14,17 @@ SOLID Principles:
 - Open/Closed: Extended via abstract methods, not modified
 - Liskov Substitution: All agents maintain base contract
 - Interface Segregation: Depends on thin interfaces (protocols)
-- Dependency Inversion: Depends on abstractions (BaseChatModel, protocols)
+- Dependency Inversion: Depends on abstractions (Runnable, protocols)
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from langchain.chat_models.base import BaseChatModel
 from langchain.schema import BaseMessage, SystemMessage, HumanMessage, AIMessage
 from langchain.callbacks.base import BaseCallbackHandler
+from langchain.schema.runnable import Runnable
 
 from src.interfaces.vcs_client import VCSClientProtocol
 from src.interfaces.database_client import DatabaseClientProtocol
@@ -52,7 +53,7 @@ class BaseAgent(ABC, LoggerMixin):
 
     def __init__(
         self,
-        llm: BaseChatModel,
+        llm: Runnable,
         vcs_client: VCSClientProtocol,
         db_client: DatabaseClientProtocol
     ):
@@ -135,6 +136,42 @@ class BaseAgent(ABC, LoggerMixin):
         """
         return base_prompt
 
+    @cached_property
+    def static_system_prompt(self) -> str:
+        """
+        System prompt without additional context, built once per agent.
+
+        The system prompt, domain context and customization don't change
+        between calls, so the same string is sent every time and stays a
+        byte-identical prefix for the provider's prompt cache.
+
+        Returns:
+            str: Customized system prompt with domain context
+        """
+        return self.customize_prompt(self._system_prompt_body())
+
+    def _system_prompt_body(
+        self,
+        additional_context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Combine system prompt, domain context and additional context."""
+        domain_context = self.get_domain_context()
+        parts = [self.get_system_prompt()]
+
+        if domain_context:
+            parts.append("\n\n## Domain Context\n")
+            parts.append(domain_context)
+
+        if additional_context:
+            parts.append("\n\n## Additional Context")
+            parts.extend(
+                f"\n- {key}: {value}"
+                for key, value in additional_context.items()
+            )
+
+        # One join sizes and copies the final prompt once
+        return "".join(parts)
+
     # ============================================
     # Core Agent Methods (Template Method)
     # ============================================
@@ -159,25 +196,13 @@ class BaseAgent(ABC, LoggerMixin):
         Returns:
             List[BaseMessage]: List of LangChain messages
         """
-        # Get components
-        domain_context = self.get_domain_context()
-        system_prompt = self.get_system_prompt()
-
-        # Build full system message
-        full_system_prompt = f"{system_prompt}"
-
-        if domain_context:
-            full_system_prompt += f"\n\n## Domain Context\n{domain_context}"
-
+        # Build full system message (static unless extra context is given)
         if additional_context:
-            context_str = "\n".join(
-                f"- {key}: {value}"
-                for key, value in additional_context.items()
+            full_system_prompt = self.customize_prompt(
+                self._system_prompt_body(additional_context)
             )
-            full_system_prompt += f"\n\n## Additional Context\n{context_str}"
-
-        # Customize if needed
-        full_system_prompt = self.customize_prompt(full_system_prompt)
+        else:
+            full_system_prompt = self.static_system_prompt
 
         # Build messages
         messages: List[BaseMessage] = [
@@ -319,15 +344,25 @@ class BaseAgent(ABC, LoggerMixin):
         self,
         conversation_id: str,
         status: str,
-        analysis: Optional[Dict[str, Any]] = None
-    ) -> None:
+        analysis: Optional[Dict[str, Any]] = None,
+        action_type: Optional[str] = None,
+        action_payload: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Update conversation state in database.
 
+        Status, analysis and an optional action log entry are written in
+        a single transactional call.
+
         Args:
             conversation_id: Conversation UUID
             status: New status
             analysis: Optional analysis data
+            action_type: Optional action to log with the update
+            action_payload: Action data for action_type
+
+        Returns:
+            Optional[str]: Action log UUID if an action was logged
         """
         self.logger.info(
             "Updating conversation state",
@@ -335,10 +370,14 @@ class BaseAgent(ABC, LoggerMixin):
             status=status
         )
 
-        self.db_client.update_conversation_status(conversation_id, status)
-
-        if analysis:
-            self.db_client.update_conversation_analysis(conversation_id, analysis)
+        return self.db_client.update_conversation_with_action(
+            conversation_id=conversation_id,
+            status=status,
+            analysis=analysis or None,
+            agent_type=self.agent_name if action_type else None,
+            action_type=action_type,
+            payload=action_payload
+        )
 
     # ============================================
     # Helper Methods
@@ -419,4 +458,6 @@ class BaseAgent(ABC, LoggerMixin):
 
     def __repr__(self) -> str:
         """String representation of agent."""
-        return f"{self.agent_name}(llm={self.llm.__class__.__name__})"
+        # create_llm returns the model wrapped in a RunnableBinding
+        llm = getattr(self.llm, "bound", self.llm)
+        return f"{self.agent_name}(llm={llm.__class__.__name__})"
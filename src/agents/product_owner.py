@@ -12,6 +12,7 @@ Child instances customize via:
 This is the TEMPLATE version - generic and reusable.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from langchain.output_parsers import PydanticOutputParser
 from langchain.schema import BaseMessage, HumanMessage
@@ -266,11 +267,12 @@ Analyze this issue thoroughly and determine:
         # Format with agent signature
         formatted_comment = self.format_github_comment(comment_body)
 
-        # Post to GitHub
-        self.vcs_client.create_issue_comment(issue_number, formatted_comment)
-
-        # Add label
-        self.vcs_client.add_labels_to_issue(issue_number, ["needs-clarification"])
+        # Post comment and add label (independent writes, sent together)
+        self.vcs_client.apply_triage(
+            issue_number=issue_number,
+            labels=["needs-clarification"],
+            comment_body=formatted_comment
+        )
 
         # Log action
         self.log_action(
@@ -326,12 +328,13 @@ Analyze this issue thoroughly and determine:
         # Format with signature
         formatted_comment = self.format_github_comment(comment_body)
 
-        # Post to GitHub
-        self.vcs_client.create_issue_comment(issue_number, formatted_comment)
-
-        # Update labels
-        self.vcs_client.remove_labels_from_issue(issue_number, ["needs-clarification"])
-        self.vcs_client.add_labels_to_issue(issue_number, suggested_labels + ["ready-for-dev"])
+        # Post comment and update labels (independent writes, sent together)
+        self.vcs_client.apply_triage(
+            issue_number=issue_number,
+            labels=suggested_labels + ["ready-for-dev"],
+            comment_body=formatted_comment,
+            remove_labels=["needs-clarification"]
+        )
 
         # Log action
         self.log_action(
@@ -347,7 +350,8 @@ Analyze this issue thoroughly and determine:
     def process_user_response(
         self,
         conversation_id: str,
-        user_responses: List[str]
+        user_responses: List[str],
+        log_result: bool = True
     ) -> IssueAnalysis:
         """
         Process user's answers to clarifying questions.
@@ -358,6 +362,9 @@ Analyze this issue thoroughly and determine:
         Args:
             conversation_id: Conversation UUID
             user_responses: User's answers to previous questions
+            log_result: Log the "user_response_processed" action. Pass
+                False when the caller records it together with the
+                conversation state update
 
         Returns:
             IssueAnalysis: Updated analysis
@@ -406,18 +413,36 @@ Provide an updated IssueAnalysis."""
         analysis = parser.parse(response)
 
         # Log action
-        self.log_action(
-            action_type="user_response_processed",
-            payload={
-                "conversation_id": conversation_id,
-                "still_needs_clarification": analysis.needs_clarification,
-                "is_complete": analysis.is_complete
-            },
-            conversation_id=conversation_id
-        )
+        if log_result:
+            self.log_action(
+                action_type="user_response_processed",
+                payload=self.user_response_payload(conversation_id, analysis),
+                conversation_id=conversation_id
+            )
 
         return analysis
 
+    @staticmethod
+    def user_response_payload(
+        conversation_id: str,
+        analysis: IssueAnalysis
+    ) -> Dict[str, Any]:
+        """
+        Build the "user_response_processed" action payload.
+
+        Args:
+            conversation_id: Conversation UUID
+            analysis: Analysis produced from the user's response
+
+        Returns:
+            Dict[str, Any]: Action payload
+        """
+        return {
+            "conversation_id": conversation_id,
+            "still_needs_clarification": analysis.needs_clarification,
+            "is_complete": analysis.is_complete
+        }
+
     @log_function_call
     def handle_issue_workflow(
         self,
@@ -431,9 +456,12 @@ Provide an updated IssueAnalysis."""
         Complete workflow for handling a new issue.
 
         This orchestrates the entire process:
-        1. Create conversation record
-        2. Analyze the issue
-        3. Post questions OR mark ready for dev
+        1. Analyze the issue
+        2. Persist the conversation with its analysis (one database call)
+           while posting questions OR marking ready for dev
+
+        The database write and the GitHub write are independent, so they
+        run side by side instead of one after the other.
 
         Args:
             issue_number: GitHub issue number
@@ -460,49 +488,56 @@ Provide an updated IssueAnalysis."""
             repo_full_name=repo_full_name
         )
 
-        # Get or create conversation
-        conversation_id = self.get_or_create_conversation(
-            issue_number=issue_number,
-            issue_id=issue_id,
-            repo_full_name=repo_full_name
-        )
-
         # Analyze issue
         analysis = self.analyze_issue(
             issue_number=issue_number,
             issue_title=issue_title,
             issue_body=issue_body
         )
+        status = "needs_clarification" if analysis.needs_clarification else "ready_for_dev"
 
-        # Update conversation with analysis
-        self.update_conversation_state(
-            conversation_id=conversation_id,
-            status="needs_clarification" if analysis.needs_clarification else "ready_for_dev",
-            analysis=analysis.model_dump()
-        )
-
-        # Take action based on analysis
-        if analysis.needs_clarification:
-            # Ask questions
-            self.ask_clarifying_questions(
-                issue_number=issue_number,
-                questions=analysis.questions
-            )
-        elif analysis.is_complete:
-            # Mark ready for dev
-            self.mark_ready_for_development(
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Create (or update) conversation with analysis
+            conversation_future = executor.submit(
+                self.db_client.create_conversation_with_analysis,
+                issue_id=issue_id,
                 issue_number=issue_number,
-                refined_description=analysis.refined_description or issue_body,
-                acceptance_criteria=analysis.acceptance_criteria,
-                suggested_labels=analysis.suggested_labels
+                repo_full_name=repo_full_name,
+                status=status,
+                analysis=analysis.model_dump()
             )
 
-        # Build conversation state (simplified)
-        state = ConversationState(
+            # Take action based on analysis
+            if analysis.needs_clarification:
+                # Ask questions while the conversation is written; the
+                # comment does not depend on the stored state
+                questions_future = executor.submit(
+                    self.ask_clarifying_questions,
+                    issue_number=issue_number,
+                    questions=analysis.questions
+                )
+                conversation_future.result()
+                questions_future.result()
+            else:
+                # The ready-for-development label triggers the developer,
+                # which reads the conversation, so it must be stored first
+                conversation_future.result()
+                if analysis.is_complete:
+                    self.mark_ready_for_development(
+                        issue_number=issue_number,
+                        refined_description=analysis.refined_description or issue_body,
+                        acceptance_criteria=analysis.acceptance_criteria,
+                        suggested_labels=analysis.suggested_labels
+                    )
+
+        # Build conversation state (simplified). The inputs are the webhook's
+        # issue fields and the analysis the parser just validated, so skip
+        # re-validation
+        state = ConversationState.model_construct(
             issue_id=issue_id,
             issue_number=issue_number,
             repo_full_name=repo_full_name,
-            status="needs_clarification" if analysis.needs_clarification else "ready_for_dev",
+            status=status,
             current_analysis=analysis
         )
 
@@ -115,6 +115,9 @@ CREATE TABLE IF NOT EXISTS agent_actions (
     execution_time_ms INTEGER,
     -- Time taken to execute the action
 
+    dedupe_key TEXT,
+    -- Optional idempotency key (e.g. webhook delivery id)
+
     -- Metadata
     created_at TIMESTAMPTZ DEFAULT NOW(),
 
@@ -124,6 +127,9 @@ CREATE TABLE IF NOT EXISTS agent_actions (
     )
 );
 
+-- Columns added after the initial release
+ALTER TABLE agent_actions ADD COLUMN IF NOT EXISTS dedupe_key TEXT;
+
 -- Indexes for agent_actions
 CREATE INDEX IF NOT EXISTS idx_agent_actions_conversation_id
     ON agent_actions(conversation_id);
@@ -140,6 +146,14 @@ CREATE INDEX IF NOT EXISTS idx_agent_actions_status
 CREATE INDEX IF NOT EXISTS idx_agent_actions_created_at
     ON agent_actions(created_at DESC);
 
+-- Idempotent action logging (NULL dedupe_key never conflicts)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_agent_actions_dedupe
+    ON agent_actions(conversation_id, action_type, dedupe_key);
+
+-- Keyset pagination of a conversation's actions (newest first)
+CREATE INDEX IF NOT EXISTS idx_agent_actions_conversation_keyset
+    ON agent_actions(conversation_id, created_at DESC, id DESC);
+
 -- GIN index for JSONB payload field
 CREATE INDEX IF NOT EXISTS idx_agent_actions_payload
     ON agent_actions USING GIN (payload);
@@ -216,6 +230,10 @@ CREATE INDEX IF NOT EXISTS idx_code_generations_status
 CREATE INDEX IF NOT EXISTS idx_code_generations_created_at
     ON code_generations(created_at DESC);
 
+-- Latest code generation of a conversation (newest first)
+CREATE INDEX IF NOT EXISTS idx_code_generations_conversation_created
+    ON code_generations(conversation_id, created_at DESC);
+
 -- GIN indexes for JSONB fields
 CREATE INDEX IF NOT EXISTS idx_code_generations_files_changed
     ON code_generations USING GIN (files_changed);
@@ -226,6 +244,25 @@ CREATE INDEX IF NOT EXISTS idx_code_generations_tests_generated
 CREATE INDEX IF NOT EXISTS idx_code_generations_review
     ON code_generations USING GIN (review);
 
+-- ============================================
+-- Table: webhook_deliveries
+-- ============================================
+-- Records GitHub webhook delivery IDs so redelivered events are
+-- processed only once across all instances.
+
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    -- X-GitHub-Delivery header value
+    delivery_id TEXT PRIMARY KEY,
+
+    event_type TEXT,
+
+    received_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Old deliveries can be pruned by age
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_received_at
+    ON webhook_deliveries(received_at);
+
 -- ============================================
 -- Functions and Triggers
 -- ============================================
@@ -253,6 +290,107 @@ CREATE TRIGGER update_code_generations_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================
+-- Read Functions (called via PostgREST RPC)
+-- ============================================
+-- Hot read paths go through SQL functions so the pooler can reuse
+-- prepared statements instead of re-planning generic selects.
+
+CREATE OR REPLACE FUNCTION get_conversation(p_issue_number INTEGER, p_repo TEXT)
+RETURNS SETOF conversations
+LANGUAGE sql STABLE AS $$
+    SELECT * FROM conversations
+    WHERE issue_number = p_issue_number AND repo_full_name = p_repo
+    LIMIT 1
+$$;
+
+-- Keyset-paginated: pass the (created_at, id) of the last row seen to
+-- fetch the next page without an OFFSET scan
+DROP FUNCTION IF EXISTS get_agent_actions(UUID, INTEGER);
+CREATE OR REPLACE FUNCTION get_agent_actions(
+    p_conversation_id UUID,
+    p_limit INTEGER DEFAULT 100,
+    p_before_created_at TIMESTAMPTZ DEFAULT NULL,
+    p_before_id UUID DEFAULT NULL
+)
+RETURNS SETOF agent_actions
+LANGUAGE sql STABLE AS $$
+    SELECT * FROM agent_actions
+    WHERE conversation_id = p_conversation_id
+      AND (
+          p_before_created_at IS NULL
+          OR (created_at, id) < (p_before_created_at, p_before_id)
+      )
+    ORDER BY created_at DESC, id DESC
+    LIMIT p_limit
+$$;
+
+CREATE OR REPLACE FUNCTION get_code_generation(p_generation_id UUID)
+RETURNS SETOF code_generations
+LANGUAGE sql STABLE AS $$
+    SELECT * FROM code_generations
+    WHERE id = p_generation_id
+$$;
+
+-- ============================================
+-- Write Functions (called via PostgREST RPC)
+-- ============================================
+
+-- Update a conversation's status (and optionally analysis) and log an
+-- agent action in one transaction. Returns the new action id, or NULL
+-- when no action_type is given.
+CREATE OR REPLACE FUNCTION update_conversation_with_action(
+    p_conversation_id UUID,
+    p_status TEXT,
+    p_analysis JSONB DEFAULT NULL,
+    p_agent_type TEXT DEFAULT NULL,
+    p_action_type TEXT DEFAULT NULL,
+    p_payload JSONB DEFAULT '{}'::jsonb
+)
+RETURNS UUID
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_action_id UUID;
+BEGIN
+    UPDATE conversations
+    SET status = p_status,
+        analysis = COALESCE(p_analysis, analysis)
+    WHERE id = p_conversation_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Conversation % not found', p_conversation_id;
+    END IF;
+
+    IF p_action_type IS NOT NULL THEN
+        INSERT INTO agent_actions (conversation_id, agent_type, action_type, payload)
+        VALUES (p_conversation_id, p_agent_type, p_action_type, p_payload)
+        RETURNING id INTO v_action_id;
+    END IF;
+
+    RETURN v_action_id;
+END;
+$$;
+
+-- Create a conversation with its first analysis in one statement, or
+-- update status and analysis if the issue already has a conversation.
+-- Returns the conversation id.
+CREATE OR REPLACE FUNCTION create_conversation_with_analysis(
+    p_issue_id BIGINT,
+    p_issue_number INTEGER,
+    p_repo_full_name TEXT,
+    p_status TEXT,
+    p_analysis JSONB
+)
+RETURNS UUID
+LANGUAGE sql AS $$
+    INSERT INTO conversations (issue_id, issue_number, repo_full_name, status, analysis)
+    VALUES (p_issue_id, p_issue_number, p_repo_full_name, p_status, p_analysis)
+    ON CONFLICT (repo_full_name, issue_number) DO UPDATE
+    SET status = EXCLUDED.status,
+        analysis = EXCLUDED.analysis
+    RETURNING id;
+$$;
+
 -- ============================================
 -- Row Level Security (RLS) Policies
 -- ============================================
@@ -264,6 +402,7 @@ CREATE TRIGGER update_code_generations_updated_at
 ALTER TABLE conversations ENABLE ROW LEVEL SECURITY;
 ALTER TABLE agent_actions ENABLE ROW LEVEL SECURITY;
 ALTER TABLE code_generations ENABLE ROW LEVEL SECURITY;
+ALTER TABLE webhook_deliveries ENABLE ROW LEVEL SECURITY;
 
 -- Policy: Allow all operations for service role
 CREATE POLICY "Enable all operations for service role" ON conversations
@@ -284,6 +423,12 @@ CREATE POLICY "Enable all operations for service role" ON code_generations
     USING (true)
     WITH CHECK (true);
 
+CREATE POLICY "Enable all operations for service role" ON webhook_deliveries
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
 -- Policy: Allow read access for authenticated users (optional)
 -- Uncomment if you want users to view conversation data
 -- CREATE POLICY "Enable read access for authenticated users" ON conversations
@@ -346,15 +491,42 @@ GRANT USAGE ON SCHEMA public TO authenticated;
 GRANT ALL ON conversations TO service_role;
 GRANT ALL ON agent_actions TO service_role;
 GRANT ALL ON code_generations TO service_role;
+GRANT ALL ON webhook_deliveries TO service_role;
+
+-- Grant execute on read functions
+GRANT EXECUTE ON FUNCTION get_conversation(INTEGER, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION get_agent_actions(UUID, INTEGER, TIMESTAMPTZ, UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION get_code_generation(UUID) TO service_role;
+
+GRANT EXECUTE ON FUNCTION update_conversation_with_action(UUID, TEXT, JSONB, TEXT, TEXT, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION create_conversation_with_analysis(BIGINT, INTEGER, TEXT, TEXT, JSONB) TO service_role;
 
 -- Grant select on views
 GRANT SELECT ON recent_agent_activity TO service_role;
 GRANT SELECT ON conversation_summary TO service_role;
 
+-- ============================================
+-- Data Migration: string-encoded JSON
+-- ============================================
+-- Older clients wrote JSON fields as JSON-encoded strings. Run once to
+-- convert those rows to native JSONB objects:
+--
+-- UPDATE conversations SET analysis = (analysis #>> '{}')::jsonb
+--   WHERE jsonb_typeof(analysis) = 'string';
+-- UPDATE agent_actions SET payload = (payload #>> '{}')::jsonb
+--   WHERE jsonb_typeof(payload) = 'string';
+-- UPDATE code_generations SET files_changed = (files_changed #>> '{}')::jsonb
+--   WHERE jsonb_typeof(files_changed) = 'string';
+-- UPDATE code_generations SET tests_generated = (tests_generated #>> '{}')::jsonb
+--   WHERE jsonb_typeof(tests_generated) = 'string';
+
 -- ============================================
 -- Sample Queries (for reference)
 -- ============================================
 
+-- Prune webhook deliveries older than GitHub's redelivery window
+-- DELETE FROM webhook_deliveries WHERE received_at < NOW() - INTERVAL '7 days';
+
 -- Find all conversations for a repo
 -- SELECT * FROM conversations WHERE repo_full_name = 'owner/repo' ORDER BY created_at DESC;
 
@@ -7,7 +7,7 @@ following the Interface Segregation Principle (ISP).
 Agents depend on this interface, not concrete implementations.
 """
 
-from typing import Protocol, List, Dict, Any, Optional
+from typing import Protocol, List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
 
@@ -44,6 +44,29 @@ class DatabaseClientProtocol(Protocol):
         """
         ...
 
+    def create_conversation_with_analysis(
+        self,
+        issue_id: int,
+        issue_number: int,
+        repo_full_name: str,
+        status: str,
+        analysis: Dict[str, Any]
+    ) -> str:
+        """
+        Create a conversation with its first analysis (upsert by issue).
+
+        Args:
+            issue_id: GitHub issue ID
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            status: Conversation status
+            analysis: Analysis data (IssueAnalysis serialized)
+
+        Returns:
+            str: Conversation UUID
+        """
+        ...
+
     def get_conversation(
         self,
         issue_number: int,
@@ -61,6 +84,50 @@ class DatabaseClientProtocol(Protocol):
         """
         ...
 
+    def get_conversation_with_actions(
+        self,
+        issue_number: int,
+        repo_full_name: str,
+        limit: int = 100,
+        full: bool = False,
+        code_generation_limit: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a conversation together with its most recent agent actions.
+
+        Args:
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            limit: Maximum number of actions to include
+            full: Return every column, including action payloads
+            code_generation_limit: Also include this many most recent code
+                generations as "code_generations"
+
+        Returns:
+            Optional[Dict[str, Any]]: Conversation data with an
+                "agent_actions" list (newest first), or None
+        """
+        ...
+
+    def prefetch_for_issue(
+        self,
+        issue_number: int,
+        repo_full_name: str,
+        action_limit: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load and cache the state a webhook usually reads for an issue.
+
+        Args:
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            action_limit: Number of recent actions to prefetch
+
+        Returns:
+            Optional[Dict[str, Any]]: Conversation data or None
+        """
+        ...
+
     def update_conversation_status(
         self,
         conversation_id: str,
@@ -89,6 +156,31 @@ class DatabaseClientProtocol(Protocol):
         """
         ...
 
+    def update_conversation_with_action(
+        self,
+        conversation_id: str,
+        status: str,
+        analysis: Optional[Dict[str, Any]] = None,
+        agent_type: Optional[str] = None,
+        action_type: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Update conversation status/analysis and log an action atomically.
+
+        Args:
+            conversation_id: Conversation UUID
+            status: New status
+            analysis: Optional analysis data (left unchanged when None)
+            agent_type: Agent logging the action (required with action_type)
+            action_type: Optional action to log alongside the update
+            payload: Action data
+
+        Returns:
+            Optional[str]: Action log UUID, or None if no action was logged
+        """
+        ...
+
     # ============================================
     # Agent Action Logging
     # ============================================
@@ -98,7 +190,8 @@ class DatabaseClientProtocol(Protocol):
         conversation_id: Optional[str],
         agent_type: str,
         action_type: str,
-        payload: Dict[str, Any]
+        payload: Dict[str, Any],
+        dedupe_key: Optional[str] = None
     ) -> str:
         """
         Log an agent action.
@@ -108,23 +201,27 @@ class DatabaseClientProtocol(Protocol):
             agent_type: Type of agent (ProductOwner, Developer)
             action_type: Type of action performed
             payload: Action data
+            dedupe_key: Optional idempotency key; repeats are ignored
 
         Returns:
-            str: Action log UUID
+            str: Action log UUID (for an ignored repeat, the existing one)
         """
         ...
 
     def get_agent_actions(
         self,
         conversation_id: str,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[Tuple[str, str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get agent actions for a conversation.
+        Get agent actions for a conversation, newest first.
 
         Args:
             conversation_id: Conversation UUID
             limit: Maximum number of actions to return
+            before: Optional (created_at, id) of the last action already
+                seen; returns the page after it
 
         Returns:
             List[Dict[str, Any]]: List of action records
@@ -191,6 +288,32 @@ class DatabaseClientProtocol(Protocol):
         """
         ...
 
+    # ============================================
+    # Webhook Deliveries
+    # ============================================
+
+    def claim_webhook_delivery(self, delivery_id: str, event_type: str) -> bool:
+        """
+        Record a webhook delivery, reporting whether it was new.
+
+        Args:
+            delivery_id: X-GitHub-Delivery header value
+            event_type: X-GitHub-Event header value
+
+        Returns:
+            bool: True if newly recorded, False if already seen
+        """
+        ...
+
+    def release_webhook_delivery(self, delivery_id: str) -> None:
+        """
+        Forget a claimed webhook delivery so a redelivery is processed.
+
+        Args:
+            delivery_id: X-GitHub-Delivery header value
+        """
+        ...
+
     # ============================================
     # Generic Query Operations
     # ============================================
@@ -198,17 +321,20 @@ class DatabaseClientProtocol(Protocol):
     def insert(
         self,
         table: str,
-        data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        chunk_size: int = 1000
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        Insert a record into a table.
+        Insert one record, or many records in bulk, into a table.
 
         Args:
             table: Table name
-            data: Data to insert
+            data: Record to insert, or a list of records
+            chunk_size: Maximum rows per request when inserting a list
 
         Returns:
-            Dict[str, Any]: Inserted record with generated fields
+            Union[Dict[str, Any], List[Dict[str, Any]]]: Inserted record,
+                or the list of inserted records
         """
         ...
 
@@ -236,16 +362,20 @@ class DatabaseClientProtocol(Protocol):
         table: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        columns: str = "*"
     ) -> List[Dict[str, Any]]:
         """
         Select records from a table.
 
         Args:
             table: Table name
-            filters: Optional filter conditions
+            filters: Optional filter conditions. Keys may carry an operator
+                suffix (col__in, col__gt, col__gte, col__lt, col__lte,
+                col__neq); "after_id" pages by id (keyset)
             limit: Optional result limit
-            order_by: Optional ordering column
+            order_by: Optional ordering column ("-" prefix for descending)
+            columns: Comma-separated columns to return (default: all)
 
         Returns:
             List[Dict[str, Any]]: List of matching records
@@ -147,6 +147,24 @@ class VCSClientProtocol(Protocol):
         """
         ...
 
+    def apply_triage(
+        self,
+        issue_number: int,
+        labels: List[str],
+        comment_body: str,
+        remove_labels: Optional[List[str]] = None
+    ) -> None:
+        """
+        Add labels, remove labels and post a comment in one operation.
+
+        Args:
+            issue_number: Issue number
+            labels: List of label names to add
+            comment_body: Comment text (Markdown supported)
+            remove_labels: Optional label names to remove
+        """
+        ...
+
     # ============================================
     # Pull Request Operations
     # ============================================
@@ -278,6 +296,9 @@ class VCSClientProtocol(Protocol):
 
         Returns:
             Optional[str]: File content or None if not found
+
+        Raises:
+            IsADirectoryError: If the path is a directory
         """
         ...
 
@@ -297,6 +318,26 @@ class VCSClientProtocol(Protocol):
         """
         ...
 
+    def list_directory(
+        self,
+        path: str = "",
+        branch: str = "main"
+    ) -> List[Dict[str, Any]]:
+        """
+        List the entries of a directory.
+
+        Args:
+            path: Directory path (empty for root)
+            branch: Branch name
+
+        Returns:
+            List[Dict[str, Any]]: Directory entries
+
+        Raises:
+            NotADirectoryError: If the path is a file
+        """
+        ...
+
     # ============================================
     # Repository Information
     # ============================================
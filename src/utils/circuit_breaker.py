@@ -0,0 +1,115 @@
+"""
+Circuit breaker for OSOrganicAI.
+
+This module provides a small thread-safe circuit breaker used to stop
+calling a degraded backend instead of piling retries onto it.
+
+Follows Single Responsibility Principle - only tracks backend health.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Tuple, Type
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    After `fail_max` consecutive failures the circuit opens and calls fail
+    fast with CircuitOpenError, without touching the backend. Once
+    `reset_timeout` seconds have passed, one trial call is let through
+    (half-open): success closes the circuit, failure re-opens it.
+
+    Only exceptions listed in `failure_exceptions` count as failures, so
+    client errors (bad input, constraint violations) don't trip it.
+
+    Example:
+        >>> breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0)
+        >>> breaker.call(fetch_rows, table="conversations")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 30.0,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Name used in log entries
+            fail_max: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to stay open before a trial call
+            failure_exceptions: Exception types that count as failures
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        with self._lock:
+            return self._is_open(time.monotonic())
+
+    def _is_open(self, now: float) -> bool:
+        """Check the open state (lock must be held)."""
+        return (
+            self._failures >= self.fail_max
+            and now - self._opened_at < self.reset_timeout
+        )
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function through the breaker.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: The function's return value
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._is_open(time.monotonic()):
+                raise CircuitOpenError(f"Circuit '{self.name}' is open")
+
+        try:
+            result = func(*args, **kwargs)
+        except self.failure_exceptions:
+            with self._lock:
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    self._opened_at = time.monotonic()
+                    logger.warning(
+                        "Circuit opened",
+                        circuit=self.name,
+                        failures=self._failures,
+                        reset_timeout=self.reset_timeout
+                    )
+            raise
+
+        with self._lock:
+            self._failures = 0
+
+        return result
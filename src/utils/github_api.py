@@ -12,7 +12,10 @@ Follows SOLID principles:
 - Dependency Inversion: Depends on GitHub abstraction
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
 from github import Github, GithubException
@@ -27,18 +30,42 @@ from src.interfaces.vcs_client import (
     PullRequestProtocol
 )
 from src.utils.logger import get_logger, log_api_call, RequestLogger
+from src.utils.rate_limiter import TokenBucket
 
 
 logger = get_logger(__name__)
 
+# How long a branch existence check stays valid (seconds)
+BRANCH_EXISTS_TTL = 30.0
+
+# Page size for paginated REST listings (GitHub maximum, default is 30)
+GITHUB_PER_PAGE = 100
+
+# Client-side request budget per hour (GitHub allows 5000, keep 10% headroom)
+DEFAULT_RATE_LIMIT = 4500
+
+
+@lru_cache(maxsize=None)
+def _shared_rate_limiter(token: str, rate_limit: int) -> TokenBucket:
+    """
+    Get the process-wide token bucket for a token.
+
+    GitHub's budget is per token, so every client using the same token
+    draws from one bucket instead of each assuming the full budget.
+    """
+    return TokenBucket(rate_per_hour=rate_limit)
+
 
 class GitHubIssueWrapper:
     """
     Wrapper for GitHub Issue to implement IssueProtocol.
 
     This adapter makes PyGithub's Issue compatible with our protocol.
+    Uses __slots__ since one wrapper is created per fetched issue.
     """
 
+    __slots__ = ("_issue",)
+
     def __init__(self, issue: Issue):
         self._issue = issue
 
@@ -72,8 +99,11 @@ class GitHubPullRequestWrapper:
     Wrapper for GitHub PullRequest to implement PullRequestProtocol.
 
     This adapter makes PyGithub's PullRequest compatible with our protocol.
+    Uses __slots__ since one wrapper is created per fetched PR.
     """
 
+    __slots__ = ("_pr",)
+
     def __init__(self, pr: PullRequest):
         self._pr = pr
 
@@ -115,13 +145,20 @@ class GitHubClient(VCSClientProtocol):
         repo_name: Full repository name (owner/repo)
     """
 
-    def __init__(self, token: str, repo_name: str):
+    def __init__(
+        self,
+        token: str,
+        repo_name: str,
+        rate_limit: int = DEFAULT_RATE_LIMIT
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub Personal Access Token
             repo_name: Full repository name (owner/repo)
+            rate_limit: Maximum API calls per hour issued with this token
+                (shared by all clients in the process using it)
 
         Example:
             >>> client = GitHubClient(
@@ -129,15 +166,79 @@ class GitHubClient(VCSClientProtocol):
             ...     repo_name="owner/repo"
             ... )
         """
-        self.client = Github(token)
+        self.client = Github(token, per_page=GITHUB_PER_PAGE)
         self.repo_name = repo_name
+        self._rate_limiter = _shared_rate_limiter(token, rate_limit)
+
+        self._rate_limiter.acquire()
         self.repo: Repository = self.client.get_repo(repo_name)
 
+        # branch name -> (exists, monotonic time of check)
+        self._branch_exists_cache: Dict[str, Tuple[bool, float]] = {}
+
+        # Branches created by this client where new files can be
+        # written without probing for an existing file first
+        self._fresh_branches: Set[str] = set()
+
         logger.info(
             "GitHub client initialized",
             repo_name=repo_name
         )
 
+    def _throttle(self, calls: int = 1) -> None:
+        """
+        Block until the rate limiter allows the given number of API calls.
+
+        Before taking tokens, the bucket is synced with the rate limit
+        headers PyGithub recorded on the last response, so the local
+        budget never exceeds what GitHub reports as remaining.
+
+        Args:
+            calls: Number of API calls about to be made
+        """
+        remaining, reset_at = self.current_rate_limit()
+        if remaining >= 0:
+            self._rate_limiter.sync(remaining=remaining, reset_at=reset_at)
+
+        self._rate_limiter.acquire(calls)
+
+    def current_rate_limit(self) -> Tuple[int, int]:
+        """
+        Get the rate limit budget reported on the last GitHub response.
+
+        Values come from the X-RateLimit-Remaining / X-RateLimit-Reset
+        headers that PyGithub records on every response, so no extra
+        request is made. Orchestrators can use this to reduce their
+        concurrency before the budget runs out.
+
+        Returns:
+            Tuple[int, int]: (remaining calls, reset time as Unix timestamp);
+                remaining is -1 before any response has been received
+        """
+        # Read the requester's recorded headers directly: Github's
+        # rate_limiting properties call get_rate_limit() (an extra,
+        # unthrottled request) until a response has been seen
+        requester = self.client.requester
+        remaining, _ = requester.rate_limiting
+        return remaining, requester.rate_limiting_resettime
+
+    def _log_api_call(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        status_code: Optional[int] = None
+    ) -> None:
+        """Log a GitHub API call together with the current rate limit budget."""
+        remaining, reset_at = self.current_rate_limit()
+        log_api_call(
+            service="github",
+            endpoint=endpoint,
+            method=method,
+            status_code=status_code,
+            rate_limit_remaining=remaining,
+            rate_limit_reset=reset_at
+        )
+
     # ============================================
     # Issue Operations
     # ============================================
@@ -156,10 +257,10 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If issue not found or API error
         """
         try:
+            self._throttle()
             issue = self.repo.get_issue(issue_number)
 
-            log_api_call(
-                service="github",
+            self._log_api_call(
                 endpoint=f"/repos/{self.repo_name}/issues/{issue_number}",
                 method="GET",
                 status_code=200
@@ -194,11 +295,11 @@ class GitHubClient(VCSClientProtocol):
         """
         with RequestLogger("create_issue_comment", issue_number=issue_number):
             try:
+                self._throttle(2)
                 issue = self.repo.get_issue(issue_number)
                 issue.create_comment(comment_body)
 
-                log_api_call(
-                    service="github",
+                self._log_api_call(
                     endpoint=f"/repos/{self.repo_name}/issues/{issue_number}/comments",
                     method="POST",
                     status_code=201
@@ -235,11 +336,11 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If adding labels fails
         """
         try:
+            self._throttle(2)
             issue = self.repo.get_issue(issue_number)
             issue.add_to_labels(*labels)
 
-            log_api_call(
-                service="github",
+            self._log_api_call(
                 endpoint=f"/repos/{self.repo_name}/issues/{issue_number}/labels",
                 method="POST",
                 status_code=200
@@ -277,6 +378,7 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If removing labels fails
         """
         try:
+            self._throttle(1 + len(labels))
             issue = self.repo.get_issue(issue_number)
 
             for label in labels:
@@ -305,6 +407,87 @@ class GitHubClient(VCSClientProtocol):
             )
             raise
 
+    def apply_triage(
+        self,
+        issue_number: int,
+        labels: List[str],
+        comment_body: str,
+        remove_labels: Optional[List[str]] = None
+    ) -> None:
+        """
+        Add labels, remove labels and post a comment on an issue concurrently.
+
+        The writes are independent of each other, so they are dispatched
+        in parallel and the triage costs roughly one round trip instead
+        of one per write.
+
+        Args:
+            issue_number: Issue number
+            labels: List of label names to add
+            comment_body: Comment text (Markdown supported)
+            remove_labels: Optional label names to remove; labels not on
+                the issue are skipped
+
+        Raises:
+            GithubException: If adding labels or commenting fails
+        """
+        remove_labels = remove_labels or []
+
+        with RequestLogger("apply_triage", issue_number=issue_number):
+            try:
+                self._throttle(3 + len(remove_labels))
+                issue = self.repo.get_issue(issue_number)
+
+                with ThreadPoolExecutor(max_workers=2 + len(remove_labels)) as executor:
+                    removal_futures = {
+                        label: executor.submit(issue.remove_from_labels, label)
+                        for label in remove_labels
+                    }
+                    labels_future = executor.submit(issue.add_to_labels, *labels)
+                    comment_future = executor.submit(issue.create_comment, comment_body)
+                    labels_future.result()
+                    comment_future.result()
+
+                    for label, future in removal_futures.items():
+                        try:
+                            future.result()
+                        except GithubException:
+                            # Label might not exist, continue
+                            logger.warning(
+                                "Label not found on issue",
+                                issue_number=issue_number,
+                                label=label
+                            )
+
+                self._log_api_call(
+                    endpoint=f"/repos/{self.repo_name}/issues/{issue_number}/labels",
+                    method="POST",
+                    status_code=200
+                )
+                self._log_api_call(
+                    endpoint=f"/repos/{self.repo_name}/issues/{issue_number}/comments",
+                    method="POST",
+                    status_code=201
+                )
+
+                logger.info(
+                    "Issue triaged",
+                    issue_number=issue_number,
+                    labels=labels,
+                    removed_labels=remove_labels
+                )
+
+            except GithubException as e:
+                logger.error(
+                    "Failed to triage issue",
+                    issue_number=issue_number,
+                    labels=labels,
+                    error=str(e),
+                    status_code=e.status,
+                    exc_info=True
+                )
+                raise
+
     # ============================================
     # Pull Request Operations
     # ============================================
@@ -333,6 +516,7 @@ class GitHubClient(VCSClientProtocol):
         """
         with RequestLogger("create_pull_request", head_branch=head_branch):
             try:
+                self._throttle()
                 pr = self.repo.create_pull(
                     title=title,
                     body=body,
@@ -340,8 +524,7 @@ class GitHubClient(VCSClientProtocol):
                     base=base_branch
                 )
 
-                log_api_call(
-                    service="github",
+                self._log_api_call(
                     endpoint=f"/repos/{self.repo_name}/pulls",
                     method="POST",
                     status_code=201
@@ -380,10 +563,10 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If PR not found
         """
         try:
+            self._throttle()
             pr = self.repo.get_pull(pr_number)
 
-            log_api_call(
-                service="github",
+            self._log_api_call(
                 endpoint=f"/repos/{self.repo_name}/pulls/{pr_number}",
                 method="GET",
                 status_code=200
@@ -416,11 +599,11 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If comment creation fails
         """
         try:
+            self._throttle(2)
             pr = self.repo.get_pull(pr_number)
             pr.create_issue_comment(comment_body)
 
-            log_api_call(
-                service="github",
+            self._log_api_call(
                 endpoint=f"/repos/{self.repo_name}/issues/{pr_number}/comments",
                 method="POST",
                 status_code=201
@@ -458,6 +641,7 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If linking fails
         """
         try:
+            self._throttle(2)
             pr = self.repo.get_pull(pr_number)
             current_body = pr.body or ""
 
@@ -503,6 +687,8 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If branch creation fails
         """
         try:
+            self._throttle(2)
+
             # Get the SHA of the base branch
             base_ref = self.repo.get_git_ref(f"heads/{from_branch}")
             base_sha = base_ref.object.sha
@@ -513,6 +699,9 @@ class GitHubClient(VCSClientProtocol):
                 sha=base_sha
             )
 
+            self._branch_exists_cache[branch_name] = (True, time.monotonic())
+            self._fresh_branches.add(branch_name)
+
             logger.info(
                 "Branch created",
                 branch_name=branch_name,
@@ -532,17 +721,32 @@ class GitHubClient(VCSClientProtocol):
         """
         Check if a branch exists.
 
+        Results are cached for BRANCH_EXISTS_TTL seconds so repeated
+        checks within the same agent run don't hit the API. Only definitive
+        answers (the ref was found, or a 404) are cached; other failures
+        report False for this call only.
+
         Args:
             branch_name: Branch name to check
 
         Returns:
             bool: True if branch exists
         """
+        cached = self._branch_exists_cache.get(branch_name)
+        if cached is not None and time.monotonic() - cached[1] < BRANCH_EXISTS_TTL:
+            return cached[0]
+
+        self._throttle()
         try:
             self.repo.get_git_ref(f"heads/{branch_name}")
-            return True
-        except GithubException:
-            return False
+            exists = True
+        except GithubException as e:
+            if e.status != 404:
+                return False
+            exists = False
+
+        self._branch_exists_cache[branch_name] = (exists, time.monotonic())
+        return exists
 
     # ============================================
     # File Operations
@@ -558,6 +762,11 @@ class GitHubClient(VCSClientProtocol):
         """
         Create or update a file in the repository.
 
+        On branches created by this client, the file is created directly
+        without first probing for an existing version. If GitHub rejects
+        the create because the file already exists (e.g. inherited from
+        the base branch), it falls back to the regular update path.
+
         Args:
             file_path: Path to the file
             content: File content
@@ -567,7 +776,30 @@ class GitHubClient(VCSClientProtocol):
         Raises:
             GithubException: If operation fails
         """
+        # Encode once; PyGithub only base64-encodes bytes input
+        content_bytes = content.encode("utf-8")
+
         try:
+            if branch in self._fresh_branches:
+                try:
+                    self._throttle()
+                    self.repo.create_file(
+                        path=file_path,
+                        message=commit_message,
+                        content=content_bytes,
+                        branch=branch
+                    )
+                    logger.info("File created", file_path=file_path, branch=branch)
+                    return
+
+                except GithubException as e:
+                    if e.status != 422:
+                        raise
+                    # File already exists on this branch, stop skipping the probe
+                    self._fresh_branches.discard(branch)
+
+            self._throttle(2)
+
             # Try to get existing file
             try:
                 existing_file = self.repo.get_contents(file_path, ref=branch)
@@ -575,7 +807,7 @@ class GitHubClient(VCSClientProtocol):
                 self.repo.update_file(
                     path=file_path,
                     message=commit_message,
-                    content=content,
+                    content=content_bytes,
                     sha=existing_file.sha,
                     branch=branch
                 )
@@ -587,7 +819,7 @@ class GitHubClient(VCSClientProtocol):
                     self.repo.create_file(
                         path=file_path,
                         message=commit_message,
-                        content=content,
+                        content=content_bytes,
                         branch=branch
                     )
                     logger.info("File created", file_path=file_path, branch=branch)
@@ -617,13 +849,18 @@ class GitHubClient(VCSClientProtocol):
 
         Returns:
             Optional[str]: File content or None if not found
+
+        Raises:
+            IsADirectoryError: If the path is a directory (use list_directory)
         """
         try:
+            self._throttle()
             content_file = self.repo.get_contents(file_path, ref=branch)
-            if isinstance(content_file, list):
-                # It's a directory
-                return None
-            return content_file.decoded_content.decode("utf-8")
+            try:
+                return content_file.decoded_content.decode("utf-8")
+            except AttributeError:
+                # get_contents returns a list for directories
+                raise IsADirectoryError(file_path) from None
 
         except GithubException as e:
             if e.status == 404:
@@ -654,6 +891,7 @@ class GitHubClient(VCSClientProtocol):
             GithubException: If deletion fails
         """
         try:
+            self._throttle(2)
             file = self.repo.get_contents(file_path, ref=branch)
             self.repo.delete_file(
                 path=file_path,
@@ -673,6 +911,52 @@ class GitHubClient(VCSClientProtocol):
             )
             raise
 
+    def list_directory(
+        self,
+        path: str = "",
+        branch: str = "main"
+    ) -> List[Dict[str, Any]]:
+        """
+        List the entries of a directory.
+
+        Args:
+            path: Directory path (empty for root)
+            branch: Branch name
+
+        Returns:
+            List[Dict[str, Any]]: Directory entries (name, path, type, size, sha)
+
+        Raises:
+            NotADirectoryError: If the path is a file (use get_file_content)
+            GithubException: If the listing fails
+        """
+        try:
+            self._throttle()
+            contents = self.repo.get_contents(path, ref=branch)
+
+            if not isinstance(contents, list):
+                raise NotADirectoryError(path)
+
+            return [
+                {
+                    "name": item.name,
+                    "path": item.path,
+                    "type": item.type,
+                    "size": item.size,
+                    "sha": item.sha
+                }
+                for item in contents
+            ]
+
+        except GithubException as e:
+            logger.error(
+                "Failed to list directory",
+                path=path,
+                error=str(e),
+                exc_info=True
+            )
+            raise
+
     # ============================================
     # Repository Information
     # ============================================
@@ -693,22 +977,22 @@ class GitHubClient(VCSClientProtocol):
             List[Dict[str, Any]]: List of files and directories
         """
         try:
+            self._throttle()
             contents = self.repo.get_contents(path, ref=branch)
 
             if not isinstance(contents, list):
                 contents = [contents]
 
-            structure = []
-            for item in contents:
-                structure.append({
+            return [
+                {
                     "name": item.name,
                     "path": item.path,
                     "type": item.type,
                     "size": item.size,
                     "sha": item.sha
-                })
-
-            return structure
+                }
+                for item in contents
+            ]
 
         except GithubException as e:
             logger.error(
@@ -720,13 +1004,18 @@ class GitHubClient(VCSClientProtocol):
             raise
 
 
-def create_github_client(token: str, repo_name: str) -> GitHubClient:
+def create_github_client(
+    token: str,
+    repo_name: str,
+    rate_limit: int = DEFAULT_RATE_LIMIT
+) -> GitHubClient:
     """
     Factory function to create a GitHub client.
 
     Args:
         token: GitHub Personal Access Token
         repo_name: Full repository name (owner/repo)
+        rate_limit: Maximum API calls per hour issued with this token
 
     Returns:
         GitHubClient: Configured client instance
@@ -737,7 +1026,7 @@ def create_github_client(token: str, repo_name: str) -> GitHubClient:
         ...     repo_name=settings.github_repo
         ... )
     """
-    return GitHubClient(token, repo_name)
+    return GitHubClient(token, repo_name, rate_limit=rate_limit)
 
 
 def create_github_client_from_settings(settings) -> GitHubClient:
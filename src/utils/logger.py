@@ -6,20 +6,47 @@ Follows Single Responsibility Principle - only handles logging configuration.
 """
 
 import logging
+import os
 import sys
+import time
 from typing import Any, Dict, Optional
-from datetime import datetime
+import orjson
 import structlog
 from pythonjsonlogger import jsonlogger
 
 
+# Minimum level set by configure_logging(); NOTSET (log everything)
+# until logging is configured, matching structlog's unconfigured default
+_MIN_LEVEL = logging.NOTSET
+
+# Interned level names so renderers hash the same string objects every time
+_LEVELS = {
+    lvl: sys.intern(lvl)
+    for lvl in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
     Custom JSON formatter with additional fields.
 
     Adds timestamp, level, and other metadata to every log entry.
+    Source location is attached to WARNING and above, or to every
+    record when `include_source` is set.
     """
 
+    def __init__(self, *args: Any, include_source: bool = False, **kwargs: Any):
+        """
+        Initialize formatter.
+
+        Args:
+            *args: Positional arguments for JsonFormatter
+            include_source: Attach source location to records of all levels
+            **kwargs: Keyword arguments for JsonFormatter
+        """
+        super().__init__(*args, **kwargs)
+        self.include_source = include_source
+
     def add_fields(
         self,
         log_record: Dict[str, Any],
@@ -29,21 +56,65 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         """Add custom fields to log record."""
         super().add_fields(log_record, record, message_dict)
 
-        # Add timestamp in ISO format
-        log_record["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        # Add timestamp in ISO format (from the record's creation time)
+        log_record["timestamp"] = (
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z"
+        )
+
+        # Add log level ("level" is not a LogRecord attribute, so the
+        # format string alone would leave it null)
+        log_record["level"] = _LEVELS.get(record.levelname, record.levelname)
+
+        # Add source location (file, line, function) where it is useful
+        if self.include_source or record.levelno >= logging.WARNING:
+            log_record["source"] = {
+                "file": record.pathname,
+                "line": record.lineno,
+                "function": record.funcName,
+            }
+
 
-        # Add log level
-        log_record["level"] = record.levelname
+class _FdWriter:
+    """
+    Minimal binary file object that writes straight to a file descriptor.
+
+    Used as the target for structlog's BytesLogger so JSON log lines skip
+    the TextIO layer and its per-record flush.
+    """
 
-        # Add logger name
-        log_record["logger"] = record.name
+    __slots__ = ("fd",)
 
-        # Add source location (file, line, function)
-        log_record["source"] = {
-            "file": record.pathname,
-            "line": record.lineno,
-            "function": record.funcName,
-        }
+    def __init__(self, fd: int):
+        self.fd = fd
+
+    def write(self, buf: bytes) -> None:
+        """Write the whole buffer, retrying on partial writes."""
+        view = memoryview(buf)
+        while view:
+            written = os.write(self.fd, view)
+            view = view[written:]
+
+    def flush(self) -> None:
+        """No-op: os.write is unbuffered."""
+
+
+def _binary_stdout() -> Optional[Any]:
+    """
+    Get a binary file object for stdout, for structlog's BytesLogger.
+
+    Writes to stdout's file descriptor when it has one. Streams without
+    one (pytest's capture, a replaced sys.stdout) fall back to their
+    underlying binary buffer, if any.
+
+    Returns:
+        Binary file object, or None if stdout is text-only (e.g. StringIO)
+    """
+    try:
+        return _FdWriter(sys.stdout.fileno())
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is both an OSError and a ValueError
+        return getattr(sys.stdout, "buffer", None)
 
 
 def configure_logging(
@@ -62,8 +133,11 @@ def configure_logging(
     Example:
         >>> configure_logging(log_level="DEBUG", log_format="json")
     """
+    global _MIN_LEVEL
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    _MIN_LEVEL = numeric_level
 
     # Clear any existing handlers
     root_logger = logging.getLogger()
@@ -76,7 +150,8 @@ def configure_logging(
     # Set formatter based on format type
     if log_format == "json":
         formatter = CustomJsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(message)s"
+            "%(timestamp)s %(level)s %(name)s %(message)s",
+            include_source=numeric_level <= logging.DEBUG
         )
     else:
         # Text format for development
@@ -90,23 +165,60 @@ def configure_logging(
     root_logger.setLevel(numeric_level)
 
     # Configure structlog
+    processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.dev.set_exc_info,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+
+    binary_stdout = _binary_stdout() if log_format == "json" else None
+    if binary_stdout is not None:
+        # orjson renders straight to bytes, which BytesLogger writes to
+        # stdout's file descriptor without going through print()
+        processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = structlog.BytesLoggerFactory(file=binary_stdout)
+    elif log_format == "json":
+        # Text-only stdout: print the orjson output as str
+        processors.append(structlog.processors.JSONRenderer(
+            serializer=lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode()
+        ))
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.processors.JSONRenderer() if log_format == "json"
-            else structlog.dev.ConsoleRenderer(),
-        ],
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def is_log_enabled(level: int) -> bool:
+    """
+    Check whether records at a level would be emitted.
+
+    Use it to skip building expensive log payloads that the configured
+    level would drop anyway. structlog's filtering loggers don't expose
+    the stdlib isEnabledFor(), so the threshold is tracked here.
+
+    Args:
+        level: Logging level constant (e.g. logging.DEBUG)
+
+    Returns:
+        bool: True if the level passes the configured threshold
+
+    Example:
+        >>> if is_log_enabled(logging.DEBUG):
+        ...     logger.debug("State dump", state=expensive_dump())
+    """
+    return level >= _MIN_LEVEL
+
+
 def get_logger(name: str, **context) -> structlog.BoundLogger:
     """
     Get a structured logger instance with optional context.
@@ -128,6 +240,18 @@ def get_logger(name: str, **context) -> structlog.BoundLogger:
     return logger
 
 
+# Level database operations are logged at (checked before building the event)
+LOG_DB_LEVEL = logging.INFO
+
+# Loggers for the convenience helpers below, created once at import.
+# structlog returns lazy proxies, so these pick up configure_logging()
+# settings on first use.
+_AGENT_LOGGER = structlog.get_logger("AgentAction")
+_API_LOGGER = structlog.get_logger("APICall")
+_DB_LOGGER = structlog.get_logger("DatabaseOperation")
+_REQUEST_LOGGER = structlog.get_logger("RequestLogger")
+
+
 class LoggerMixin:
     """
     Mixin class to add logging capabilities to any class.
@@ -164,43 +288,43 @@ def log_function_call(func):
         ...     return x + y
     """
     import functools
-    import time
+
+    logger = get_logger(func.__module__)
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-
-        # Log function entry
-        logger.debug(
-            "Function called",
-            function=func.__name__,
-            args=args if args else None,
-            kwargs=kwargs if kwargs else None
-        )
+        debug_enabled = is_log_enabled(logging.DEBUG)
+
+        # Log function entry (skip building the payload when DEBUG is off)
+        if debug_enabled:
+            logger.debug(
+                "Function called",
+                function=func.__name__,
+                args=args if args else None,
+                kwargs=kwargs if kwargs else None
+            )
 
         # Execute function and measure time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            elapsed_time = time.time() - start_time
 
             # Log successful completion
-            logger.debug(
-                "Function completed",
-                function=func.__name__,
-                elapsed_time_ms=round(elapsed_time * 1000, 2),
-                result_type=type(result).__name__
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Function completed",
+                    function=func.__name__,
+                    elapsed_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                    result_type=type(result).__name__
+                )
             return result
 
         except Exception as e:
-            elapsed_time = time.time() - start_time
-
             # Log error
             logger.error(
                 "Function failed",
                 function=func.__name__,
-                elapsed_time_ms=round(elapsed_time * 1000, 2),
+                elapsed_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
                 error_type=type(e).__name__,
                 error_message=str(e),
                 exc_info=True
@@ -217,12 +341,18 @@ class RequestLogger:
     Automatically logs request start, end, and duration.
     Useful for API endpoints and long-running operations.
 
+    Also usable as an async context manager in coroutines.
+
     Example:
         >>> with RequestLogger("github_api_call", issue_id=123):
         ...     # Your code here
         ...     pass
+        >>> async with RequestLogger("handle_new_issue", issue_number=42):
+        ...     await handle()
     """
 
+    __slots__ = ("operation", "context", "logger", "start_ns")
+
     def __init__(self, operation: str, **context):
         """
         Initialize request logger.
@@ -233,12 +363,12 @@ class RequestLogger:
         """
         self.operation = operation
         self.context = context
-        self.logger = get_logger("RequestLogger")
-        self.start_time = None
+        self.logger = _REQUEST_LOGGER
+        self.start_ns: Optional[int] = None
 
     def __enter__(self):
         """Log operation start."""
-        self.start_time = datetime.utcnow()
+        self.start_ns = time.perf_counter_ns()
         self.logger.info(
             "Operation started",
             operation=self.operation,
@@ -248,14 +378,14 @@ class RequestLogger:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log operation completion or failure."""
-        elapsed_time = (datetime.utcnow() - self.start_time).total_seconds()
+        elapsed_ms = (time.perf_counter_ns() - self.start_ns) // 1_000_000
 
         if exc_type is None:
             # Success
             self.logger.info(
                 "Operation completed",
                 operation=self.operation,
-                elapsed_time_ms=round(elapsed_time * 1000, 2),
+                elapsed_time_ms=elapsed_ms,
                 **self.context
             )
         else:
@@ -263,7 +393,7 @@ class RequestLogger:
             self.logger.error(
                 "Operation failed",
                 operation=self.operation,
-                elapsed_time_ms=round(elapsed_time * 1000, 2),
+                elapsed_time_ms=elapsed_ms,
                 error_type=exc_type.__name__,
                 error_message=str(exc_val),
                 **self.context,
@@ -273,6 +403,14 @@ class RequestLogger:
         # Don't suppress exceptions
         return False
 
+    async def __aenter__(self):
+        """Log operation start."""
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Log operation completion or failure."""
+        return self.__exit__(exc_type, exc_val, exc_tb)
+
 
 # Convenience functions for common log patterns
 def log_agent_action(
@@ -288,8 +426,7 @@ def log_agent_action(
         action: Action being performed
         **details: Additional action details
     """
-    logger = get_logger("AgentAction")
-    logger.info(
+    _AGENT_LOGGER.info(
         "Agent action",
         agent_name=agent_name,
         action=action,
@@ -314,8 +451,7 @@ def log_api_call(
         status_code: Response status code (if available)
         **details: Additional call details
     """
-    logger = get_logger("APICall")
-    logger.info(
+    _API_LOGGER.info(
         "API call",
         service=service,
         endpoint=endpoint,
@@ -338,8 +474,10 @@ def log_database_operation(
         table: Database table name
         **details: Additional operation details
     """
-    logger = get_logger("DatabaseOperation")
-    logger.info(
+    if not is_log_enabled(LOG_DB_LEVEL):
+        return
+
+    _DB_LOGGER.info(
         "Database operation",
         operation=operation,
         table=table,
@@ -0,0 +1,45 @@
+"""
+Module loading helpers for OSOrganicAI.
+
+This module provides a cheap way to resolve a class from a dotted module
+path on hot paths (health checks, agent factories) where the module is
+almost always imported already.
+
+Follows Single Responsibility Principle - only handles dynamic imports.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any
+
+
+def cached_import(module_path: str, attr: str) -> Any:
+    """
+    Get an attribute from a module, importing the module only if needed.
+
+    Already-imported modules are read straight from sys.modules, which
+    skips the import machinery (and its module lock) that a function-level
+    `from ... import ...` goes through on every call.
+
+    Args:
+        module_path: Dotted module path
+        attr: Attribute name to fetch from the module
+
+    Returns:
+        Any: The attribute
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+
+    Example:
+        >>> ProductOwnerAgent = cached_import(
+        ...     "src.agents.product_owner", "ProductOwnerAgent"
+        ... )
+    """
+    modules = sys.modules
+    module = modules.get(module_path)
+    if module is None:
+        import_module(module_path)
+        module = modules[module_path]
+    return getattr(module, attr)
@@ -0,0 +1,133 @@
+"""
+Client-side rate limiting for OSOrganicAI.
+
+This module provides a thread-safe token bucket used to throttle
+outbound API calls before they hit provider rate limits.
+
+Follows Single Responsibility Principle - only handles throttling.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate_per_hour / 3600` per second up to
+    `capacity`. Each API call consumes one token; when the bucket is empty,
+    `acquire()` blocks until enough tokens have refilled.
+
+    The bucket can be re-synchronized with the server's view of the
+    remaining budget via `sync()`, so the client never assumes it has
+    more calls left than the provider reports.
+
+    Example:
+        >>> bucket = TokenBucket(rate_per_hour=4500)
+        >>> bucket.acquire()
+        >>> # ... perform API call ...
+    """
+
+    def __init__(
+        self,
+        rate_per_hour: int,
+        capacity: Optional[int] = None
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_hour: Sustained number of calls allowed per hour
+            capacity: Maximum burst size (defaults to rate_per_hour)
+
+        Raises:
+            ValueError: If rate_per_hour is not positive
+        """
+        if rate_per_hour <= 0:
+            raise ValueError("rate_per_hour must be positive")
+
+        self.rate_per_hour = rate_per_hour
+        self.capacity = float(capacity if capacity is not None else rate_per_hour)
+        self._refill_per_second = rate_per_hour / 3600.0
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill (lock must be held)."""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity,
+                self._tokens + elapsed * self._refill_per_second
+            )
+            self._last_refill = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, blocking until available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                else:
+                    wait = (tokens - self._tokens) / self._refill_per_second
+
+            logger.debug(
+                "Rate limit reached, waiting",
+                wait_seconds=round(wait, 3)
+            )
+            time.sleep(wait)
+            waited += wait
+
+        return waited
+
+    def sync(self, remaining: int, reset_at: float) -> None:
+        """
+        Reconcile the bucket with the server-reported budget.
+
+        The local token count is clamped to what the server says is left.
+        If the server reports no calls remaining, the bucket blocks until
+        the reset time.
+
+        Args:
+            remaining: Calls remaining in the current window
+            reset_at: Unix timestamp when the window resets
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(max(remaining, 0)))
+
+            if remaining <= 0:
+                delay = max(reset_at - time.time(), 0.0)
+                self._blocked_until = time.monotonic() + delay
+
+    @property
+    def available(self) -> float:
+        """Get the number of tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
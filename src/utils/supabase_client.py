@@ -12,19 +12,222 @@ Follows SOLID principles:
 - Dependency Inversion: Depends on Supabase abstraction
 """
 
-from typing import Dict, Any, Optional, List
+import functools
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, Optional, List, Tuple, Union
 from datetime import datetime
-import json
 
+import httpx
+import orjson
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
+from postgrest.types import CountMethod, ReturnMethod
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.interfaces.database_client import DatabaseClientProtocol
+from src.utils.circuit_breaker import CircuitBreaker
 from src.utils.logger import get_logger, log_database_operation, RequestLogger
 
 
 logger = get_logger(__name__)
 
+# Write-behind buffer for agent actions: flush at this many rows...
+ACTION_BUFFER_SIZE = 100
+# ...or this many seconds after the first buffered row, whichever is first
+ACTION_FLUSH_INTERVAL = 0.5
+
+# In-process read cache for idempotent getters (entries, seconds)
+READ_CACHE_SIZE = 1024
+READ_CACHE_TTL = 5.0
+
+# Tables whose request builders are created once per client and reused
+_CACHED_TABLES = ("conversations", "agent_actions", "code_generations")
+
+# Unique key that makes agent action logging idempotent
+_ACTION_DEDUPE_COLUMNS = "conversation_id,action_type,dedupe_key"
+
+# Columns returned by default for list/overview reads. Wide columns
+# (action payloads, conversation metadata) are only fetched with full=True.
+ACTION_COLS = "id,conversation_id,agent_type,action_type,status,created_at"
+CONV_COLS = (
+    "id,issue_id,issue_number,repo_full_name,status,analysis,created_at,updated_at"
+)
+CODE_GEN_COLS = "id,conversation_id,pr_number,pr_url,status,created_at"
+
+# Select strings for a conversation with embedded actions, keyed by `full`
+_CONV_WITH_ACTIONS_SELECT = {
+    False: f"{CONV_COLS},agent_actions({ACTION_COLS})",
+    True: "*,agent_actions(*)",
+}
+
+# Filter key suffix -> PostgREST filter method used by select()
+_FILTER_OPS = {
+    "in": "in_",
+    "gt": "gt",
+    "gte": "gte",
+    "lt": "lt",
+    "lte": "lte",
+    "neq": "neq",
+}
+
+# Maximum rows per request for bulk insert()
+INSERT_CHUNK_SIZE = 1000
+
+# Transient-failure handling: retries per call, then a breaker that fails
+# fast for a while once the backend keeps failing
+DB_RETRY_ATTEMPTS = 3
+DB_BREAKER_FAIL_MAX = 5
+DB_BREAKER_RESET_TIMEOUT = 30.0
+
+# Connection pool for PostgREST requests (keep-alive + HTTP/2 multiplexing)
+_POSTGREST_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0
+)
+
+
+# orjson serializes datetime, date, UUID and dataclass values natively;
+# naive datetimes are treated as UTC. Callers can pass these as-is
+# without isoformat()/str() pre-conversion.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a payload to a JSON string with orjson."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+
+def _jsonable(obj: Any) -> Any:
+    """
+    Normalize a payload to plain JSON types.
+
+    PostgREST request bodies are encoded with the stdlib json module,
+    which rejects datetime/UUID/dataclass values; one orjson round trip
+    converts them.
+    """
+    return orjson.loads(orjson.dumps(obj, option=_ORJSON_OPTIONS))
+
+
+# Set OSO_JSON_TEXT_COLUMNS=1 for databases whose JSON columns are still text
+_JSON_TEXT_COLUMNS = os.getenv("OSO_JSON_TEXT_COLUMNS") == "1"
+
+
+def _json_column(obj: Any) -> Any:
+    """
+    Prepare a value for a JSON column.
+
+    JSONB columns take the object itself; pre-encoding it would store a
+    JSON string that the server has to parse twice.
+    """
+    return _dumps(obj) if _JSON_TEXT_COLUMNS else _jsonable(obj)
+
+
+def _retry_on(*exception_types) -> Callable:
+    """Build a tenacity retry decorator for the given exception types."""
+    return retry(
+        stop=stop_after_attempt(DB_RETRY_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=0.1, max=2.0),
+        retry=retry_if_exception_type(exception_types),
+        reraise=True,
+    )
+
+
+# Reads and idempotent writes: repeating them is safe after any
+# transport error, even one raised after the server did the work
+_retry_transient = _retry_on(httpx.TransportError)
+
+# Non-idempotent writes: only errors raised before the request reached
+# the server. A read timeout may arrive after Postgres committed, and
+# retrying it would write the rows twice.
+_retry_unsent = _retry_on(httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _resilient(func: Callable) -> Callable:
+    """
+    Retry transport errors with jittered backoff, behind the client's breaker.
+
+    Only for reads and idempotent writes; see _breaker_guarded.
+    Only connection-level failures (timeouts, resets) are retried or
+    counted by the breaker; APIError responses are real answers and pass
+    straight through. While the breaker is open, calls raise
+    CircuitOpenError without making an HTTP request.
+    """
+    retrying = _retry_transient(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._breaker.call(retrying, self, *args, **kwargs)
+
+    return wrapper
+
+
+def _breaker_guarded(func: Callable) -> Callable:
+    """
+    Run a method behind the client's breaker without retrying it whole.
+
+    For non-idempotent writes, which retry each request themselves with
+    _retry_unsent.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._breaker.call(func, self, *args, **kwargs)
+
+    return wrapper
+
+
+def _conversation_with_actions_query(
+    table,
+    issue_number: int,
+    repo_full_name: str,
+    limit: int,
+    full: bool,
+    code_generation_limit: int
+):
+    """
+    Build the embedded conversation + actions (+ code generations) query.
+
+    The caller executes it.
+    """
+    columns = _CONV_WITH_ACTIONS_SELECT[full]
+    if code_generation_limit:
+        columns += f",code_generations({'*' if full else CODE_GEN_COLS})"
+
+    query = (
+        table
+        .select(columns)
+        .eq("issue_number", issue_number)
+        .eq("repo_full_name", repo_full_name)
+        .order("created_at", desc=True, foreign_table="agent_actions")
+        .limit(limit, foreign_table="agent_actions")
+    )
+    if code_generation_limit:
+        query = (
+            query
+            .order("created_at", desc=True, foreign_table="code_generations")
+            .limit(code_generation_limit, foreign_table="code_generations")
+        )
+
+    return query.limit(1)
+
+
+def _loads_field(row: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """Decode a JSON column in place if it came back as a text blob."""
+    value = row.get(field)
+    if isinstance(value, (str, bytes)):
+        row[field] = orjson.loads(value)
+    return row
+
 
 class SupabaseClient(DatabaseClientProtocol):
     """
@@ -54,12 +257,155 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         self.url = url
         self.client: Client = create_client(url, key)
+        self._pool_postgrest_session()
+
+        # Request builders are stateless factories, so build them once
+        # (after the session swap, since they capture the session)
+        self._tables = {name: self.client.table(name) for name in _CACHED_TABLES}
+
+        # Buffered agent action logging (see log_agent_action_buffered)
+        self._action_buffer: List[Dict[str, Any]] = []
+        self._action_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Fail fast during Supabase brownouts (see _resilient)
+        self._breaker = CircuitBreaker(
+            name="supabase",
+            fail_max=DB_BREAKER_FAIL_MAX,
+            reset_timeout=DB_BREAKER_RESET_TIMEOUT,
+            failure_exceptions=(httpx.TransportError,)
+        )
+
+        # Short-lived LRU cache for repeated reads (see _cache_get)
+        self.disable_cache = False
+        self._read_cache: "OrderedDict[Tuple, Tuple[Any, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         logger.info(
             "Supabase client initialized",
             url=url
         )
 
+    def _pool_postgrest_session(self) -> None:
+        """
+        Swap PostgREST's default HTTP session for a pooled HTTP/2 one.
+
+        Keeps the base URL, auth headers and timeout of the session the
+        Supabase client created, so request builders behave the same.
+        """
+        session = self.client.postgrest.session
+        self.client.postgrest.session = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=session.timeout,
+            limits=_POSTGREST_LIMITS,
+            http2=True
+        )
+        session.close()
+
+    def _table(self, name: str):
+        """Get the request builder for a table, reusing cached ones."""
+        return self._tables.get(name) or self.client.table(name)
+
+    # ============================================
+    # Read Cache
+    # ============================================
+
+    def _cache_get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cached read that has not expired."""
+        if self.disable_cache:
+            return False, None
+
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is None:
+                return False, None
+
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._read_cache[key]
+                return False, None
+
+            self._read_cache.move_to_end(key)
+            return True, value
+
+    def _cache_put(self, key: Tuple, value: Any) -> None:
+        """Store a read result, evicting the least recently used entry."""
+        if self.disable_cache:
+            return
+
+        with self._cache_lock:
+            self._read_cache[key] = (value, time.monotonic() + READ_CACHE_TTL)
+            self._read_cache.move_to_end(key)
+            if len(self._read_cache) > READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+
+    def invalidate(self, table: str, key: Any = None) -> None:
+        """
+        Drop cached reads for a table.
+
+        Args:
+            table: Table whose cached reads should be dropped
+            key: Optional id or lookup value; when given, only entries
+                keyed on it (or whose cached row has that id) are dropped
+        """
+        with self._cache_lock:
+            for cache_key, (value, _) in list(self._read_cache.items()):
+                if cache_key[0] != table:
+                    continue
+                if (
+                    key is None
+                    or key in cache_key[1:]
+                    or (isinstance(value, dict) and value.get("id") == key)
+                ):
+                    del self._read_cache[cache_key]
+
+    # ============================================
+    # Write Helpers
+    # ============================================
+
+    def _action_write(self, data: Dict[str, Any], dedupe_key: Optional[str]):
+        """
+        Build the agent_actions write: plain insert, or idempotent upsert.
+
+        The upsert returns the row it inserted and nothing when the key
+        already existed, so a skipped write can be told apart.
+        """
+        table = self._table("agent_actions")
+
+        if dedupe_key is None:
+            return table.insert(data, returning=ReturnMethod.minimal)
+
+        data["dedupe_key"] = dedupe_key
+        return table.upsert(
+            data,
+            on_conflict=_ACTION_DEDUPE_COLUMNS,
+            ignore_duplicates=True,
+            returning=ReturnMethod.representation
+        )
+
+    def _existing_action_id(
+        self,
+        conversation_id: Optional[str],
+        action_type: str,
+        dedupe_key: str
+    ) -> Optional[str]:
+        """Look up the id of the action already logged under a dedupe key."""
+        query = self._table("agent_actions").select("id")
+        if conversation_id is None:
+            query = query.is_("conversation_id", "null")
+        else:
+            query = query.eq("conversation_id", conversation_id)
+
+        response = (
+            query
+            .eq("action_type", action_type)
+            .eq("dedupe_key", dedupe_key)
+            .limit(1)
+            .execute()
+        )
+        return response.data[0]["id"] if response.data else None
+
     # ============================================
     # Conversation Management
     # ============================================
@@ -86,7 +432,10 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         with RequestLogger("create_conversation", issue_number=issue_number):
             try:
+                # Id is generated client-side so the insert needs no response body
+                conversation_id = str(uuid.uuid4())
                 data = {
+                    "id": conversation_id,
                     "issue_id": issue_id,
                     "issue_number": issue_number,
                     "repo_full_name": repo_full_name,
@@ -94,12 +443,10 @@ class SupabaseClient(DatabaseClientProtocol):
                     "turns": [],
                 }
 
-                response = self.client.table("conversations").insert(data).execute()
-
-                if not response.data:
-                    raise Exception("Failed to create conversation: No data returned")
-
-                conversation_id = response.data[0]["id"]
+                self._table("conversations").insert(
+                    data, returning=ReturnMethod.minimal
+                ).execute()
+                self.invalidate("conversations", issue_number)
 
                 log_database_operation(
                     operation="insert",
@@ -118,6 +465,71 @@ class SupabaseClient(DatabaseClientProtocol):
                 )
                 raise
 
+    def create_conversation_with_analysis(
+        self,
+        issue_id: int,
+        issue_number: int,
+        repo_full_name: str,
+        status: str,
+        analysis: Dict[str, Any]
+    ) -> str:
+        """
+        Create a conversation together with its first analysis.
+
+        Calls the create_conversation_with_analysis SQL function, which
+        inserts the row or, if the issue already has a conversation,
+        updates its status and analysis. This replaces the separate
+        lookup, insert and update round trips of a new issue.
+
+        Args:
+            issue_id: GitHub issue ID
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            status: Conversation status
+            analysis: Analysis data (IssueAnalysis serialized)
+
+        Returns:
+            str: Conversation UUID
+
+        Raises:
+            APIError: If the call fails
+        """
+        with RequestLogger("create_conversation_with_analysis", issue_number=issue_number):
+            try:
+                response = self.client.rpc(
+                    "create_conversation_with_analysis",
+                    {
+                        "p_issue_id": issue_id,
+                        "p_issue_number": issue_number,
+                        "p_repo_full_name": repo_full_name,
+                        "p_status": status,
+                        "p_analysis": _jsonable(analysis),
+                    }
+                ).execute()
+
+                conversation_id = response.data
+                self.invalidate("conversations", issue_number)
+                self.invalidate("conversations", conversation_id)
+
+                log_database_operation(
+                    operation="rpc",
+                    table="conversations",
+                    conversation_id=conversation_id,
+                    status=status
+                )
+
+                return conversation_id
+
+            except APIError as e:
+                logger.error(
+                    "Failed to create conversation with analysis",
+                    error=str(e),
+                    issue_number=issue_number,
+                    exc_info=True
+                )
+                raise
+
+    @_resilient
     def get_conversation(
         self,
         issue_number: int,
@@ -133,39 +545,174 @@ class SupabaseClient(DatabaseClientProtocol):
         Returns:
             Optional[Dict[str, Any]]: Conversation data or None
         """
+        cache_key = ("conversations", issue_number, repo_full_name)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
+
         try:
-            response = (
-                self.client.table("conversations")
-                .select("*")
-                .eq("issue_number", issue_number)
-                .eq("repo_full_name", repo_full_name)
-                .execute()
+            response = self.client.rpc(
+                "get_conversation",
+                {"p_issue_number": issue_number, "p_repo": repo_full_name}
+            ).execute()
+
+            conversation = (
+                _loads_field(response.data[0], "analysis")
+                if response.data else None
+            )
+
+            log_database_operation(
+                operation="select",
+                table="conversations",
+                found=conversation is not None
+            )
+
+            self._cache_put(cache_key, conversation)
+            return conversation
+
+        except APIError as e:
+            logger.error(
+                "Failed to get conversation",
+                error=str(e),
+                issue_number=issue_number,
+                exc_info=True
             )
+            raise
+
+    def get_conversation_with_actions(
+        self,
+        issue_number: int,
+        repo_full_name: str,
+        limit: int = 100,
+        full: bool = False,
+        code_generation_limit: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a conversation together with its most recent agent actions.
+
+        Uses PostgREST resource embedding so the conversation and its
+        actions come back in a single round trip instead of two.
 
-            if response.data and len(response.data) > 0:
+        Args:
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            limit: Maximum number of actions to embed
+            full: Return every column, including action payloads; by
+                default only CONV_COLS and ACTION_COLS are fetched
+            code_generation_limit: Also embed this many most recent code
+                generations as "code_generations" (newest first)
+
+        Returns:
+            Optional[Dict[str, Any]]: Conversation data with an
+                "agent_actions" list (newest first), or None
+        """
+        try:
+            response = _conversation_with_actions_query(
+                self._table("conversations"),
+                issue_number,
+                repo_full_name,
+                limit,
+                full,
+                code_generation_limit
+            ).execute()
+
+            if response.data:
                 log_database_operation(
                     operation="select",
                     table="conversations",
+                    embedded="agent_actions",
                     found=True
                 )
-                return response.data[0]
+                conversation = _loads_field(response.data[0], "analysis")
+                conversation["agent_actions"] = conversation.get("agent_actions") or []
+                if code_generation_limit:
+                    conversation["code_generations"] = conversation.get("code_generations") or []
+                return conversation
 
             log_database_operation(
                 operation="select",
                 table="conversations",
+                embedded="agent_actions",
                 found=False
             )
             return None
 
         except APIError as e:
             logger.error(
-                "Failed to get conversation",
+                "Failed to get conversation with actions",
                 error=str(e),
                 issue_number=issue_number,
                 exc_info=True
             )
             raise
 
+    def prefetch_for_issue(
+        self,
+        issue_number: int,
+        repo_full_name: str,
+        action_limit: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load everything a webhook usually reads for an issue in one request.
+
+        Fetches the conversation with its recent agent actions embedded,
+        then seeds the read cache. The later get_conversation and
+        get_agent_actions calls in the same request are then served
+        locally. Code generations are not embedded: each row carries its
+        full files_changed payload, and the comment and label handlers
+        don't read them.
+
+        Args:
+            issue_number: GitHub issue number
+            repo_full_name: Full repo name (owner/repo)
+            action_limit: Number of recent actions to prefetch
+
+        Returns:
+            Optional[Dict[str, Any]]: Conversation data or None
+        """
+        try:
+            response = (
+                self._table("conversations")
+                .select("*,agent_actions(*)")
+                .eq("issue_number", issue_number)
+                .eq("repo_full_name", repo_full_name)
+                .order("created_at", desc=True, foreign_table="agent_actions")
+                .order("id", desc=True, foreign_table="agent_actions")
+                .limit(action_limit, foreign_table="agent_actions")
+                .limit(1)
+                .execute()
+            )
+        except APIError as e:
+            logger.error(
+                "Failed to prefetch issue state",
+                error=str(e),
+                issue_number=issue_number,
+                exc_info=True
+            )
+            raise
+
+        if not response.data:
+            self._cache_put(("conversations", issue_number, repo_full_name), None)
+            return None
+
+        row = response.data[0]
+        actions = row.pop("agent_actions", None) or []
+        conversation = _loads_field(row, "analysis")
+
+        self._cache_put(("conversations", issue_number, repo_full_name), conversation)
+        self._cache_put(
+            ("agent_actions", conversation["id"], action_limit, None),
+            actions
+        )
+
+        log_database_operation(
+            operation="prefetch",
+            table="conversations",
+            action_count=len(actions)
+        )
+
+        return conversation
+
     def update_conversation_status(
         self,
         conversation_id: str,
@@ -183,15 +730,22 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         try:
             response = (
-                self.client.table("conversations")
-                .update({"status": status})
+                self._table("conversations")
+                .update(
+                    {"status": status},
+                    count=CountMethod.exact,
+                    returning=ReturnMethod.minimal
+                )
                 .eq("id", conversation_id)
                 .execute()
             )
 
-            if not response.data:
+            # Minimal return: check the affected-row count instead of the body
+            if not response.count:
                 raise Exception("Failed to update conversation status")
 
+            self.invalidate("conversations", conversation_id)
+
             log_database_operation(
                 operation="update",
                 table="conversations",
@@ -225,15 +779,21 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         try:
             response = (
-                self.client.table("conversations")
-                .update({"analysis": json.dumps(analysis)})
+                self._table("conversations")
+                .update(
+                    {"analysis": _json_column(analysis)},
+                    count=CountMethod.exact,
+                    returning=ReturnMethod.minimal
+                )
                 .eq("id", conversation_id)
                 .execute()
             )
 
-            if not response.data:
+            if not response.count:
                 raise Exception("Failed to update conversation analysis")
 
+            self.invalidate("conversations", conversation_id)
+
             log_database_operation(
                 operation="update",
                 table="conversations",
@@ -250,6 +810,72 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    def update_conversation_with_action(
+        self,
+        conversation_id: str,
+        status: str,
+        analysis: Optional[Dict[str, Any]] = None,
+        agent_type: Optional[str] = None,
+        action_type: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Update conversation status/analysis and log an action in one transaction.
+
+        Calls the update_conversation_with_action SQL function, so what
+        used to be several round trips (status, analysis, action) is one
+        atomic request.
+
+        Args:
+            conversation_id: Conversation UUID
+            status: New status
+            analysis: Optional analysis data (left unchanged when None)
+            agent_type: Agent logging the action (required with action_type)
+            action_type: Optional action to log alongside the update
+            payload: Action data
+
+        Returns:
+            Optional[str]: Action log UUID, or None if no action was logged
+
+        Raises:
+            APIError: If the conversation does not exist or the call fails
+        """
+        try:
+            response = self.client.rpc(
+                "update_conversation_with_action",
+                {
+                    "p_conversation_id": conversation_id,
+                    "p_status": status,
+                    "p_analysis": _jsonable(analysis),
+                    "p_agent_type": agent_type,
+                    "p_action_type": action_type,
+                    "p_payload": _jsonable(payload or {}),
+                }
+            ).execute()
+
+            self.invalidate("conversations", conversation_id)
+            if action_type:
+                self.invalidate("agent_actions", conversation_id)
+
+            log_database_operation(
+                operation="rpc",
+                table="conversations",
+                conversation_id=conversation_id,
+                status=status,
+                action_type=action_type
+            )
+
+            return response.data
+
+        except APIError as e:
+            logger.error(
+                "Failed to update conversation with action",
+                error=str(e),
+                conversation_id=conversation_id,
+                exc_info=True
+            )
+            raise
+
     # ============================================
     # Agent Action Logging
     # ============================================
@@ -259,7 +885,8 @@ class SupabaseClient(DatabaseClientProtocol):
         conversation_id: Optional[str],
         agent_type: str,
         action_type: str,
-        payload: Dict[str, Any]
+        payload: Dict[str, Any],
+        dedupe_key: Optional[str] = None
     ) -> str:
         """
         Log an agent action.
@@ -269,28 +896,44 @@ class SupabaseClient(DatabaseClientProtocol):
             agent_type: Type of agent
             action_type: Type of action performed
             payload: Action data
+            dedupe_key: Optional idempotency key (e.g. webhook delivery id);
+                a repeat of the same conversation, action type and key is
+                ignored instead of inserted again
 
         Returns:
-            str: Action log UUID
+            str: Action log UUID; for an ignored repeat, the id of the
+                action already logged under the key
 
         Raises:
             Exception: If logging fails
         """
         try:
+            action_id = str(uuid.uuid4())
             data = {
+                "id": action_id,
                 "conversation_id": conversation_id,
                 "agent_type": agent_type,
                 "action_type": action_type,
-                "payload": json.dumps(payload),
+                "payload": _json_column(payload),
                 "status": "success",
             }
 
-            response = self.client.table("agent_actions").insert(data).execute()
+            response = self._action_write(data, dedupe_key).execute()
 
-            if not response.data:
-                raise Exception("Failed to log agent action")
+            if dedupe_key is not None and not response.data:
+                # Already logged under this key: report the existing row
+                existing_id = self._existing_action_id(
+                    conversation_id, action_type, dedupe_key
+                )
+                logger.debug(
+                    "Duplicate agent action skipped",
+                    action_id=existing_id,
+                    agent_type=agent_type,
+                    action_type=action_type
+                )
+                return existing_id
 
-            action_id = response.data[0]["id"]
+            self.invalidate("agent_actions", conversation_id)
 
             logger.debug(
                 "Agent action logged",
@@ -311,32 +954,147 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    def log_agent_action_buffered(
+        self,
+        conversation_id: Optional[str],
+        agent_type: str,
+        action_type: str,
+        payload: Dict[str, Any]
+    ) -> str:
+        """
+        Queue an agent action for a bulk insert.
+
+        The id is generated client-side and returned immediately. Rows are
+        written in a single insert once ACTION_BUFFER_SIZE rows are queued
+        or ACTION_FLUSH_INTERVAL seconds have passed. Use log_agent_action
+        when a server-acknowledged write is required, and call flush()
+        before shutdown.
+
+        Args:
+            conversation_id: Optional conversation UUID
+            agent_type: Type of agent
+            action_type: Type of action performed
+            payload: Action data
+
+        Returns:
+            str: Action log UUID (assigned client-side)
+        """
+        action_id = str(uuid.uuid4())
+        data = {
+            "id": action_id,
+            "conversation_id": conversation_id,
+            "agent_type": agent_type,
+            "action_type": action_type,
+            "payload": _json_column(payload),
+            "status": "success",
+        }
+
+        with self._action_lock:
+            self._action_buffer.append(data)
+            should_flush = len(self._action_buffer) >= ACTION_BUFFER_SIZE
+
+            if not should_flush and self._flush_timer is None:
+                self._flush_timer = threading.Timer(ACTION_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if should_flush:
+            self.flush()
+
+        return action_id
+
+    def flush(self) -> int:
+        """
+        Write all buffered agent actions in a single bulk insert.
+
+        Returns:
+            int: Number of actions written
+
+        Raises:
+            APIError: If the bulk insert fails (rows are re-queued)
+        """
+        with self._action_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch, self._action_buffer = self._action_buffer, []
+
+        if not batch:
+            return 0
+
+        try:
+            self._table("agent_actions").insert(batch).execute()
+            self.invalidate("agent_actions")
+
+            log_database_operation(
+                operation="bulk_insert",
+                table="agent_actions",
+                row_count=len(batch)
+            )
+
+            return len(batch)
+
+        except APIError as e:
+            logger.error(
+                "Failed to flush agent actions",
+                error=str(e),
+                row_count=len(batch),
+                exc_info=True
+            )
+            # Put the rows back so a later flush can retry them
+            with self._action_lock:
+                self._action_buffer[:0] = batch
+            raise
+
     def get_agent_actions(
         self,
         conversation_id: str,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[Tuple[str, str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get agent actions for a conversation.
+        Get agent actions for a conversation, newest first.
+
+        Pages with a keyset on (created_at, id) rather than an offset, so
+        later pages don't re-scan the rows already returned.
 
         Args:
             conversation_id: Conversation UUID
             limit: Maximum number of actions to return
+            before: Optional (created_at, id) of the last action already
+                seen; returns the page after it
 
         Returns:
             List[Dict[str, Any]]: List of action records
+
+        Example:
+            >>> page = client.get_agent_actions(conv_id, limit=50)
+            >>> last = page[-1]
+            >>> next_page = client.get_agent_actions(
+            ...     conv_id, limit=50, before=(last["created_at"], last["id"])
+            ... )
         """
+        cache_key = ("agent_actions", conversation_id, limit, before)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
+
+        before_created_at, before_id = before or (None, None)
+
         try:
-            response = (
-                self.client.table("agent_actions")
-                .select("*")
-                .eq("conversation_id", conversation_id)
-                .order("created_at", desc=True)
-                .limit(limit)
-                .execute()
-            )
+            response = self.client.rpc(
+                "get_agent_actions",
+                {
+                    "p_conversation_id": conversation_id,
+                    "p_limit": limit,
+                    "p_before_created_at": before_created_at,
+                    "p_before_id": before_id,
+                }
+            ).execute()
 
-            return response.data or []
+            actions = response.data or []
+            self._cache_put(cache_key, actions)
+            return actions
 
         except APIError as e:
             logger.error(
@@ -347,6 +1105,68 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    def iter_agent_actions(
+        self,
+        conversation_id: str,
+        chunk: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all agent actions for a conversation, newest first.
+
+        Rows are fetched in keyset-paginated chunks, and the next chunk is
+        requested in the background while the caller consumes the current
+        one, so server round trips overlap with client processing. Pages
+        bypass the read cache.
+
+        Args:
+            conversation_id: Conversation UUID
+            chunk: Number of rows per request
+
+        Yields:
+            Dict[str, Any]: Action records
+
+        Example:
+            >>> for action in client.iter_agent_actions(conv_id):
+            ...     print(action["action_type"])
+        """
+        def fetch(before: Optional[Tuple[str, str]]) -> List[Dict[str, Any]]:
+            before_created_at, before_id = before or (None, None)
+            response = self.client.rpc(
+                "get_agent_actions",
+                {
+                    "p_conversation_id": conversation_id,
+                    "p_limit": chunk,
+                    "p_before_created_at": before_created_at,
+                    "p_before_id": before_id,
+                }
+            ).execute()
+            return response.data or []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(fetch, None)
+
+            while True:
+                try:
+                    rows = pending.result()
+                except APIError as e:
+                    logger.error(
+                        "Failed to iterate agent actions",
+                        error=str(e),
+                        conversation_id=conversation_id,
+                        exc_info=True
+                    )
+                    raise
+
+                # A short chunk is the last one
+                if len(rows) == chunk:
+                    last = rows[-1]
+                    pending = executor.submit(fetch, (last["created_at"], last["id"]))
+
+                yield from rows
+
+                if len(rows) < chunk:
+                    return
+
     # ============================================
     # Code Generation Tracking
     # ============================================
@@ -377,20 +1197,19 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         with RequestLogger("create_code_generation", conversation_id=conversation_id):
             try:
+                generation_id = str(uuid.uuid4())
                 data = {
+                    "id": generation_id,
                     "conversation_id": conversation_id,
                     "pr_number": pr_number,
-                    "files_changed": json.dumps(files_changed),
-                    "tests_generated": json.dumps(tests_generated),
+                    "files_changed": _json_column(files_changed),
+                    "tests_generated": _json_column(tests_generated),
                     "status": status,
                 }
 
-                response = self.client.table("code_generations").insert(data).execute()
-
-                if not response.data:
-                    raise Exception("Failed to create code generation record")
-
-                generation_id = response.data[0]["id"]
+                self._table("code_generations").insert(
+                    data, returning=ReturnMethod.minimal
+                ).execute()
 
                 log_database_operation(
                     operation="insert",
@@ -438,15 +1257,21 @@ class SupabaseClient(DatabaseClientProtocol):
                 update_data["error_message"] = error_message
 
             response = (
-                self.client.table("code_generations")
-                .update(update_data)
+                self._table("code_generations")
+                .update(
+                    update_data,
+                    count=CountMethod.exact,
+                    returning=ReturnMethod.minimal
+                )
                 .eq("id", generation_id)
                 .execute()
             )
 
-            if not response.data:
+            if not response.count:
                 raise Exception("Failed to update code generation status")
 
+            self.invalidate("code_generations", generation_id)
+
             log_database_operation(
                 operation="update",
                 table="code_generations",
@@ -476,18 +1301,20 @@ class SupabaseClient(DatabaseClientProtocol):
         Returns:
             Optional[Dict[str, Any]]: Generation data or None
         """
-        try:
-            response = (
-                self.client.table("code_generations")
-                .select("*")
-                .eq("id", generation_id)
-                .execute()
-            )
+        cache_key = ("code_generations", generation_id)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
 
-            if response.data and len(response.data) > 0:
-                return response.data[0]
+        try:
+            response = self.client.rpc(
+                "get_code_generation",
+                {"p_generation_id": generation_id}
+            ).execute()
 
-            return None
+            generation = response.data[0] if response.data else None
+            self._cache_put(cache_key, generation)
+            return generation
 
         except APIError as e:
             logger.error(
@@ -498,37 +1325,150 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    # ============================================
+    # Webhook Deliveries
+    # ============================================
+
+    def claim_webhook_delivery(self, delivery_id: str, event_type: str) -> bool:
+        """
+        Record a webhook delivery, reporting whether it was new.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING on the delivery ID, so
+        concurrent instances receiving the same redelivery agree on a
+        single winner.
+
+        Args:
+            delivery_id: X-GitHub-Delivery header value
+            event_type: X-GitHub-Event header value
+
+        Returns:
+            bool: True if this call recorded the delivery, False if it
+                had already been seen
+
+        Example:
+            >>> if not client.claim_webhook_delivery(delivery_id, "issues"):
+            ...     return  # duplicate
+        """
+        try:
+            response = self._table("webhook_deliveries").upsert(
+                {"delivery_id": delivery_id, "event_type": event_type},
+                on_conflict="delivery_id",
+                ignore_duplicates=True,
+                returning=ReturnMethod.representation
+            ).execute()
+
+            claimed = bool(response.data)
+
+            log_database_operation(
+                operation="claim",
+                table="webhook_deliveries",
+                claimed=claimed
+            )
+
+            return claimed
+
+        except APIError as e:
+            logger.error(
+                "Failed to claim webhook delivery",
+                error=str(e),
+                delivery_id=delivery_id,
+                exc_info=True
+            )
+            raise
+
+    def release_webhook_delivery(self, delivery_id: str) -> None:
+        """
+        Delete a claimed webhook delivery so a redelivery is processed.
+
+        Called when processing a claimed delivery fails; otherwise a
+        manual redelivery from GitHub would be dropped as a duplicate.
+
+        Args:
+            delivery_id: X-GitHub-Delivery header value
+        """
+        try:
+            (
+                self._table("webhook_deliveries")
+                .delete(returning=ReturnMethod.minimal)
+                .eq("delivery_id", delivery_id)
+                .execute()
+            )
+
+            log_database_operation(
+                operation="release",
+                table="webhook_deliveries"
+            )
+
+        except APIError as e:
+            logger.error(
+                "Failed to release webhook delivery",
+                error=str(e),
+                delivery_id=delivery_id,
+                exc_info=True
+            )
+            raise
+
     # ============================================
     # Generic Query Operations
     # ============================================
 
+    @_breaker_guarded
     def insert(
         self,
         table: str,
-        data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        chunk_size: int = INSERT_CHUNK_SIZE
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        Insert a record into a table.
+        Insert one record, or many records in bulk, into a table.
+
+        A list is sent as a single multi-row INSERT per `chunk_size` rows
+        instead of one request per row. Inserts are not idempotent, so
+        each request is retried only if it never reached the server, and
+        a failed chunk never re-sends the chunks before it.
 
         Args:
             table: Table name
-            data: Data to insert
+            data: Record to insert, or a list of records
+            chunk_size: Maximum rows per request when inserting a list
 
         Returns:
-            Dict[str, Any]: Inserted record with generated fields
+            Union[Dict[str, Any], List[Dict[str, Any]]]: Inserted record
+                for a single dict, or the list of inserted records
 
         Raises:
             Exception: If insert fails
+
+        Example:
+            >>> rows = client.insert("agent_actions", actions, chunk_size=500)
         """
         try:
-            response = self.client.table(table).insert(data).execute()
+            if isinstance(data, dict):
+                response = _retry_unsent(self._table(table).insert(data).execute)()
 
-            if not response.data:
-                raise Exception(f"Failed to insert into {table}")
+                if not response.data:
+                    raise Exception(f"Failed to insert into {table}")
 
-            log_database_operation(operation="insert", table=table)
+                self.invalidate(table)
+                log_database_operation(operation="insert", table=table)
 
-            return response.data[0]
+                return response.data[0]
+
+            inserted: List[Dict[str, Any]] = []
+            for start in range(0, len(data), chunk_size):
+                request = self._table(table).insert(data[start:start + chunk_size])
+                response = _retry_unsent(request.execute)()
+                inserted.extend(response.data or [])
+
+            if data:
+                self.invalidate(table)
+            log_database_operation(
+                operation="bulk_insert",
+                table=table,
+                row_count=len(inserted)
+            )
+
+            return inserted
 
         except APIError as e:
             logger.error(
@@ -539,6 +1479,7 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    @_resilient
     def update(
         self,
         table: str,
@@ -561,7 +1502,7 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         try:
             response = (
-                self.client.table(table)
+                self._table(table)
                 .update(data)
                 .eq("id", record_id)
                 .execute()
@@ -570,6 +1511,7 @@ class SupabaseClient(DatabaseClientProtocol):
             if not response.data:
                 raise Exception(f"Failed to update {table}")
 
+            self.invalidate(table, record_id)
             log_database_operation(operation="update", table=table)
 
             return response.data[0]
@@ -584,41 +1526,71 @@ class SupabaseClient(DatabaseClientProtocol):
             )
             raise
 
+    @_resilient
     def select(
         self,
         table: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        columns: str = "*"
     ) -> List[Dict[str, Any]]:
         """
         Select records from a table.
 
+        Filters are applied server-side. A plain key is an equality
+        match; a suffixed key maps to the PostgREST operator of the same
+        name (col__in, col__gt, col__gte, col__lt, col__lte, col__neq).
+        The special key "after_id" pages by id (keyset pagination) and
+        orders by id when no other ordering is given.
+
         Args:
             table: Table name
             filters: Optional filter conditions
             limit: Optional result limit
-            order_by: Optional ordering column
+            order_by: Optional ordering column ("-" prefix for descending)
+            columns: Comma-separated columns to return (default: all)
 
         Returns:
             List[Dict[str, Any]]: List of matching records
 
         Raises:
+            ValueError: If a filter uses an unknown operator suffix
             Exception: If select fails
+
+        Example:
+            >>> client.select(
+            ...     "code_generations",
+            ...     filters={"status__in": ["pending", "failed"], "after_id": last_id},
+            ...     limit=50
+            ... )
         """
         try:
-            query = self.client.table(table).select("*")
+            query = self._table(table).select(columns)
+            after_id = None
 
             # Apply filters
-            if filters:
-                for key, value in filters.items():
+            for key, value in (filters or {}).items():
+                if key == "after_id":
+                    after_id = value
+                    query = query.gt("id", value)
+                    continue
+
+                column, _, op = key.rpartition("__")
+                if not column or op not in _FILTER_OPS:
+                    if "__" in key:
+                        raise ValueError(f"Unsupported filter operator in '{key}'")
                     query = query.eq(key, value)
+                else:
+                    query = getattr(query, _FILTER_OPS[op])(column, value)
 
             # Apply ordering
             if order_by:
                 desc = order_by.startswith("-")
                 column = order_by.lstrip("-")
                 query = query.order(column, desc=desc)
+            elif after_id is not None:
+                query = query.order("id")
 
             # Apply limit
             if limit:
@@ -660,12 +1632,13 @@ class SupabaseClient(DatabaseClientProtocol):
         """
         try:
             response = (
-                self.client.table(table)
+                self._table(table)
                 .delete()
                 .eq("id", record_id)
                 .execute()
             )
 
+            self.invalidate(table, record_id)
             log_database_operation(operation="delete", table=table)
 
         except APIError as e:
@@ -679,10 +1652,15 @@ class SupabaseClient(DatabaseClientProtocol):
             raise
 
 
+@functools.lru_cache(maxsize=None)
 def create_supabase_client(url: str, key: str) -> SupabaseClient:
     """
     Factory function to create a Supabase client.
 
+    Clients are cached per (url, key), so the whole process shares one
+    instance and its pooled connections. Callers must not mutate the
+    returned client.
+
     Args:
         url: Supabase project URL
         key: Supabase API key
@@ -718,3 +1696,4 @@ def create_supabase_client_from_settings(settings) -> SupabaseClient:
         url=settings.supabase_url,
         key=settings.supabase_service_role_key
     )
+
@@ -7,7 +7,8 @@ to pull request generation.
 Follows Single Responsibility Principle - only orchestrates workflows.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Any, Callable, Dict, Optional, TypeVar
 from datetime import datetime
 
 from src.agents.product_owner import ProductOwnerAgent
@@ -19,6 +20,11 @@ from src.models.code_generation import CodeGenerationResult
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Maximum agent calls (LLM + GitHub + Supabase round trips) in flight at once
+MAX_CONCURRENT_AGENT_CALLS = 8
+
 
 class IssueWorkflowOrchestrator:
     """
@@ -27,6 +33,11 @@ class IssueWorkflowOrchestrator:
     This class coordinates between Product Owner and Developer agents
     to handle the full lifecycle of an issue.
 
+    Handlers are coroutines, so one event loop can serve many webhook
+    deliveries while LLM and API calls are pending. Agent methods are
+    blocking; they run in worker threads, with at most
+    `max_concurrency` in flight at once.
+
     Attributes:
         po_agent: Product Owner Agent instance
         dev_agent: Developer Agent instance
@@ -35,7 +46,8 @@ class IssueWorkflowOrchestrator:
     def __init__(
         self,
         po_agent: ProductOwnerAgent,
-        dev_agent: DeveloperAgent
+        dev_agent: DeveloperAgent,
+        max_concurrency: int = MAX_CONCURRENT_AGENT_CALLS
     ):
         """
         Initialize workflow orchestrator.
@@ -43,13 +55,33 @@ class IssueWorkflowOrchestrator:
         Args:
             po_agent: Product Owner Agent instance
             dev_agent: Developer Agent instance
+            max_concurrency: Maximum concurrent agent calls
         """
         self.po_agent = po_agent
         self.dev_agent = dev_agent
+        self._agent_slots = asyncio.Semaphore(max_concurrency)
+
+        logger.info(
+            "Workflow orchestrator initialized",
+            max_concurrency=max_concurrency
+        )
 
-        logger.info("Workflow orchestrator initialized")
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking agent or client call off the event loop.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            T: The callable's return value
+        """
+        async with self._agent_slots:
+            return await asyncio.to_thread(func, *args, **kwargs)
 
-    def handle_new_issue(
+    async def handle_new_issue(
         self,
         issue_number: int,
         issue_id: int,
@@ -73,7 +105,7 @@ class IssueWorkflowOrchestrator:
             ConversationState: Current conversation state
 
         Example:
-            >>> state = orchestrator.handle_new_issue(
+            >>> state = await orchestrator.handle_new_issue(
             ...     issue_number=42,
             ...     issue_id=123456,
             ...     issue_title="Add cart",
@@ -81,15 +113,17 @@ class IssueWorkflowOrchestrator:
             ...     repo_full_name="org/repo"
             ... )
         """
-        with RequestLogger("handle_new_issue", issue_number=issue_number):
+        async with RequestLogger("handle_new_issue", issue_number=issue_number):
             logger.info(
                 "Handling new issue",
                 issue_number=issue_number,
                 repo=repo_full_name
             )
 
-            # Delegate to Product Owner Agent
-            state = self.po_agent.handle_issue_workflow(
+            # Delegate to Product Owner Agent: one LLM call, then the
+            # conversation write and the GitHub comment/labels together
+            state = await self._run(
+                self.po_agent.handle_issue_workflow,
                 issue_number=issue_number,
                 issue_id=issue_id,
                 issue_title=issue_title,
@@ -105,7 +139,7 @@ class IssueWorkflowOrchestrator:
 
             return state
 
-    def handle_issue_comment(
+    async def handle_issue_comment(
         self,
         issue_number: int,
         comment_body: str,
@@ -126,20 +160,21 @@ class IssueWorkflowOrchestrator:
             Optional[ConversationState]: Updated state or None if not handled
 
         Example:
-            >>> state = orchestrator.handle_issue_comment(
+            >>> state = await orchestrator.handle_issue_comment(
             ...     issue_number=42,
             ...     comment_body="Stripe and PayPal",
             ...     repo_full_name="org/repo"
             ... )
         """
-        with RequestLogger("handle_issue_comment", issue_number=issue_number):
+        async with RequestLogger("handle_issue_comment", issue_number=issue_number):
             logger.info(
                 "Handling issue comment",
                 issue_number=issue_number
             )
 
-            # Get conversation from database
-            conversation = self.po_agent.db_client.get_conversation(
+            # Get conversation, prefetching the state the agent reads next
+            conversation = await self._run(
+                self.po_agent.db_client.prefetch_for_issue,
                 issue_number=issue_number,
                 repo_full_name=repo_full_name
             )
@@ -151,66 +186,101 @@ class IssueWorkflowOrchestrator:
                 )
                 return None
 
+            conversation_id = conversation["id"]
+            current_status = conversation["status"]
+
             # Only process if needs clarification
-            if conversation["status"] != "needs_clarification":
+            if current_status != "needs_clarification":
                 logger.info(
                     "Issue not in needs_clarification status, skipping",
                     issue_number=issue_number,
-                    current_status=conversation["status"]
+                    current_status=current_status
                 )
                 return None
 
-            # Process user response
-            analysis = self.po_agent.process_user_response(
-                conversation_id=conversation["id"],
-                user_responses=[comment_body]
+            # Process user response (its action is logged with the state update)
+            analysis = await self._run(
+                self.po_agent.process_user_response,
+                conversation_id=conversation_id,
+                user_responses=[comment_body],
+                log_result=False
             )
-
-            # Update conversation
-            self.po_agent.update_conversation_state(
-                conversation_id=conversation["id"],
-                status="ready_for_dev" if analysis.is_complete else "needs_clarification",
-                analysis=analysis.model_dump()
+            needs_clarification = analysis.needs_clarification
+            new_status = "ready_for_dev" if analysis.is_complete else "needs_clarification"
+
+            # Update conversation and log the processed response in one
+            # transactional call
+            state_write = self._run(
+                self.po_agent.update_conversation_state,
+                conversation_id=conversation_id,
+                status=new_status,
+                analysis=analysis.model_dump(),
+                action_type="user_response_processed",
+                action_payload=self.po_agent.user_response_payload(
+                    conversation_id, analysis
+                )
             )
 
             # Take action based on updated analysis
-            if analysis.needs_clarification:
-                # Still need more info
-                self.po_agent.ask_clarifying_questions(
+            if needs_clarification:
+                # Still need more info. The questions don't depend on the
+                # state write, so both run together
+                followups = [state_write, self._run(
+                    self.po_agent.ask_clarifying_questions,
                     issue_number=issue_number,
                     questions=analysis.questions
-                )
+                )]
             elif analysis.is_complete:
-                # Ready for dev
-                self.po_agent.mark_ready_for_development(
+                # Ready for dev. The ready-for-dev label fires the labeled
+                # webhook, which reads the refined analysis from the
+                # database, so the state must land before the label does
+                await state_write
+                followups = [self._run(
+                    self.po_agent.mark_ready_for_development,
                     issue_number=issue_number,
                     refined_description=analysis.refined_description or "",
                     acceptance_criteria=analysis.acceptance_criteria,
                     suggested_labels=analysis.suggested_labels
-                )
+                )]
 
                 # Optionally trigger automatic development
                 # (commented out for now - can be enabled per child instance)
-                # self.trigger_development(conversation["id"], issue_number, analysis)
+                # self.trigger_development(conversation_id, issue_number, analysis)
+            else:
+                followups = [state_write]
+
+            # Let every follow-up finish even if one fails
+            results = await asyncio.gather(*followups, return_exceptions=True)
+            errors = [r for r in results if isinstance(r, BaseException)]
+            for error in errors:
+                logger.error(
+                    "Issue comment follow-up failed",
+                    issue_number=issue_number,
+                    error=str(error),
+                    exc_info=error
+                )
+            if errors:
+                raise errors[0]
 
             logger.info(
                 "Issue comment handled",
                 issue_number=issue_number,
-                needs_clarification=analysis.needs_clarification
+                needs_clarification=needs_clarification
             )
 
-            # Build state (simplified)
-            state = ConversationState(
+            # Build state (simplified). Every field comes from the database
+            # row or the already-validated analysis, so skip re-validation
+            state = ConversationState.model_construct(
                 issue_id=conversation["issue_id"],
                 issue_number=issue_number,
                 repo_full_name=repo_full_name,
-                status="ready_for_dev" if analysis.is_complete else "needs_clarification",
+                status=new_status,
                 current_analysis=analysis
             )
 
             return state
 
-    def handle_label_added(
+    async def handle_label_added(
         self,
         issue_number: int,
         label_name: str,
@@ -230,13 +300,13 @@ class IssueWorkflowOrchestrator:
             Optional[CodeGenerationResult]: Result if dev was triggered
 
         Example:
-            >>> result = orchestrator.handle_label_added(
+            >>> result = await orchestrator.handle_label_added(
             ...     issue_number=42,
             ...     label_name="ready-for-dev",
             ...     repo_full_name="org/repo"
             ... )
         """
-        with RequestLogger("handle_label_added", issue_number=issue_number, label=label_name):
+        async with RequestLogger("handle_label_added", issue_number=issue_number, label=label_name):
             logger.info(
                 "Handling label added",
                 issue_number=issue_number,
@@ -251,8 +321,9 @@ class IssueWorkflowOrchestrator:
                 )
                 return None
 
-            # Get conversation
-            conversation = self.po_agent.db_client.get_conversation(
+            # Get conversation, prefetching the state the agent reads next
+            conversation = await self._run(
+                self.po_agent.db_client.prefetch_for_issue,
                 issue_number=issue_number,
                 repo_full_name=repo_full_name
             )
@@ -265,9 +336,9 @@ class IssueWorkflowOrchestrator:
                 return None
 
             # Extract requirements from analysis
-            analysis = conversation.get("analysis", {})
-            requirements = analysis.get("refined_description", "")
-            acceptance_criteria = analysis.get("acceptance_criteria", [])
+            analysis = conversation.get("analysis") or {}
+            requirements = analysis.get("refined_description") or ""
+            acceptance_criteria = analysis.get("acceptance_criteria") or []
 
             if not requirements:
                 logger.warning(
@@ -277,7 +348,8 @@ class IssueWorkflowOrchestrator:
                 return None
 
             # Trigger Developer Agent
-            result = self.dev_agent.handle_ready_for_dev_issue(
+            result = await self._run(
+                self.dev_agent.handle_ready_for_dev_issue,
                 conversation_id=conversation["id"],
                 issue_number=issue_number,
                 requirements=requirements,
@@ -292,7 +364,7 @@ class IssueWorkflowOrchestrator:
 
             return result
 
-    def handle_pr_opened(
+    async def handle_pr_opened(
         self,
         pr_number: int,
         issue_number: Optional[int],
@@ -316,13 +388,15 @@ class IssueWorkflowOrchestrator:
 
         if issue_number:
             # Update conversation status
-            conversation = self.po_agent.db_client.get_conversation(
+            conversation = await self._run(
+                self.po_agent.db_client.get_conversation,
                 issue_number=issue_number,
                 repo_full_name=repo_full_name
             )
 
             if conversation:
-                self.po_agent.update_conversation_state(
+                await self._run(
+                    self.po_agent.update_conversation_state,
                     conversation_id=conversation["id"],
                     status="in_development"
                 )
@@ -332,7 +406,7 @@ class IssueWorkflowOrchestrator:
             pr_number=pr_number
         )
 
-    def get_workflow_status(
+    async def get_workflow_status(
         self,
         issue_number: int,
         repo_full_name: str
@@ -348,12 +422,16 @@ class IssueWorkflowOrchestrator:
             Dict[str, Any]: Workflow status information
 
         Example:
-            >>> status = orchestrator.get_workflow_status(42, "org/repo")
+            >>> status = await orchestrator.get_workflow_status(42, "org/repo")
             >>> print(status["stage"])  # "needs_clarification", "ready_for_dev", etc.
         """
-        conversation = self.po_agent.db_client.get_conversation(
+        # Conversation, its actions and latest code generation in one round trip
+        conversation = await self._run(
+            self.po_agent.db_client.get_conversation_with_actions,
             issue_number=issue_number,
-            repo_full_name=repo_full_name
+            repo_full_name=repo_full_name,
+            limit=50,
+            code_generation_limit=1
         )
 
         if not conversation:
@@ -362,19 +440,8 @@ class IssueWorkflowOrchestrator:
                 "stage": "not_started"
             }
 
-        # Get related actions
-        actions = self.po_agent.db_client.get_agent_actions(
-            conversation_id=conversation["id"],
-            limit=50
-        )
-
-        # Get code generation if exists
-        code_gens = self.po_agent.db_client.select(
-            table="code_generations",
-            filters={"conversation_id": conversation["id"]},
-            limit=1,
-            order_by="-created_at"
-        )
+        code_gens = conversation["code_generations"]
+        latest_code_gen = code_gens[0] if code_gens else None
 
         return {
             "exists": True,
@@ -382,9 +449,9 @@ class IssueWorkflowOrchestrator:
             "issue_number": conversation["issue_number"],
             "created_at": conversation["created_at"],
             "updated_at": conversation["updated_at"],
-            "action_count": len(actions),
-            "has_code_generation": len(code_gens) > 0,
-            "pr_number": code_gens[0]["pr_number"] if code_gens else None,
+            "action_count": len(conversation["agent_actions"]),
+            "has_code_generation": latest_code_gen is not None,
+            "pr_number": latest_code_gen["pr_number"] if latest_code_gen else None,
             "analysis": conversation.get("analysis")
         }
 
@@ -4,21 +4,55 @@ Health check endpoint for CHILD_TEMPLATE.
 TODO: Replace CHILD_TEMPLATE with your project name.
 """
 
-from datetime import datetime
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 import sys
 from pathlib import Path
 
 parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
 
 from src.config.settings import get_settings
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Seconds a settings check is reused. Health endpoints are polled far
+# more often than the configuration can change.
+SETTINGS_CHECK_TTL = 5.0
+
+_settings_checked_at = 0.0
+_settings_status: Dict[str, Any] = {}
+
+# Serialized health payload (minus timestamp) and the settings check it was built from
+_health_body: Tuple[Optional[Dict[str, Any]], bytes] = (None, b"")
+
+# Ping response up to the timestamp value
+_PONG_PREFIX = b'{"message":"pong","timestamp":"'
+
+
+# Formatted date/time of the last second seen; only the microseconds
+# change between calls within the same second
+_timestamp_second = -1
+_timestamp_prefix = b""
+
+
+def _utc_timestamp() -> bytes:
+    """Current UTC time as ISO 8601 bytes with a Z suffix."""
+    global _timestamp_second, _timestamp_prefix
+
+    second, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    if second != _timestamp_second:
+        _timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)).encode()
+        _timestamp_second = second
+
+    return b"%s.%06dZ" % (_timestamp_prefix, micros)
 
 
 def check_settings() -> Dict[str, Any]:
@@ -26,19 +60,19 @@ def check_settings() -> Dict[str, Any]:
     try:
         settings = get_settings()
 
+        ai_ok = bool(settings.ai_api_key and settings.ai_model_provider)
+        github_ok = bool(settings.github_token and settings.github_repo)
+        supabase_ok = bool(settings.supabase_url and settings.supabase_service_role_key)
+
         checks = {
-            "ai_configured": bool(settings.ai_api_key and settings.ai_model_provider),
-            "github_configured": bool(settings.github_token and settings.github_repo),
-            "supabase_configured": bool(settings.supabase_url and settings.supabase_service_role_key),
+            "ai_configured": ai_ok,
+            "github_configured": github_ok,
+            "supabase_configured": supabase_ok,
             "environment": settings.app_env,
             "debug_mode": settings.debug,
         }
 
-        all_healthy = all([
-            checks["ai_configured"],
-            checks["github_configured"],
-            checks["supabase_configured"]
-        ])
+        all_healthy = ai_ok and github_ok and supabase_ok
 
         return {
             "status": "healthy" if all_healthy else "degraded",
@@ -52,43 +86,64 @@ def check_settings() -> Dict[str, Any]:
         }
 
 
+def get_settings_status() -> Dict[str, Any]:
+    """Get the settings check, re-running it at most every SETTINGS_CHECK_TTL seconds."""
+    global _settings_checked_at, _settings_status
+
+    now = time.monotonic()
+    if not _settings_status or now - _settings_checked_at >= SETTINGS_CHECK_TTL:
+        _settings_status = check_settings()
+        _settings_checked_at = now
+
+    return _settings_status
+
+
+def get_health_body(settings_status: Dict[str, Any]) -> bytes:
+    """Get the serialized health payload without its timestamp."""
+    global _health_body
+
+    built_for, body = _health_body
+    if built_for is not settings_status:
+        body = orjson.dumps({
+            "status": settings_status["status"],
+            "service": "CHILD_TEMPLATE",
+            "version": "1.0.0",
+            "environment": settings_status.get("checks", {}).get("environment", "unknown"),
+            "components": {
+                "settings": settings_status,
+                "api": {
+                    "status": "healthy",
+                    "framework": "FastAPI"
+                }
+            }
+        })
+        _health_body = (settings_status, body)
+
+    return body
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    settings_status = check_settings()
-
-    health_data = {
-        "status": settings_status["status"],
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "service": "CHILD_TEMPLATE",
-        "version": "1.0.0",
-        "environment": settings_status.get("checks", {}).get("environment", "unknown"),
-        "components": {
-            "settings": settings_status,
-            "api": {
-                "status": "healthy",
-                "framework": "FastAPI"
-            }
-        }
-    }
+    settings_status = get_settings_status()
+    body = get_health_body(settings_status)
 
     status_code = 200 if settings_status["status"] != "unhealthy" else 503
 
-    return JSONResponse(
-        content=health_data,
-        status_code=status_code
+    return Response(
+        content=body[:-1] + b',"timestamp":"' + _utc_timestamp() + b'"}',
+        status_code=status_code,
+        media_type="application/json"
     )
 
 
 @app.get("/api/health/ping")
 async def ping():
     """Simple ping endpoint."""
-    return JSONResponse(
-        content={
-            "message": "pong",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        },
-        status_code=200
+    return Response(
+        content=_PONG_PREFIX + _utc_timestamp() + b'"}',
+        status_code=200,
+        media_type="application/json"
     )
 
 
@@ -10,15 +10,18 @@ No modifications needed unless you want to customize webhook handling.
 import hmac
 import hashlib
 from typing import Dict, Any
+
+import orjson
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 # Import settings and utilities from mother repo
 import sys
 from pathlib import Path
 
 parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
 
 from src.config.settings import get_settings
 from src.utils.logger import configure_logging, get_logger
@@ -29,7 +32,8 @@ from src.workflows.issue_handler import create_workflow_orchestrator
 
 # Import YOUR SPECIALIZED agents
 child_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(child_dir))
+if str(child_dir) not in sys.path:
+    sys.path.insert(0, str(child_dir))
 
 from src.agents.product_owner import ProductOwnerAgent
 from src.agents.developer import DeveloperAgent
@@ -50,7 +54,8 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="CHILD_TEMPLATE Webhook Handler",
     description="GitHub webhook handler with domain-specialized agents",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -59,7 +64,7 @@ def verify_github_signature(payload: bytes, signature: str, secret: str) -> bool
     if not signature or not signature.startswith("sha256="):
         return False
 
-    expected_signature = signature.split("=")[1]
+    expected_signature = signature[7:]
     mac = hmac.new(secret.encode(), msg=payload, digestmod=hashlib.sha256)
     computed_signature = mac.hexdigest()
 
@@ -118,20 +123,19 @@ async def github_webhook(request: Request):
             logger.warning("Invalid webhook signature", delivery_id=delivery_id)
             raise HTTPException(status_code=401, detail="Invalid signature")
 
-        payload = await request.json()
-
         # Create specialized agents
         po_agent, dev_agent = create_agents()
         orchestrator = create_workflow_orchestrator(po_agent, dev_agent)
 
         # Route based on event type
         if event_type == "issues":
+            payload = orjson.loads(body)
             action = payload.get("action")
             if action == "opened":
                 issue = payload.get("issue", {})
                 repository = payload.get("repository", {})
 
-                state = orchestrator.handle_new_issue(
+                state = await orchestrator.handle_new_issue(
                     issue_number=issue.get("number"),
                     issue_id=issue.get("id"),
                     issue_title=issue.get("title"),
@@ -139,7 +143,7 @@ async def github_webhook(request: Request):
                     repo_full_name=repository.get("full_name")
                 )
 
-                return JSONResponse(
+                return ORJSONResponse(
                     content={
                         "status": "success",
                         "message": "Issue analyzed with domain context",
@@ -150,14 +154,14 @@ async def github_webhook(request: Request):
 
         elif event_type == "ping":
             logger.info("Ping event received")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"status": "success", "message": "Pong!"},
                 status_code=200
             )
 
         else:
             logger.info("Unsupported event type", event_type=event_type)
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"status": "ignored", "message": f"Event type '{event_type}' not handled"},
                 status_code=200
             )
@@ -166,7 +170,7 @@ async def github_webhook(request: Request):
         raise
     except Exception as e:
         logger.error("Webhook processing failed", error=str(e), exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "error", "message": str(e)},
             status_code=500
         )
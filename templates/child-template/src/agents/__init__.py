@@ -1,11 +1,31 @@
 """
 Domain-specialized agents for CHILD_TEMPLATE.
 
+Agents are imported on first access (PEP 562), so a deployment that only
+uses one of them doesn't pay for importing the other at cold start.
+
 TODO: Replace CHILD_TEMPLATE with your project name.
 """
 
-from CHILD_TEMPLATE.src.agents.product_owner import ProductOwnerAgent
-from CHILD_TEMPLATE.src.agents.developer import DeveloperAgent
+from importlib import import_module
+from typing import Any
+
+
+_AGENT_MODULES = {
+    "ProductOwnerAgent": "CHILD_TEMPLATE.src.agents.product_owner",
+    "DeveloperAgent": "CHILD_TEMPLATE.src.agents.developer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class the first time it is accessed."""
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    agent_class = getattr(import_module(module_name), name)
+    globals()[name] = agent_class
+    return agent_class
 
 
 __all__ = [
@@ -3,71 +3,29 @@ Domain-Specialized Developer Agent for CHILD_TEMPLATE.
 
 TODO: Customize this agent for your tech stack by:
 1. Replacing CHILD_TEMPLATE with your project name
-2. Updating get_domain_context() with your tech stack and code patterns
-3. (Optional) Customizing customize_prompt() for extra code generation guidance
+2. Updating _DOMAIN_CONTEXT (returned by get_domain_context()) with your
+   tech stack and code patterns
+3. (Optional) Updating _CUSTOMIZATION (appended by customize_prompt()) with
+   extra code generation guidance
 
 This agent inherits from the mother repository's DeveloperAgent
 and adds tech stack specific code generation patterns.
 """
 
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
 # Import the mother repository's base Developer Agent
-import sys
-from pathlib import Path
+from _paths import PARENT_DIR, ensure_on_syspath
 
-# Add parent directory to path to import from mother repo
-parent_dir = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+ensure_on_syspath(PARENT_DIR)
 
 from src.agents.developer import DeveloperAgent as BaseDeveloperAgent
 
 
-class DeveloperAgent(BaseDeveloperAgent):
-    """
-    Domain-specialized Developer Agent.
-
-    TODO: Update this docstring with your tech stack.
-
-    This agent inherits all core functionality from the mother repository's
-    DeveloperAgent but adds [YOUR TECH STACK] specific code patterns and
-    development considerations.
-
-    **[YOUR DOMAIN] Specialization:**
-    TODO: List your tech stack here, for example:
-    - Language: Python/TypeScript/Go
-    - Framework: FastAPI/Next.js/Express
-    - Database: Supabase/PostgreSQL/MongoDB
-    - Key Libraries: [Your dependencies]
-
-    **Extension Pattern:**
-    - get_domain_context(): Defines tech stack and code patterns
-    - All other methods inherited without modification
-    """
-
-    def get_domain_context(self) -> str:
-        """
-        Get tech stack and code patterns for this agent.
-
-        TODO: Replace this placeholder with your actual tech stack.
-
-        Returns:
-            str: Tech stack context string
-
-        Example for a TypeScript/Next.js stack:
-            return '''
-            ## Tech Stack
-
-            - Language: TypeScript 5.0+
-            - Framework: Next.js 14 (App Router)
-            - Database: Prisma + PostgreSQL
-            - API: tRPC for type-safe APIs
-
-            ### Code Patterns:
-            [Show examples of your models, API routes, etc.]
-            '''
-        """
-        return """
+# Tech stack context and prompt guidance, built once at import time.
+# TODO: Replace these with your actual tech stack and guidelines.
+_DOMAIN_CONTEXT = """
 ## YOUR DOMAIN Tech Stack Context
 
 TODO: Replace this with your actual tech stack and code patterns.
@@ -175,19 +133,7 @@ When generating code:
 💡 **Tip**: Look at test-child/src/agents/developer.py for a complete FastAPI/Supabase example.
 """
 
-    def customize_prompt(self, base_prompt: str) -> str:
-        """
-        Customize prompts with tech-stack specific instructions.
-
-        TODO: (Optional) Add extra code generation guidance.
-
-        Args:
-            base_prompt: Base prompt from parent class
-
-        Returns:
-            str: Customized prompt
-        """
-        customization = """
+_CUSTOMIZATION = """
 
 ## [YOUR DOMAIN] Development Guidelines:
 
@@ -209,7 +155,73 @@ TODO: Add specific development guidelines for your domain.
 - [Structural requirement 1]
 - [Structural requirement 2]
 """
-        return base_prompt + customization
+
+
+@lru_cache(maxsize=128)
+def _customize(base_prompt: str) -> str:
+    """Append the development guidelines to a base prompt (memoized)."""
+    return base_prompt + _CUSTOMIZATION
+
+
+class DeveloperAgent(BaseDeveloperAgent):
+    """
+    Domain-specialized Developer Agent.
+
+    TODO: Update this docstring with your tech stack.
+
+    This agent inherits all core functionality from the mother repository's
+    DeveloperAgent but adds [YOUR TECH STACK] specific code patterns and
+    development considerations.
+
+    **[YOUR DOMAIN] Specialization:**
+    TODO: List your tech stack here, for example:
+    - Language: Python/TypeScript/Go
+    - Framework: FastAPI/Next.js/Express
+    - Database: Supabase/PostgreSQL/MongoDB
+    - Key Libraries: [Your dependencies]
+
+    **Extension Pattern:**
+    - get_domain_context(): Defines tech stack and code patterns
+    - All other methods inherited without modification
+    """
+
+    def get_domain_context(self) -> str:
+        """
+        Get tech stack and code patterns for this agent.
+
+        TODO: Replace this placeholder with your actual tech stack.
+
+        Returns:
+            str: Tech stack context string
+
+        Example for a TypeScript/Next.js stack:
+            return '''
+            ## Tech Stack
+
+            - Language: TypeScript 5.0+
+            - Framework: Next.js 14 (App Router)
+            - Database: Prisma + PostgreSQL
+            - API: tRPC for type-safe APIs
+
+            ### Code Patterns:
+            [Show examples of your models, API routes, etc.]
+            '''
+        """
+        return _DOMAIN_CONTEXT
+
+    def customize_prompt(self, base_prompt: str) -> str:
+        """
+        Customize prompts with tech-stack specific instructions.
+
+        TODO: (Optional) Add extra code generation guidance.
+
+        Args:
+            base_prompt: Base prompt from parent class
+
+        Returns:
+            str: Customized prompt
+        """
+        return _customize(base_prompt)
 
 
 # Verification code (for testing)
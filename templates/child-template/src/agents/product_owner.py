@@ -3,8 +3,10 @@ Domain-Specialized Product Owner Agent for CHILD_TEMPLATE.
 
 TODO: Customize this agent for your specific domain by:
 1. Replacing CHILD_TEMPLATE with your project name
-2. Updating get_domain_context() with your domain knowledge
-3. (Optional) Customizing customize_prompt() for extra guidance
+2. Updating _DOMAIN_CONTEXT (returned by get_domain_context()) with your
+   domain knowledge
+3. (Optional) Updating _CUSTOMIZATION (appended by customize_prompt()) with
+   extra guidance
 
 This agent inherits from the mother repository's ProductOwnerAgent
 and adds domain-specific context and behavior.
@@ -13,16 +15,68 @@ and adds domain-specific context and behavior.
 from typing import Optional, List, Dict, Any
 
 # Import the mother repository's base Product Owner Agent
-import sys
-from pathlib import Path
+from _paths import PARENT_DIR, ensure_on_syspath
 
-# Add parent directory to path to import from mother repo
-parent_dir = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+ensure_on_syspath(PARENT_DIR)
 
 from src.agents.product_owner import ProductOwnerAgent as BaseProductOwnerAgent
 
 
+# Domain context and prompt guidance, built once at import time.
+# TODO: Replace these with your actual domain knowledge and guidelines.
+_DOMAIN_CONTEXT = """
+## YOUR DOMAIN Context
+
+TODO: Replace this with your domain-specific context.
+
+You are analyzing requirements for a [YOUR DOMAIN] application.
+Always consider the following when analyzing issues:
+
+### Core [YOUR DOMAIN] Concerns:
+1. **[Key Area 1]**
+   - [Specific consideration 1a]
+   - [Specific consideration 1b]
+
+2. **[Key Area 2]**
+   - [Specific consideration 2a]
+   - [Specific consideration 2b]
+
+3. **[Key Area 3]**
+   - [Specific consideration 3a]
+   - [Specific consideration 3b]
+
+### Compliance & Security:
+- **[Regulation 1]**: [Description]
+- **[Regulation 2]**: [Description]
+
+### Performance Considerations:
+- [Performance concern 1]
+- [Performance concern 2]
+
+When analyzing issues, **always ask clarifying questions** about these concerns
+if they are not explicitly addressed in the issue description.
+
+---
+💡 **Tip**: Look at test-child/src/agents/product_owner.py for a complete e-commerce example.
+"""
+
+_CUSTOMIZATION = """
+
+## [YOUR DOMAIN] Specific Instructions:
+TODO: Add domain-specific instructions here.
+
+When analyzing this issue, pay special attention to:
+- [Key aspect 1]
+- [Key aspect 2]
+- [Key aspect 3]
+
+If the issue involves [common domain scenario], ALWAYS ask about:
+- [Question type 1]?
+- [Question type 2]?
+- [Question type 3]?
+"""
+
+
 class ProductOwnerAgent(BaseProductOwnerAgent):
     """
     Domain-specialized Product Owner Agent.
@@ -75,41 +129,7 @@ class ProductOwnerAgent(BaseProductOwnerAgent):
                - Audit trails
             '''
         """
-        return """
-## YOUR DOMAIN Context
-
-TODO: Replace this with your domain-specific context.
-
-You are analyzing requirements for a [YOUR DOMAIN] application.
-Always consider the following when analyzing issues:
-
-### Core [YOUR DOMAIN] Concerns:
-1. **[Key Area 1]**
-   - [Specific consideration 1a]
-   - [Specific consideration 1b]
-
-2. **[Key Area 2]**
-   - [Specific consideration 2a]
-   - [Specific consideration 2b]
-
-3. **[Key Area 3]**
-   - [Specific consideration 3a]
-   - [Specific consideration 3b]
-
-### Compliance & Security:
-- **[Regulation 1]**: [Description]
-- **[Regulation 2]**: [Description]
-
-### Performance Considerations:
-- [Performance concern 1]
-- [Performance concern 2]
-
-When analyzing issues, **always ask clarifying questions** about these concerns
-if they are not explicitly addressed in the issue description.
-
----
-💡 **Tip**: Look at test-child/src/agents/product_owner.py for a complete e-commerce example.
-"""
+        return _DOMAIN_CONTEXT
 
     def customize_prompt(self, base_prompt: str) -> str:
         """
@@ -134,22 +154,7 @@ if they are not explicitly addressed in the issue description.
             '''
             return base_prompt + customization
         """
-        customization = """
-
-## [YOUR DOMAIN] Specific Instructions:
-TODO: Add domain-specific instructions here.
-
-When analyzing this issue, pay special attention to:
-- [Key aspect 1]
-- [Key aspect 2]
-- [Key aspect 3]
-
-If the issue involves [common domain scenario], ALWAYS ask about:
-- [Question type 1]?
-- [Question type 2]?
-- [Question type 3]?
-"""
-        return base_prompt + customization
+        return base_prompt + _CUSTOMIZATION
 
 
 # Verification code (for testing)
@@ -6,25 +6,35 @@ TODO: Customize these tests for your tech stack.
 
 import pytest
 from unittest.mock import Mock
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-parent_dir = Path(__file__).resolve().parent.parent.parent
-child_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(parent_dir))
-sys.path.insert(0, str(child_dir))
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
+
+# Mother repo and this child on sys.path, child first
+ensure_on_syspath(PARENT_DIR, CHILD_DIR)
 
 from src.agents.developer import DeveloperAgent
 
 
-@pytest.fixture
+# Built once per session; reset_mocks restores the LLM after every test
+LLM_RESPONSE = '{"files": []}'
+
+
+@pytest.fixture(scope="session")
 def mock_llm():
     llm = Mock()
-    llm.invoke = Mock(return_value=Mock(content='{"files": []}'))
+    llm.invoke.return_value = SimpleNamespace(content=LLM_RESPONSE)
     return llm
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_llm):
+    yield
+    mock_llm.reset_mock(return_value=True, side_effect=True)
+    mock_llm.invoke.return_value = SimpleNamespace(content=LLM_RESPONSE)
+
+
+@pytest.fixture(scope="session")
 def specialized_dev_agent(mock_llm):
     return DeveloperAgent(
         llm=mock_llm,
@@ -45,4 +55,4 @@ class TestSpecializedDeveloperAgent:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
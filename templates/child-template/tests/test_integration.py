@@ -6,11 +6,11 @@ TODO: Add domain-specific workflow tests.
 
 import pytest
 from unittest.mock import Mock
-import sys
-from pathlib import Path
 
-parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+from _paths import PARENT_DIR, ensure_on_syspath
+
+# Add mother repo to path
+ensure_on_syspath(PARENT_DIR)
 
 from src.workflows.issue_handler import create_workflow_orchestrator
 
@@ -25,4 +25,4 @@ class TestWorkflowIntegration:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
+    raise SystemExit(pytest.main([__file__, "-v", "-s"]))
@@ -9,39 +9,51 @@ TODO: Customize these tests for your domain by:
 
 import pytest
 from unittest.mock import Mock
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-# Add parent directories to path
-parent_dir = Path(__file__).resolve().parent.parent.parent
-child_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(parent_dir))
-sys.path.insert(0, str(child_dir))
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
+
+# Mother repo and this child on sys.path, child first
+ensure_on_syspath(PARENT_DIR, CHILD_DIR)
 
 from src.agents.product_owner import ProductOwnerAgent
 
 
-@pytest.fixture
+# Mocks and the agent are built once per session; reset_mocks restores
+# them after every test so tests stay independent.
+LLM_RESPONSE = '{"needs_clarification": true}'
+
+
+@pytest.fixture(scope="session")
 def mock_llm():
     """Create a mock LangChain LLM."""
     llm = Mock()
-    llm.invoke = Mock(return_value=Mock(content='{"needs_clarification": true}'))
+    llm.invoke.return_value = SimpleNamespace(content=LLM_RESPONSE)
     return llm
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_vcs_client():
     """Create a mock VCS client."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_db_client():
     """Create a mock database client."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_llm, mock_vcs_client, mock_db_client):
+    """Clear calls and per-test configuration from the shared mocks."""
+    yield
+    for mock in (mock_llm, mock_vcs_client, mock_db_client):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_llm.invoke.return_value = SimpleNamespace(content=LLM_RESPONSE)
+
+
+@pytest.fixture(scope="session")
 def specialized_agent(mock_llm, mock_vcs_client, mock_db_client):
     """Create your domain-specialized Product Owner Agent."""
     return ProductOwnerAgent(
@@ -134,4 +146,4 @@ class TestSpecializedProductOwnerAgent:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,31 @@
+"""
+Filesystem paths shared by this child instance's agents and tests.
+
+The child directory and the mother repository root are resolved once,
+here, instead of in every module that puts them on sys.path.
+"""
+
+import sys
+from pathlib import Path
+
+
+# This child instance's root directory
+CHILD_DIR = str(Path(__file__).resolve().parent)
+
+# Mother repository root (the child's parent directory)
+PARENT_DIR = str(Path(CHILD_DIR).parent)
+
+
+def ensure_on_syspath(*paths: str) -> None:
+    """
+    Move paths to the front of sys.path without adding duplicates.
+
+    Paths are moved in order, so the last one ends up first.
+
+    Args:
+        *paths: Directories to put at the front of sys.path
+    """
+    for path in paths:
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
@@ -5,22 +5,60 @@ This endpoint verifies that the test-child instance is operational
 and that specialized agents can be instantiated correctly.
 """
 
-from datetime import datetime
-from typing import Dict, Any
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-
+import importlib.util
+import os
 import sys
-from pathlib import Path
+import time
+from typing import Any, Dict, Optional, Tuple
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 
 # Add parent directory to path
-parent_dir = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
+
+ensure_on_syspath(PARENT_DIR)
 
 from src.config.settings import get_settings
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Seconds a settings check is reused. Health endpoints are polled far
+# more often than the configuration can change.
+SETTINGS_CHECK_TTL = 5.0
+
+_settings_checked_at = 0.0
+_settings_status: Dict[str, Any] = {}
+
+# Result of the specialized agent check. Agent classes and their domain
+# context are fixed for the life of the process, so a successful check
+# is kept; an unhealthy one is re-run on the next request.
+_agents_status: Dict[str, Any] = {}
+
+# Specialized agent classes, resolved by _lazy_agents() on first use
+_po_cls: Optional[type] = None
+_dev_cls: Optional[type] = None
+
+# Ping response up to the timestamp value
+_PONG_PREFIX = b'{"message":"pong","instance":"test-child-ecommerce","timestamp":"'
+
+
+# Formatted date/time of the last second seen; only the microseconds
+# change between calls within the same second
+_timestamp_second = -1
+_timestamp_prefix = b""
+
+
+def _utc_timestamp() -> bytes:
+    """Current UTC time as ISO 8601 bytes with a Z suffix."""
+    global _timestamp_second, _timestamp_prefix
+
+    second, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    if second != _timestamp_second:
+        _timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)).encode()
+        _timestamp_second = second
+
+    return b"%s.%06dZ" % (_timestamp_prefix, micros)
 
 
 def check_settings() -> Dict[str, Any]:
@@ -33,19 +71,19 @@ def check_settings() -> Dict[str, Any]:
     try:
         settings = get_settings()
 
+        ai_ok = bool(settings.ai_api_key and settings.ai_model_provider)
+        github_ok = bool(settings.github_token and settings.github_repo)
+        supabase_ok = bool(settings.supabase_url and settings.supabase_service_role_key)
+
         checks = {
-            "ai_configured": bool(settings.ai_api_key and settings.ai_model_provider),
-            "github_configured": bool(settings.github_token and settings.github_repo),
-            "supabase_configured": bool(settings.supabase_url and settings.supabase_service_role_key),
+            "ai_configured": ai_ok,
+            "github_configured": github_ok,
+            "supabase_configured": supabase_ok,
             "environment": settings.app_env,
             "debug_mode": settings.debug,
         }
 
-        all_healthy = all([
-            checks["ai_configured"],
-            checks["github_configured"],
-            checks["supabase_configured"]
-        ])
+        all_healthy = ai_ok and github_ok and supabase_ok
 
         return {
             "status": "healthy" if all_healthy else "degraded",
@@ -59,6 +97,78 @@ def check_settings() -> Dict[str, Any]:
         }
 
 
+def get_settings_status() -> Dict[str, Any]:
+    """
+    Get the settings check, re-running it at most every SETTINGS_CHECK_TTL seconds.
+
+    Returns:
+        Dict with status and details
+    """
+    global _settings_checked_at, _settings_status
+
+    now = time.monotonic()
+    if not _settings_status or now - _settings_checked_at >= SETTINGS_CHECK_TTL:
+        _settings_status = check_settings()
+        _settings_checked_at = now
+
+    return _settings_status
+
+
+def _load_child_class(filename: str, attr: str) -> type:
+    """
+    Load a class from one of this child's agent modules by file path.
+
+    The mother repository's `src` package is the one on sys.path, so a
+    dotted `src.agents...` import would resolve to the generic agents.
+    The module is registered under its own name instead.
+
+    Args:
+        filename: File name in this child's src/agents directory
+        attr: Class name to fetch from the module
+
+    Returns:
+        type: The class
+
+    Raises:
+        ImportError: If the module cannot be loaded
+        AttributeError: If the module has no such class
+    """
+    module_name = "test_child_agents_" + filename[:-len(".py")]
+    module = sys.modules.get(module_name)
+    if module is None:
+        path = os.path.join(CHILD_DIR, "src", "agents", filename)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return getattr(module, attr)
+
+
+def _lazy_agents() -> Tuple[type, type]:
+    """
+    Get the specialized agent classes, importing them on first use.
+
+    Returns:
+        Tuple of (ProductOwnerAgent, DeveloperAgent) classes
+    """
+    global _po_cls, _dev_cls
+
+    if _po_cls is None or _dev_cls is None:
+        # This child ahead of the mother repository
+        ensure_on_syspath(CHILD_DIR)
+
+        _po_cls = _load_child_class("product_owner.py", "ProductOwnerAgent")
+        _dev_cls = _load_child_class("developer.py", "DeveloperAgent")
+
+    return _po_cls, _dev_cls
+
+
 def check_specialized_agents() -> Dict[str, Any]:
     """
     Verify that specialized e-commerce agents can be loaded.
@@ -68,15 +178,11 @@ def check_specialized_agents() -> Dict[str, Any]:
     """
     try:
         # Import specialized agents
-        test_child_dir = Path(__file__).resolve().parent.parent
-        sys.path.insert(0, str(test_child_dir))
-
-        from src.agents.product_owner import ProductOwnerAgent
-        from src.agents.developer import DeveloperAgent
+        ProductOwnerAgent, DeveloperAgent = _lazy_agents()
 
         # Check that they have domain context
-        po_has_context = bool(ProductOwnerAgent.get_domain_context(ProductOwnerAgent))
-        dev_has_context = bool(DeveloperAgent.get_domain_context(DeveloperAgent))
+        po_has_context = bool(getattr(ProductOwnerAgent, "DOMAIN_CONTEXT", ""))
+        dev_has_context = bool(getattr(DeveloperAgent, "DOMAIN_CONTEXT", ""))
 
         return {
             "status": "healthy" if (po_has_context and dev_has_context) else "degraded",
@@ -92,6 +198,29 @@ def check_specialized_agents() -> Dict[str, Any]:
         }
 
 
+def get_agents_status() -> Dict[str, Any]:
+    """
+    Get the specialized agent check, running it until it stops failing.
+
+    Healthy and degraded results are kept for the life of the process.
+    An unhealthy result is returned but not kept, so a transient import
+    failure does not stick until the instance is redeployed.
+
+    Returns:
+        Dict with agent status
+    """
+    global _agents_status
+
+    if _agents_status:
+        return _agents_status
+
+    status = check_specialized_agents()
+    if status["status"] != "unhealthy":
+        _agents_status = status
+
+    return status
+
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -100,10 +229,10 @@ async def health_check():
     Returns system status, configuration, and agent specialization info.
 
     Returns:
-        JSONResponse: Health check data
+        ORJSONResponse: Health check data
     """
-    settings_status = check_settings()
-    agents_status = check_specialized_agents()
+    settings_status = get_settings_status()
+    agents_status = get_agents_status()
 
     # Overall status is healthy only if both are healthy
     overall_status = "healthy"
@@ -114,7 +243,7 @@ async def health_check():
 
     health_data = {
         "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _utc_timestamp().decode(),
         "service": "OSOrganicAI Test-Child",
         "instance": "test-child-ecommerce",
         "version": "1.0.0",
@@ -132,7 +261,7 @@ async def health_check():
     # Return 200 if healthy/degraded, 503 if unhealthy
     status_code = 200 if overall_status != "unhealthy" else 503
 
-    return JSONResponse(
+    return ORJSONResponse(
         content=health_data,
         status_code=status_code
     )
@@ -144,15 +273,12 @@ async def ping():
     Simple ping endpoint for basic connectivity checks.
 
     Returns:
-        JSONResponse: Pong response
-    """
-    return JSONResponse(
-        content={
-            "message": "pong",
-            "instance": "test-child-ecommerce",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        },
-        status_code=200
+        Response: Pong response (JSON)
+    """
+    return Response(
+        content=_PONG_PREFIX + _utc_timestamp() + b'"}',
+        status_code=200,
+        media_type="application/json"
     )
 
 
@@ -8,30 +8,28 @@ This demonstrates that child instances can use the same webhook
 infrastructure with specialized agents.
 """
 
+import asyncio
 import hmac
 import hashlib
-from typing import Dict, Any
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-# Import settings and utilities from mother repo
-import sys
-from pathlib import Path
+import orjson
+from fastapi import FastAPI, Request, HTTPException, Response, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
+# Import settings and utilities from mother repo
 # Imports from lib/ directory
 
 
 from lib.src.config.settings import get_settings
 from lib.src.utils.logger import configure_logging, get_logger
-from lib.src.utils.llm_factory import LLMFactory
-from lib.src.utils.supabase_client import create_supabase_client
-from lib.src.utils.github_api import create_github_client
-from lib.src.workflows.issue_handler import create_workflow_orchestrator
+from lib.src.utils.module_loading import cached_import
 
-# Import SPECIALIZED agents from test-child
-# These are the e-commerce specialized agents, not the generic mother repo agents
-from src.agents.product_owner import ProductOwnerAgent
-from src.agents.developer import DeveloperAgent
+# The LLM, GitHub/Supabase clients, workflow and agents are imported in
+# create_agents()/get_orchestrator(): their import chains (LLM SDKs,
+# httpx, postgrest) are only paid once an event actually needs them,
+# not on cold starts that serve pings or ignored events.
 
 
 # Initialize settings
@@ -49,40 +47,109 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="Test-Child E-commerce Webhook Handler",
     description="GitHub webhook handler with e-commerce specialized agents",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Largest webhook body accepted. GitHub caps payloads at 25MB, but the
+# issue, comment and PR events handled here are far below 1MB.
+MAX_WEBHOOK_BODY_BYTES = 2_000_000
 
-def verify_github_signature(payload: bytes, signature: str, secret: str) -> bool:
+# Reply to GitHub's ping event; it never changes, so it is encoded once
+_PING_BODY = orjson.dumps({
+    "status": "success",
+    "message": "Pong from test-child e-commerce instance!",
+    "instance": "test-child-ecommerce"
+})
+
+
+async def read_webhook_body(
+    request: Request,
+    max_bytes: int = MAX_WEBHOOK_BODY_BYTES,
+    mac: Optional[hmac.HMAC] = None
+) -> bytes:
     """
-    Verify GitHub webhook signature.
+    Read the request body, rejecting it as soon as it exceeds max_bytes.
+
+    The declared Content-Length is checked before anything is read, and
+    the streamed size is checked while reading, so oversized payloads are
+    never fully buffered. When mac is given, each chunk is fed to it as
+    it arrives, so the signature is computed in the same pass.
 
     Args:
-        payload: Request body as bytes
+        request: Incoming request
+        max_bytes: Maximum accepted body size
+        mac: Optional HMAC to update with the body
+
+    Returns:
+        bytes: Request body
+
+    Raises:
+        HTTPException: 413 if the body is larger than max_bytes
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if mac is not None:
+            mac.update(chunk)
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+@lru_cache(maxsize=8)
+def _hmac_prototype(secret: str) -> hmac.HMAC:
+    """
+    Get an HMAC-SHA256 object already keyed with the webhook secret.
+
+    Keying pads the secret and hashes the inner/outer blocks; doing that
+    once and copy()-ing the state per request skips it on every delivery.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def signature_matches(mac: hmac.HMAC, signature: Optional[str]) -> bool:
+    """
+    Check a GitHub signature header against an HMAC of the body.
+
+    Args:
+        mac: HMAC keyed with the webhook secret and fed the whole body
         signature: X-Hub-Signature-256 header value
-        secret: Webhook secret
 
     Returns:
         bool: True if signature is valid
     """
-    if not signature:
+    if not signature or not signature.startswith("sha256="):
         return False
 
-    if not signature.startswith("sha256="):
-        return False
+    return hmac.compare_digest(mac.hexdigest(), signature[7:])
 
-    expected_signature = signature.split("=")[1]
 
-    mac = hmac.new(
-        secret.encode(),
-        msg=payload,
-        digestmod=hashlib.sha256
-    )
-    computed_signature = mac.hexdigest()
+def verify_github_signature(payload: bytes, signature: str, secret: str) -> bool:
+    """
+    Verify GitHub webhook signature.
 
-    return hmac.compare_digest(computed_signature, expected_signature)
+    Args:
+        payload: Request body as bytes
+        signature: X-Hub-Signature-256 header value
+        secret: Webhook secret
+
+    Returns:
+        bool: True if signature is valid
+    """
+    mac = _hmac_prototype(secret).copy()
+    mac.update(payload)
+    return signature_matches(mac, signature)
 
 
+@lru_cache(maxsize=1)
 def create_agents():
     """
     Create and configure e-commerce specialized agents.
@@ -90,9 +157,21 @@ def create_agents():
     This is the key difference from the mother repo: we instantiate
     the SPECIALIZED agents here instead of generic ones.
 
+    The LLM, clients and agents are built once per warm instance;
+    later calls return the same pair.
+
     Returns:
         Tuple of (ProductOwnerAgent, DeveloperAgent)
     """
+    from lib.src.utils.llm_factory import LLMFactory
+    from lib.src.utils.supabase_client import create_supabase_client
+    from lib.src.utils.github_api import create_github_client
+
+    # Import SPECIALIZED agents from test-child
+    # These are the e-commerce specialized agents, not the generic mother repo agents
+    ProductOwnerAgent = cached_import("src.agents.product_owner", "ProductOwnerAgent")
+    DeveloperAgent = cached_import("src.agents.developer", "DeveloperAgent")
+
     logger.info("Creating e-commerce specialized agents")
 
     # Create LLM
@@ -131,16 +210,35 @@ def create_agents():
     return po_agent, dev_agent
 
 
+@lru_cache(maxsize=None)
+def get_orchestrator():
+    """
+    Get the workflow orchestrator shared by all webhook deliveries.
+
+    Built from the cached agents on the first delivery and reused
+    afterwards, so connection pools stay warm across webhooks instead
+    of being rebuilt per request.
+
+    Returns:
+        IssueWorkflowOrchestrator: Shared orchestrator
+    """
+    from lib.src.workflows.issue_handler import create_workflow_orchestrator
+
+    po_agent, dev_agent = create_agents()
+    return create_workflow_orchestrator(po_agent, dev_agent)
+
+
 @app.post("/api/webhooks/github")
-async def github_webhook(request: Request):
+async def github_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Handle GitHub webhook events with e-commerce specialized agents.
 
     This endpoint is identical to the mother repo's webhook handler,
-    but uses specialized agents under the hood.
+    but uses specialized agents under the hood. New issues are
+    acknowledged with 202 and analyzed after the response is sent.
 
     Returns:
-        JSONResponse: Processing status
+        ORJSONResponse: Acceptance status
     """
     try:
         # Get headers
@@ -155,61 +253,41 @@ async def github_webhook(request: Request):
             instance="test-child-ecommerce"
         )
 
-        # Read body
-        body = await request.body()
+        # Read body (size-capped), computing its signature on the way
+        mac = _hmac_prototype(settings.github_webhook_secret).copy()
+        body = await read_webhook_body(request, mac=mac)
 
         # Verify signature
-        if not verify_github_signature(body, signature, settings.github_webhook_secret):
+        if not signature_matches(mac, signature):
             logger.warning(
                 "Invalid webhook signature",
                 delivery_id=delivery_id
             )
             raise HTTPException(status_code=401, detail="Invalid signature")
 
-        # Parse JSON payload
-        payload = await request.json()
-
-        # Create specialized e-commerce agents
-        po_agent, dev_agent = create_agents()
-
-        # Create orchestrator (uses same workflow as mother)
-        orchestrator = create_workflow_orchestrator(po_agent, dev_agent)
-
-        # Route based on event type
+        # Route based on event type; only supported events are parsed
         # (Same routing logic as mother repo)
         if event_type == "issues":
+            payload = orjson.loads(body)
             action = payload.get("action")
             if action == "opened":
-                issue = payload.get("issue", {})
-                repository = payload.get("repository", {})
-
-                state = orchestrator.handle_new_issue(
-                    issue_number=issue.get("number"),
-                    issue_id=issue.get("id"),
-                    issue_title=issue.get("title"),
-                    issue_body=issue.get("body", ""),
-                    repo_full_name=repository.get("full_name")
-                )
+                background_tasks.add_task(process_new_issue, payload, delivery_id)
 
-                return JSONResponse(
+                return ORJSONResponse(
                     content={
-                        "status": "success",
-                        "message": "Issue analyzed with e-commerce context",
-                        "instance": "test-child-ecommerce",
-                        "conversation_status": state.status
+                        "status": "accepted",
+                        "delivery_id": delivery_id,
+                        "instance": "test-child-ecommerce"
                     },
-                    status_code=200
+                    status_code=202
                 )
 
         elif event_type == "ping":
             logger.info("Ping event received (test-child)")
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Pong from test-child e-commerce instance!",
-                    "instance": "test-child-ecommerce"
-                },
-                status_code=200
+            return Response(
+                content=_PING_BODY,
+                status_code=200,
+                media_type="application/json"
             )
 
         else:
@@ -217,7 +295,7 @@ async def github_webhook(request: Request):
                 "Unsupported event type",
                 event_type=event_type
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "status": "ignored",
                     "message": f"Event type '{event_type}' not handled",
@@ -235,7 +313,7 @@ async def github_webhook(request: Request):
             error=str(e),
             exc_info=True
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "error",
                 "message": str(e),
@@ -245,5 +323,46 @@ async def github_webhook(request: Request):
         )
 
 
+async def process_new_issue(payload: Dict[str, Any], delivery_id: str) -> None:
+    """
+    Analyze a newly opened issue in the background.
+
+    Failures are logged; the delivery has already been acknowledged.
+
+    Args:
+        payload: GitHub 'issues' webhook payload
+        delivery_id: X-GitHub-Delivery header value
+    """
+    issue = payload.get("issue", {})
+    repository = payload.get("repository", {})
+
+    try:
+        # Shared e-commerce agents and orchestrator (same workflow as
+        # mother), built off the event loop on first use
+        orchestrator = await asyncio.to_thread(get_orchestrator)
+        state = await orchestrator.handle_new_issue(
+            issue_number=issue.get("number"),
+            issue_id=issue.get("id"),
+            issue_title=issue.get("title"),
+            issue_body=issue.get("body", ""),
+            repo_full_name=repository.get("full_name")
+        )
+
+        logger.info(
+            "Issue analyzed with e-commerce context",
+            delivery_id=delivery_id,
+            instance="test-child-ecommerce",
+            conversation_status=state.status
+        )
+
+    except Exception as e:
+        logger.error(
+            "Test-child webhook processing failed",
+            delivery_id=delivery_id,
+            error=str(e),
+            exc_info=True
+        )
+
+
 # Vercel serverless function handler
 handler = app
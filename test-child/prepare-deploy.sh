@@ -71,6 +71,9 @@ if [ -f "api/health.py" ]; then
     sed -i 's|sys.path.insert(0, str(parent_dir))||' api/health.py 2>/dev/null || \
     sed -i '' 's|sys.path.insert(0, str(parent_dir))||' api/health.py
 
+    sed -i 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' api/health.py 2>/dev/null || \
+    sed -i '' 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' api/health.py
+
     sed -i 's|from src\.|from lib.src.|g' api/health.py 2>/dev/null || \
     sed -i '' 's|from src\.|from lib.src.|g' api/health.py
 
@@ -87,6 +90,9 @@ if [ -f "src/agents/product_owner.py" ]; then
     sed -i 's|sys.path.insert(0, str(parent_dir))||' src/agents/product_owner.py 2>/dev/null || \
     sed -i '' 's|sys.path.insert(0, str(parent_dir))||' src/agents/product_owner.py
 
+    sed -i 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' src/agents/product_owner.py 2>/dev/null || \
+    sed -i '' 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' src/agents/product_owner.py
+
     sed -i 's|^from src\.|from lib.src.|g' src/agents/product_owner.py 2>/dev/null || \
     sed -i '' 's|^from src\.|from lib.src.|g' src/agents/product_owner.py
 
@@ -102,6 +108,9 @@ if [ -f "src/agents/developer.py" ]; then
     sed -i 's|sys.path.insert(0, str(parent_dir))||' src/agents/developer.py 2>/dev/null || \
     sed -i '' 's|sys.path.insert(0, str(parent_dir))||' src/agents/developer.py
 
+    sed -i 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' src/agents/developer.py 2>/dev/null || \
+    sed -i '' 's|^ensure_on_syspath(PARENT_DIR)$|# Mother repository code is imported from lib/|' src/agents/developer.py
+
     sed -i 's|^from src\.|from lib.src.|g' src/agents/developer.py 2>/dev/null || \
     sed -i '' 's|^from src\.|from lib.src.|g' src/agents/developer.py
 
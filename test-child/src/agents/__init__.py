@@ -3,10 +3,31 @@ E-commerce specialized agents for test-child.
 
 These agents inherit from the mother repository's base agents
 and add e-commerce specific context and behavior.
+
+Agents are imported on first access (PEP 562): importing this package
+doesn't load the mother repo's agent, LangChain and client modules
+until an agent class is actually used.
 """
 
-from test_child.src.agents.product_owner import ProductOwnerAgent
-from test_child.src.agents.developer import DeveloperAgent
+from importlib import import_module
+from typing import Any
+
+
+_AGENT_MODULES = {
+    "ProductOwnerAgent": "test_child.src.agents.product_owner",
+    "DeveloperAgent": "test_child.src.agents.developer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class the first time it is accessed."""
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    agent_class = getattr(import_module(module_name), name)
+    globals()[name] = agent_class
+    return agent_class
 
 
 __all__ = [
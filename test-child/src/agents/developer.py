@@ -10,15 +10,12 @@ Demonstrates template inheritance pattern:
 - Can override other methods for further customization
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional
 
 # Import the mother repository's base Developer Agent
-import sys
-from pathlib import Path
+from _paths import PARENT_DIR, ensure_on_syspath
 
-# Add parent directory to path to import from mother repo
-parent_dir = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+ensure_on_syspath(PARENT_DIR)
 
 from src.agents.developer import DeveloperAgent as BaseDeveloperAgent
 
@@ -44,17 +41,9 @@ class DeveloperAgent(BaseDeveloperAgent):
     - All other methods inherited without modification
     """
 
-    def get_domain_context(self) -> str:
-        """
-        Get e-commerce specific tech stack and code patterns.
-
-        This context guides the LLM to generate code following
-        e-commerce best practices and using the specified tech stack.
-
-        Returns:
-            str: E-commerce tech stack context
-        """
-        return """
+    # Static prompt text, built once with the class; the methods below
+    # just return it
+    DOMAIN_CONTEXT: ClassVar[str] = """
 ## E-commerce Tech Stack Context
 
 You are generating code for an **e-commerce platform** with the following tech stack:
@@ -240,17 +229,7 @@ When generating code:
 6. Add clear comments explaining business logic
 """
 
-    def customize_prompt(self, base_prompt: str) -> str:
-        """
-        Customize prompts with e-commerce development instructions.
-
-        Args:
-            base_prompt: Base prompt from parent class
-
-        Returns:
-            str: Customized prompt with e-commerce focus
-        """
-        customization = """
+    CUSTOMIZATION_SUFFIX: ClassVar[str] = """
 
 ## E-commerce Development Guidelines:
 
@@ -285,7 +264,30 @@ When generating code:
 - Use Pydantic for request/response validation
 - Implement proper error responses (4xx, 5xx)
 """
-        return base_prompt + customization
+
+    def get_domain_context(self) -> str:
+        """
+        Get e-commerce specific tech stack and code patterns.
+
+        This context guides the LLM to generate code following
+        e-commerce best practices and using the specified tech stack.
+
+        Returns:
+            str: E-commerce tech stack context
+        """
+        return self.DOMAIN_CONTEXT
+
+    def customize_prompt(self, base_prompt: str) -> str:
+        """
+        Customize prompts with e-commerce development instructions.
+
+        Args:
+            base_prompt: Base prompt from parent class
+
+        Returns:
+            str: Customized prompt with e-commerce focus
+        """
+        return base_prompt + self.CUSTOMIZATION_SUFFIX
 
 
 # Example usage (for testing):
@@ -293,4 +295,4 @@ if __name__ == "__main__":
     print("E-commerce Developer Agent loaded successfully!")
     print("\nDomain Context Preview:")
     agent_class = DeveloperAgent
-    print(agent_class.get_domain_context(agent_class))
+    print(agent_class.DOMAIN_CONTEXT)
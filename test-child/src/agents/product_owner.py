@@ -10,15 +10,12 @@ Demonstrates template inheritance pattern:
 - Can override other methods for further customization
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional
 
 # Import the mother repository's base Product Owner Agent
-import sys
-from pathlib import Path
+from _paths import PARENT_DIR, ensure_on_syspath
 
-# Add parent directory to path to import from mother repo
-parent_dir = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+ensure_on_syspath(PARENT_DIR)
 
 from src.agents.product_owner import ProductOwnerAgent as BaseProductOwnerAgent
 
@@ -43,17 +40,9 @@ class ProductOwnerAgent(BaseProductOwnerAgent):
     - All other methods inherited without modification
     """
 
-    def get_domain_context(self) -> str:
-        """
-        Get e-commerce specific domain context.
-
-        This context is injected into all LLM prompts, ensuring the
-        Product Owner Agent asks e-commerce relevant questions.
-
-        Returns:
-            str: E-commerce domain context
-        """
-        return """
+    # Static prompt text, built once with the class; the methods below
+    # just return it
+    DOMAIN_CONTEXT: ClassVar[str] = """
 ## E-commerce Domain Context
 
 You are analyzing requirements for an **e-commerce platform**.
@@ -129,20 +118,7 @@ When analyzing issues, **always ask clarifying questions** about these concerns
 if they are not explicitly addressed in the issue description.
 """
 
-    def customize_prompt(self, base_prompt: str) -> str:
-        """
-        Customize prompts with e-commerce specific instructions.
-
-        This method adds extra guidance to ensure the agent asks
-        e-commerce relevant questions.
-
-        Args:
-            base_prompt: Base prompt from parent class
-
-        Returns:
-            str: Customized prompt with e-commerce focus
-        """
-        customization = """
+    CUSTOMIZATION_SUFFIX: ClassVar[str] = """
 
 ## E-commerce Specific Instructions:
 When analyzing this issue, pay special attention to:
@@ -167,7 +143,33 @@ If the issue involves checkout, ALWAYS ask about:
 - What shipping options are needed?
 - How should cart abandonment be handled?
 """
-        return base_prompt + customization
+
+    def get_domain_context(self) -> str:
+        """
+        Get e-commerce specific domain context.
+
+        This context is injected into all LLM prompts, ensuring the
+        Product Owner Agent asks e-commerce relevant questions.
+
+        Returns:
+            str: E-commerce domain context
+        """
+        return self.DOMAIN_CONTEXT
+
+    def customize_prompt(self, base_prompt: str) -> str:
+        """
+        Customize prompts with e-commerce specific instructions.
+
+        This method adds extra guidance to ensure the agent asks
+        e-commerce relevant questions.
+
+        Args:
+            base_prompt: Base prompt from parent class
+
+        Returns:
+            str: Customized prompt with e-commerce focus
+        """
+        return base_prompt + self.CUSTOMIZATION_SUFFIX
 
 
 # Example usage (for testing):
@@ -180,4 +182,4 @@ if __name__ == "__main__":
     print("\nDomain Context Preview:")
     agent_class = ProductOwnerAgent
     # We can't instantiate without dependencies, but we can show the context
-    print(agent_class.get_domain_context(agent_class))
+    print(agent_class.DOMAIN_CONTEXT)
@@ -0,0 +1,127 @@
+"""
+Shared fixtures for the test-child e-commerce tests.
+
+Mock clients are built once per session and agents once per module;
+reset_mocks clears per-test configuration and restores the defaults
+below after every test.
+"""
+
+import pytest
+from pytest_asyncio import is_async_test
+from unittest.mock import Mock
+from types import SimpleNamespace
+
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
+
+# Mother repo and this child on sys.path, child first
+ensure_on_syspath(PARENT_DIR, CHILD_DIR)
+
+# Agent and workflow modules are imported inside their fixtures, so
+# collecting or selecting tests that don't use them skips the import
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+# Default LLM reply; tests that need a specific analysis set their own
+LLM_RESPONSE = '{"needs_clarification": true}'
+
+
+def _set_llm_defaults(llm):
+    """Set the default response on the mock LLM."""
+    llm.invoke.return_value = SimpleNamespace(content=LLM_RESPONSE)
+
+
+def _set_vcs_defaults(client):
+    """Set default return values on the mock VCS client."""
+    client.create_branch.return_value = True
+    client.create_or_update_file.return_value = True
+    client.create_pull_request.return_value = SimpleNamespace(number=123)
+
+
+def _set_db_defaults(client):
+    """Set default return values on the mock database client."""
+    client.create_conversation.return_value = "conv-uuid-123"
+    client.create_conversation_with_analysis.return_value = "conv-uuid-123"
+    client.get_conversation.return_value = None
+    client.log_agent_action.return_value = "action-uuid"
+    client.create_code_generation.return_value = "codegen-uuid"
+
+
+@pytest.fixture(scope="session")
+def mock_llm():
+    """Create a mock LangChain LLM (agents only call invoke)."""
+    llm = Mock(spec=["invoke"])
+    _set_llm_defaults(llm)
+    return llm
+
+
+@pytest.fixture(scope="session")
+def mock_vcs_client():
+    """Create a mock VCS client limited to the VCS protocol."""
+    from src.interfaces.vcs_client import VCSClientProtocol
+
+    client = Mock(spec=VCSClientProtocol)
+    # Instance attribute on GitHubClient, so not part of the spec
+    client.repo_name = "test-org/test-ecommerce"
+    _set_vcs_defaults(client)
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_db_client():
+    """Create a mock database client limited to the database protocol."""
+    from src.interfaces.database_client import DatabaseClientProtocol
+
+    client = Mock(spec=DatabaseClientProtocol)
+    _set_db_defaults(client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_llm, mock_vcs_client, mock_db_client):
+    """Undo per-test mock configuration on the shared clients."""
+    yield
+    for mock in (mock_llm, mock_vcs_client, mock_db_client):
+        mock.reset_mock(return_value=True, side_effect=True)
+    _set_llm_defaults(mock_llm)
+    _set_vcs_defaults(mock_vcs_client)
+    _set_db_defaults(mock_db_client)
+
+
+@pytest.fixture(scope="module")
+def ecommerce_po_agent(mock_llm, mock_vcs_client, mock_db_client):
+    """Create an e-commerce specialized Product Owner Agent."""
+    from src.agents.product_owner import ProductOwnerAgent
+
+    return ProductOwnerAgent(
+        llm=mock_llm,
+        vcs_client=mock_vcs_client,
+        db_client=mock_db_client
+    )
+
+
+@pytest.fixture(scope="module")
+def ecommerce_dev_agent(mock_llm, mock_vcs_client, mock_db_client):
+    """Create an e-commerce specialized Developer Agent."""
+    from src.agents.developer import DeveloperAgent
+
+    return DeveloperAgent(
+        llm=mock_llm,
+        vcs_client=mock_vcs_client,
+        db_client=mock_db_client
+    )
+
+
+@pytest.fixture(scope="module")
+def orchestrator(ecommerce_po_agent, ecommerce_dev_agent):
+    """Create workflow orchestrator with e-commerce agents."""
+    from src.workflows.issue_handler import create_workflow_orchestrator
+
+    # Safe to share: its semaphore binds to the session event loop
+    return create_workflow_orchestrator(ecommerce_po_agent, ecommerce_dev_agent)
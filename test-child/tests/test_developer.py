@@ -9,43 +9,39 @@ These tests verify that:
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-# Add parent directories to path
-parent_dir = Path(__file__).resolve().parent.parent.parent
-test_child_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(parent_dir))
-sys.path.insert(0, str(test_child_dir))
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
 
-from src.agents.developer import DeveloperAgent
+# Mother repo and this child on sys.path, child first
+ensure_on_syspath(PARENT_DIR, CHILD_DIR)
 
 
-@pytest.fixture
-def mock_llm():
-    """Create a mock LangChain LLM."""
-    llm = Mock()
-    llm.invoke = Mock(return_value=Mock(content='{"files": []}'))
-    return llm
+LLM_RESPONSE = SimpleNamespace(content='{"files": []}')
 
 
-@pytest.fixture
-def mock_vcs_client():
-    """Create a mock VCS client."""
-    return Mock()
+class FakeLLM:
+    """Stateless LLM stand-in; these tests never inspect invoke calls."""
 
+    __slots__ = ()
 
-@pytest.fixture
-def mock_db_client():
-    """Create a mock database client."""
-    return Mock()
+    def invoke(self, messages, *args, **kwargs):
+        return LLM_RESPONSE
 
 
-@pytest.fixture
-def ecommerce_dev_agent(mock_llm, mock_vcs_client, mock_db_client):
-    """Create an e-commerce specialized Developer Agent."""
+@pytest.fixture(scope="session")
+def fake_llm():
+    """Create a fake LangChain LLM."""
+    return FakeLLM()
+
+
+@pytest.fixture(scope="session")
+def ecommerce_dev_agent(fake_llm, mock_vcs_client, mock_db_client):
+    """Create an e-commerce Developer Agent on the fake LLM (overrides conftest)."""
+    from src.agents.developer import DeveloperAgent
+
     return DeveloperAgent(
-        llm=mock_llm,
+        llm=fake_llm,
         vcs_client=mock_vcs_client,
         db_client=mock_db_client
     )
@@ -61,39 +57,39 @@ class TestEcommerceDeveloperAgent:
 
     def test_has_domain_context(self, ecommerce_dev_agent):
         """Test that the agent has e-commerce tech stack context."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
         assert context != ""
-        assert "e-commerce" in context.lower() or "ecommerce" in context.lower()
+        assert "e-commerce" in context or "ecommerce" in context
 
     def test_domain_context_includes_tech_stack(self, ecommerce_dev_agent):
         """Test that domain context specifies e-commerce tech stack."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
         # Should mention key technologies
-        assert "python" in context.lower()
-        assert "fastapi" in context.lower()
-        assert "supabase" in context.lower() or "postgresql" in context.lower()
+        assert "python" in context
+        assert "fastapi" in context
+        assert "supabase" in context or "postgresql" in context
 
     def test_domain_context_includes_payment_integration(self, ecommerce_dev_agent):
         """Test that context includes payment integration guidance."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "stripe" in context.lower() or "payment" in context.lower()
+        assert "stripe" in context or "payment" in context
 
     def test_domain_context_includes_code_patterns(self, ecommerce_dev_agent):
         """Test that context includes e-commerce code patterns."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
         # Should mention e-commerce models
-        assert "product" in context.lower() or "order" in context.lower() or "cart" in context.lower()
+        assert "product" in context or "order" in context or "cart" in context
 
     def test_domain_context_includes_security_guidance(self, ecommerce_dev_agent):
         """Test that security guidance is included for payments."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "pci" in context.lower() or "security" in context.lower()
-        assert "card" in context.lower() or "payment" in context.lower()
+        assert "pci" in context or "security" in context
+        assert "card" in context or "payment" in context
 
     def test_system_prompt_inherited(self, ecommerce_dev_agent):
         """Test that system prompt is inherited from mother repo."""
@@ -114,7 +110,8 @@ class TestEcommerceDeveloperAgent:
         assert base_prompt in customized_prompt
 
         # Should mention e-commerce concerns
-        assert "payment" in customized_prompt.lower() or "inventory" in customized_prompt.lower() or "order" in customized_prompt.lower()
+        customized_lower = customized_prompt.lower()
+        assert "payment" in customized_lower or "inventory" in customized_lower or "order" in customized_lower
 
     def test_build_messages_includes_ecommerce_context(self, ecommerce_dev_agent):
         """Test that message building includes e-commerce tech stack."""
@@ -126,7 +123,8 @@ class TestEcommerceDeveloperAgent:
 
         # System message should include tech stack
         system_message = messages[0]
-        assert "fastapi" in system_message.content.lower() or "python" in system_message.content.lower()
+        content = system_message.content.lower()
+        assert "fastapi" in content or "python" in content
 
     def test_ecommerce_context_differs_from_generic(self, ecommerce_dev_agent):
         """
@@ -134,28 +132,18 @@ class TestEcommerceDeveloperAgent:
 
         This verifies the specialization actually happened.
         """
-        # Import mother repo's generic agent
-        from src.agents.developer import DeveloperAgent as GenericDeveloperAgent
-
-        # Create mock generic agent
-        mock_llm = Mock()
-        mock_vcs = Mock()
-        mock_db = Mock()
-
-        generic_agent = GenericDeveloperAgent(
-            llm=mock_llm,
-            vcs_client=mock_vcs,
-            db_client=mock_db
-        )
-
-        generic_context = generic_agent.get_domain_context()
+        # The mother repo's agent is the e-commerce agent's base class;
+        # call its implementation directly instead of building a second agent
+        generic_agent_class = type(ecommerce_dev_agent).__bases__[0]
+        generic_context = generic_agent_class.get_domain_context(ecommerce_dev_agent)
         ecommerce_context = ecommerce_dev_agent.get_domain_context()
+        ecommerce_context_lower = ecommerce_context.lower()
 
         # E-commerce should have more specific context
         assert len(ecommerce_context) > len(generic_context)
 
         # E-commerce should mention domain-specific patterns
-        assert "product" in ecommerce_context.lower() or "order" in ecommerce_context.lower()
+        assert "product" in ecommerce_context_lower or "order" in ecommerce_context_lower
 
 
 class TestEcommerceCodeGenerationGuidance:
@@ -163,31 +151,31 @@ class TestEcommerceCodeGenerationGuidance:
 
     def test_payment_processing_guidance(self, ecommerce_dev_agent):
         """Test that payment code generation includes security guidance."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
         # Should warn about not storing card numbers
-        assert "never" in context.lower() or "don't" in context.lower()
-        assert "card" in context.lower()
+        assert "never" in context or "don't" in context
+        assert "card" in context
 
     def test_inventory_management_guidance(self, ecommerce_dev_agent):
         """Test that inventory code includes race condition handling."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
         # Should mention transactions or locking
-        assert "transaction" in context.lower() or "lock" in context.lower() or "inventory" in context.lower()
+        assert "transaction" in context or "lock" in context or "inventory" in context
 
     def test_testing_guidance(self, ecommerce_dev_agent):
         """Test that testing guidance is included."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "test" in context.lower() or "pytest" in context.lower()
+        assert "test" in context or "pytest" in context
 
     def test_api_design_patterns(self, ecommerce_dev_agent):
         """Test that API design patterns are included."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "fastapi" in context.lower() or "api" in context.lower()
-        assert "endpoint" in context.lower() or "router" in context.lower() or "route" in context.lower()
+        assert "fastapi" in context or "api" in context
+        assert "endpoint" in context or "router" in context or "route" in context
 
 
 class TestEcommercePromptCustomization:
@@ -195,24 +183,24 @@ class TestEcommercePromptCustomization:
 
     def test_payment_feature_customization(self, ecommerce_dev_agent):
         """Test customization for payment-related features."""
-        customized = ecommerce_dev_agent.customize_prompt("Implement payment processing")
+        customized = ecommerce_dev_agent.customize_prompt("Implement payment processing").lower()
 
-        assert "payment" in customized.lower()
-        assert "stripe" in customized.lower() or "gateway" in customized.lower()
+        assert "payment" in customized
+        assert "stripe" in customized or "gateway" in customized
 
     def test_inventory_feature_customization(self, ecommerce_dev_agent):
         """Test customization for inventory-related features."""
-        customized = ecommerce_dev_agent.customize_prompt("Implement inventory tracking")
+        customized = ecommerce_dev_agent.customize_prompt("Implement inventory tracking").lower()
 
-        assert "inventory" in customized.lower() or "stock" in customized.lower()
+        assert "inventory" in customized or "stock" in customized
 
     def test_order_lifecycle_guidance(self, ecommerce_dev_agent):
         """Test that order lifecycle guidance is included."""
-        customized = ecommerce_dev_agent.customize_prompt("Implement order management")
+        customized = ecommerce_dev_agent.customize_prompt("Implement order management").lower()
 
-        assert "order" in customized.lower()
+        assert "order" in customized
         # Should mention states or status
-        assert "status" in customized.lower() or "state" in customized.lower() or "lifecycle" in customized.lower()
+        assert "status" in customized or "state" in customized or "lifecycle" in customized
 
 
 @pytest.mark.integration
@@ -247,7 +235,7 @@ class TestEcommerceDeveloperIntegration:
 
     def test_agent_can_log_actions(self, ecommerce_dev_agent, mock_db_client):
         """Test that agent can log actions to database."""
-        mock_db_client.log_agent_action = Mock(return_value="action-uuid")
+        mock_db_client.log_agent_action.return_value = "action-uuid"
 
         action_id = ecommerce_dev_agent.log_action(
             action_type="code_generated",
@@ -263,22 +251,22 @@ class TestEcommerceTechStackValidation:
 
     def test_specifies_python_version(self, ecommerce_dev_agent):
         """Test that Python version is specified."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "python" in context.lower()
+        assert "python" in context
         assert "3.10" in context or "3.11" in context or "3." in context
 
     def test_specifies_database(self, ecommerce_dev_agent):
         """Test that database technology is specified."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "supabase" in context.lower() or "postgresql" in context.lower()
+        assert "supabase" in context or "postgresql" in context
 
     def test_specifies_payment_provider(self, ecommerce_dev_agent):
         """Test that payment provider is specified."""
-        context = ecommerce_dev_agent.get_domain_context()
+        context = ecommerce_dev_agent.get_domain_context().lower()
 
-        assert "stripe" in context.lower()
+        assert "stripe" in context
 
     def test_includes_code_examples(self, ecommerce_dev_agent):
         """Test that context includes code examples."""
@@ -292,4 +280,4 @@ class TestEcommerceTechStackValidation:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
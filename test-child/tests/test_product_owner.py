@@ -9,90 +9,57 @@ These tests verify that:
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-# Add parent directories to path
-parent_dir = Path(__file__).resolve().parent.parent.parent
-test_child_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(parent_dir))
-sys.path.insert(0, str(test_child_dir))
+from _paths import CHILD_DIR, PARENT_DIR, ensure_on_syspath
 
-from src.agents.product_owner import ProductOwnerAgent
-from src.models.issue_analysis import IssueAnalysis
-
-
-@pytest.fixture
-def mock_llm():
-    """Create a mock LangChain LLM."""
-    llm = Mock()
-    llm.invoke = Mock(return_value=Mock(content='{"needs_clarification": true}'))
-    return llm
-
-
-@pytest.fixture
-def mock_vcs_client():
-    """Create a mock VCS client."""
-    return Mock()
-
-
-@pytest.fixture
-def mock_db_client():
-    """Create a mock database client."""
-    return Mock()
+# Mother repo and this child on sys.path, child first
+ensure_on_syspath(PARENT_DIR, CHILD_DIR)
 
-
-@pytest.fixture
-def ecommerce_agent(mock_llm, mock_vcs_client, mock_db_client):
-    """Create an e-commerce specialized Product Owner Agent."""
-    return ProductOwnerAgent(
-        llm=mock_llm,
-        vcs_client=mock_vcs_client,
-        db_client=mock_db_client
-    )
+from src.models.issue_analysis import IssueAnalysis
 
 
 class TestEcommerceProductOwnerAgent:
     """Test suite for e-commerce specialized Product Owner Agent."""
 
-    def test_agent_instantiation(self, ecommerce_agent):
+    def test_agent_instantiation(self, ecommerce_po_agent):
         """Test that the specialized agent can be instantiated."""
-        assert ecommerce_agent is not None
-        assert ecommerce_agent.agent_name == "ProductOwnerAgent"
+        assert ecommerce_po_agent is not None
+        assert ecommerce_po_agent.agent_name == "ProductOwnerAgent"
 
-    def test_has_domain_context(self, ecommerce_agent):
+    def test_has_domain_context(self, ecommerce_po_agent):
         """Test that the agent has e-commerce domain context."""
-        context = ecommerce_agent.get_domain_context()
+        context = ecommerce_po_agent.get_domain_context().lower()
 
         assert context != ""
-        assert "e-commerce" in context.lower() or "ecommerce" in context.lower()
+        assert "e-commerce" in context or "ecommerce" in context
 
         # Check for key e-commerce concepts
-        assert "inventory" in context.lower()
-        assert "payment" in context.lower()
-        assert "shipping" in context.lower() or "cart" in context.lower()
+        assert "inventory" in context
+        assert "payment" in context
+        assert "shipping" in context or "cart" in context
 
-    def test_domain_context_includes_pci_dss(self, ecommerce_agent):
+    def test_domain_context_includes_pci_dss(self, ecommerce_po_agent):
         """Test that domain context includes PCI-DSS compliance."""
-        context = ecommerce_agent.get_domain_context()
-        assert "pci" in context.lower() or "payment" in context.lower()
+        context = ecommerce_po_agent.get_domain_context().lower()
+        assert "pci" in context or "payment" in context
 
-    def test_domain_context_includes_inventory(self, ecommerce_agent):
+    def test_domain_context_includes_inventory(self, ecommerce_po_agent):
         """Test that domain context mentions inventory management."""
-        context = ecommerce_agent.get_domain_context()
-        assert "inventory" in context.lower() or "stock" in context.lower()
+        context = ecommerce_po_agent.get_domain_context().lower()
+        assert "inventory" in context or "stock" in context
 
-    def test_system_prompt_inherited(self, ecommerce_agent):
+    def test_system_prompt_inherited(self, ecommerce_po_agent):
         """Test that system prompt is inherited from mother repo."""
-        prompt = ecommerce_agent.get_system_prompt()
+        prompt = ecommerce_po_agent.get_system_prompt()
 
         assert prompt != ""
         assert "Product Owner" in prompt or "Business Analyst" in prompt
 
-    def test_customize_prompt_adds_ecommerce_focus(self, ecommerce_agent):
+    def test_customize_prompt_adds_ecommerce_focus(self, ecommerce_po_agent):
         """Test that prompt customization adds e-commerce specific guidance."""
         base_prompt = "Analyze this issue."
-        customized_prompt = ecommerce_agent.customize_prompt(base_prompt)
+        customized_prompt = ecommerce_po_agent.customize_prompt(base_prompt)
 
         # Customized prompt should be longer
         assert len(customized_prompt) > len(base_prompt)
@@ -101,11 +68,12 @@ class TestEcommerceProductOwnerAgent:
         assert base_prompt in customized_prompt
 
         # Should mention e-commerce concerns
-        assert "payment" in customized_prompt.lower() or "ecommerce" in customized_prompt.lower()
+        customized_lower = customized_prompt.lower()
+        assert "payment" in customized_lower or "ecommerce" in customized_lower
 
-    def test_build_messages_includes_ecommerce_context(self, ecommerce_agent):
+    def test_build_messages_includes_ecommerce_context(self, ecommerce_po_agent):
         """Test that message building includes e-commerce domain context."""
-        messages = ecommerce_agent.build_messages(
+        messages = ecommerce_po_agent.build_messages(
             user_input="Test issue analysis"
         )
 
@@ -113,13 +81,13 @@ class TestEcommerceProductOwnerAgent:
 
         # System message should include domain context
         system_message = messages[0]
-        assert "inventory" in system_message.content.lower() or "payment" in system_message.content.lower()
+        content = system_message.content.lower()
+        assert "inventory" in content or "payment" in content
 
-    def test_inherits_analyze_issue_method(self, ecommerce_agent, mock_llm):
+    def test_inherits_analyze_issue_method(self, ecommerce_po_agent, mock_llm):
         """Test that analyze_issue method is inherited and works."""
         # Mock LLM response with valid JSON
-        mock_response = Mock()
-        mock_response.content = """{
+        mock_response = SimpleNamespace(content="""{
             "needs_clarification": true,
             "is_complete": false,
             "questions": ["What payment gateways should be supported?"],
@@ -128,14 +96,11 @@ class TestEcommerceProductOwnerAgent:
             "technical_considerations": [],
             "estimated_complexity": "medium",
             "suggested_labels": ["feature"]
-        }"""
+        }""")
         mock_llm.invoke.return_value = mock_response
 
-        # Mock database client
-        ecommerce_agent.db_client.log_agent_action = Mock(return_value="mock-uuid")
-
         # Call inherited method
-        analysis = ecommerce_agent.analyze_issue(
+        analysis = ecommerce_po_agent.analyze_issue(
             issue_number=1,
             issue_title="Add payment processing",
             issue_body="We need to accept payments"
@@ -145,78 +110,67 @@ class TestEcommerceProductOwnerAgent:
         assert analysis.needs_clarification == True
         assert len(analysis.questions) > 0
 
-    def test_format_github_comment_includes_agent_name(self, ecommerce_agent):
+    def test_format_github_comment_includes_agent_name(self, ecommerce_po_agent):
         """Test that GitHub comments include agent signature."""
-        comment = ecommerce_agent.format_github_comment("Test comment")
+        comment = ecommerce_po_agent.format_github_comment("Test comment")
 
         assert "Test comment" in comment
         assert "ProductOwnerAgent" in comment or "🤖" in comment
 
-    def test_ecommerce_context_differs_from_generic(self, ecommerce_agent):
+    def test_ecommerce_context_differs_from_generic(self, ecommerce_po_agent):
         """
         Test that e-commerce context is different from generic (mother) agent.
 
         This verifies the specialization actually happened.
         """
-        # Import mother repo's generic agent
-        from src.agents.product_owner import ProductOwnerAgent as GenericProductOwnerAgent
-
-        # Create a mock generic agent
-        mock_llm = Mock()
-        mock_vcs = Mock()
-        mock_db = Mock()
-
-        generic_agent = GenericProductOwnerAgent(
-            llm=mock_llm,
-            vcs_client=mock_vcs,
-            db_client=mock_db
-        )
-
-        generic_context = generic_agent.get_domain_context()
-        ecommerce_context = ecommerce_agent.get_domain_context()
+        # The mother repo's agent is the e-commerce agent's base class;
+        # call its implementation directly instead of building a second agent
+        generic_agent_class = type(ecommerce_po_agent).__bases__[0]
+        generic_context = generic_agent_class.get_domain_context(ecommerce_po_agent)
+        ecommerce_context = ecommerce_po_agent.get_domain_context()
+        ecommerce_context_lower = ecommerce_context.lower()
 
         # E-commerce should have more context than generic (which is empty)
         assert len(ecommerce_context) > len(generic_context)
 
         # E-commerce should mention domain-specific terms
-        assert "inventory" in ecommerce_context.lower()
-        assert "payment" in ecommerce_context.lower()
+        assert "inventory" in ecommerce_context_lower
+        assert "payment" in ecommerce_context_lower
 
 
 class TestEcommercePromptCustomization:
     """Test suite specifically for e-commerce prompt customization."""
 
-    def test_payment_processing_questions(self, ecommerce_agent):
+    def test_payment_processing_questions(self, ecommerce_po_agent):
         """Test that payment-related issues trigger payment questions."""
-        customized = ecommerce_agent.customize_prompt("User wants to add payment")
+        customized = ecommerce_po_agent.customize_prompt("User wants to add payment").lower()
 
-        assert "payment" in customized.lower()
-        assert "gateway" in customized.lower() or "stripe" in customized.lower()
+        assert "payment" in customized
+        assert "gateway" in customized or "stripe" in customized
 
-    def test_inventory_considerations(self, ecommerce_agent):
+    def test_inventory_considerations(self, ecommerce_po_agent):
         """Test that inventory concerns are included in customization."""
-        customized = ecommerce_agent.customize_prompt("Product catalog needed")
+        customized = ecommerce_po_agent.customize_prompt("Product catalog needed").lower()
 
-        assert "inventory" in customized.lower() or "stock" in customized.lower()
+        assert "inventory" in customized or "stock" in customized
 
-    def test_checkout_flow_guidance(self, ecommerce_agent):
+    def test_checkout_flow_guidance(self, ecommerce_po_agent):
         """Test that checkout-related guidance is provided."""
-        customized = ecommerce_agent.customize_prompt("Implement checkout")
+        customized = ecommerce_po_agent.customize_prompt("Implement checkout").lower()
 
-        assert "checkout" in customized.lower() or "cart" in customized.lower()
+        assert "checkout" in customized or "cart" in customized
 
 
 @pytest.mark.integration
 class TestEcommerceAgentIntegration:
     """Integration tests requiring more complex setup."""
 
-    def test_full_workflow_with_ecommerce_context(self, ecommerce_agent, mock_llm):
+    def test_full_workflow_with_ecommerce_context(self, ecommerce_po_agent, mock_llm):
         """
         Test a complete workflow to ensure e-commerce context flows through.
         """
         # Mock LLM to return e-commerce specific analysis
-        mock_response = Mock()
-        mock_response.content = """{
+        mock_response = SimpleNamespace(content="""{
             "needs_clarification": true,
             "is_complete": false,
             "questions": [
@@ -229,20 +183,14 @@ class TestEcommerceAgentIntegration:
             "technical_considerations": ["PCI-DSS compliance"],
             "estimated_complexity": "high",
             "suggested_labels": ["feature", "payment"]
-        }"""
+        }""")
         mock_llm.invoke.return_value = mock_response
 
-        # Mock database
-        ecommerce_agent.db_client.log_agent_action = Mock(return_value="uuid")
-        ecommerce_agent.db_client.create_conversation = Mock(return_value="conv-uuid")
-        ecommerce_agent.db_client.get_conversation = Mock(return_value=None)
-
-        # Mock VCS
-        ecommerce_agent.vcs_client.create_issue_comment = Mock()
-        ecommerce_agent.vcs_client.add_labels_to_issue = Mock()
+        # Database and VCS clients come wired from conftest: no existing
+        # conversation, and ids returned for new rows and actions
 
         # Execute workflow
-        state = ecommerce_agent.handle_issue_workflow(
+        state = ecommerce_po_agent.handle_issue_workflow(
             issue_number=1,
             issue_id=123,
             issue_title="Add payment processing",
@@ -260,8 +208,9 @@ class TestEcommerceAgentIntegration:
 
         # Check that system message includes e-commerce context
         system_message = call_args[0]
-        assert "inventory" in system_message.content.lower() or "payment" in system_message.content.lower()
+        content = system_message.content.lower()
+        assert "inventory" in content or "payment" in content
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,100 @@
+"""
+Unit tests for the circuit breaker.
+
+A fake clock replaces the time module, so the reset timeout is crossed
+without sleeping.
+"""
+
+import pytest
+
+from src.utils import circuit_breaker
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Monotonic clock that only moves when advanced."""
+
+    def __init__(self, start: float = 1_000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Install a fake clock in the circuit breaker module."""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def _fail():
+    raise ConnectionError("backend down")
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    """Fail calls until the breaker opens."""
+    for _ in range(breaker.fail_max):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+
+def test_opens_after_fail_max_and_rejects_without_calling(clock):
+    breaker = CircuitBreaker(name="test", fail_max=3, reset_timeout=30.0)
+    _trip(breaker)
+    calls = []
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, "called")
+
+    assert breaker.is_open
+    assert calls == []
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(name="test", fail_max=2)
+
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+
+    assert not breaker.is_open
+
+
+def test_unlisted_exceptions_do_not_count(clock):
+    breaker = CircuitBreaker(
+        name="test",
+        fail_max=1,
+        failure_exceptions=(ConnectionError,)
+    )
+
+    with pytest.raises(ValueError):
+        breaker.call(int, "not a number")
+
+    assert not breaker.is_open
+
+
+def test_trial_call_after_reset_timeout(clock):
+    breaker = CircuitBreaker(name="test", fail_max=1, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock.advance(30.0)
+
+    # Half-open: a failing trial re-opens, a successful one closes
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.is_open
+
+    clock.advance(30.0)
+    assert breaker.call(lambda: "ok") == "ok"
+    assert not breaker.is_open
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
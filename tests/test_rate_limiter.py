@@ -0,0 +1,115 @@
+"""
+Unit tests for the client-side token bucket rate limiter.
+
+A fake clock replaces the time module, so waits are measured without
+sleeping.
+"""
+
+import threading
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Monotonic and wall clock that only moves when sleep() is called."""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Install a fake clock in the rate limiter module."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_hour=0)
+
+
+def test_acquire_within_capacity_does_not_wait(clock):
+    bucket = TokenBucket(rate_per_hour=3600, capacity=3)
+
+    waits = [bucket.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, 0.0]
+    assert bucket.available == pytest.approx(0.0)
+
+
+def test_empty_bucket_waits_for_refill(clock):
+    # 3600 per hour refills one token per second
+    bucket = TokenBucket(rate_per_hour=3600, capacity=1)
+    bucket.acquire()
+
+    waited = bucket.acquire()
+
+    assert waited == pytest.approx(1.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate_per_hour=3600, capacity=2)
+    bucket.acquire(2)
+
+    clock.sleep(60)
+
+    assert bucket.available == pytest.approx(2.0)
+
+
+def test_sync_clamps_tokens_to_server_remaining(clock):
+    bucket = TokenBucket(rate_per_hour=3600, capacity=10)
+
+    bucket.sync(remaining=2, reset_at=clock.time() + 3600)
+
+    assert bucket.available == pytest.approx(2.0)
+    assert bucket.acquire(2) == 0.0
+
+
+def test_sync_with_no_remaining_blocks_until_reset(clock):
+    bucket = TokenBucket(rate_per_hour=3600, capacity=10)
+
+    bucket.sync(remaining=0, reset_at=clock.time() + 30)
+    waited = bucket.acquire()
+
+    assert waited >= 30.0
+
+
+def test_concurrent_acquires_never_overdraw(clock):
+    # Refill is negligible, so only the initial tokens can be handed out
+    bucket = TokenBucket(rate_per_hour=1, capacity=5)
+    waits = []
+    waits_lock = threading.Lock()
+
+    def worker():
+        waited = bucket.acquire()
+        with waits_lock:
+            waits.append(waited)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert waits == [0.0] * 5
+    assert bucket.available == pytest.approx(0.0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
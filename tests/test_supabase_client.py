@@ -0,0 +1,120 @@
+"""
+Unit tests for the Supabase client's read cache and delivery claims.
+
+The Supabase SDK client is replaced by a MagicMock, so queries are
+recorded instead of sent.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils import supabase_client
+from src.utils.supabase_client import SupabaseClient
+
+
+CONVERSATION = {
+    "id": "conv-1",
+    "issue_number": 42,
+    "repo_full_name": "org/repo",
+    "status": "needs_clarification",
+    "analysis": '{"needs_clarification": true}',
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a SupabaseClient backed by a mock SDK client."""
+    monkeypatch.setattr(supabase_client, "create_client", lambda url, key: MagicMock())
+    monkeypatch.setattr(SupabaseClient, "_pool_postgrest_session", lambda self: None)
+    return SupabaseClient(url="https://example.supabase.co", key="test-key")
+
+
+@pytest.fixture
+def rpc(client):
+    """Mock RPC returning CONVERSATION from get_conversation."""
+    rpc = client.client.rpc
+    rpc.return_value.execute.side_effect = lambda: SimpleNamespace(
+        data=[dict(CONVERSATION)]
+    )
+    return rpc
+
+
+def test_get_conversation_is_cached(client, rpc):
+    first = client.get_conversation(42, "org/repo")
+    second = client.get_conversation(42, "org/repo")
+
+    assert second is first
+    assert first["analysis"] == {"needs_clarification": True}
+    assert rpc.call_count == 1
+
+
+def test_disable_cache_skips_the_cache(client, rpc):
+    client.disable_cache = True
+
+    client.get_conversation(42, "org/repo")
+    client.get_conversation(42, "org/repo")
+
+    assert rpc.call_count == 2
+
+
+@pytest.mark.parametrize("key", [42, "conv-1", None])
+def test_invalidate_drops_matching_entries(client, rpc, key):
+    # Lookup value, cached row id, or the whole table
+    client.get_conversation(42, "org/repo")
+
+    client.invalidate("conversations", key)
+    client.get_conversation(42, "org/repo")
+
+    assert rpc.call_count == 2
+
+
+def test_invalidate_keeps_other_entries(client, rpc):
+    client.get_conversation(42, "org/repo")
+
+    client.invalidate("conversations", 7)
+    client.invalidate("agent_actions")
+    client.get_conversation(42, "org/repo")
+
+    assert rpc.call_count == 1
+
+
+def test_cached_read_expires(client, rpc, monkeypatch):
+    monkeypatch.setattr(supabase_client, "READ_CACHE_TTL", -1.0)
+
+    client.get_conversation(42, "org/repo")
+    client.get_conversation(42, "org/repo")
+
+    assert rpc.call_count == 2
+
+
+@pytest.mark.parametrize("data, claimed", [([{"delivery_id": "d-1"}], True), ([], False)])
+def test_claim_webhook_delivery(client, data, claimed):
+    # ON CONFLICT DO NOTHING returns no row for an already-seen delivery
+    table = client.client.table
+    table.return_value.upsert.return_value.execute.return_value = SimpleNamespace(
+        data=data
+    )
+
+    assert client.claim_webhook_delivery("d-1", "issues") is claimed
+
+    table.assert_called_with("webhook_deliveries")
+    _, kwargs = table.return_value.upsert.call_args
+    assert kwargs["on_conflict"] == "delivery_id"
+    assert kwargs["ignore_duplicates"] is True
+
+
+def test_release_webhook_delivery_deletes_the_claim(client):
+    table = client.client.table
+
+    client.release_webhook_delivery("d-1")
+
+    table.assert_called_with("webhook_deliveries")
+    table.return_value.delete.return_value.eq.assert_called_once_with(
+        "delivery_id", "d-1"
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,175 @@
+"""
+Unit tests for webhook body limits, signatures and delivery deduplication.
+
+The database client is replaced by a Mock, so no Supabase project is
+needed; settings only have to be present for the module to import.
+"""
+
+import hashlib
+import hmac
+import os
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+
+# api.webhooks loads settings at import time
+for _name, _value in {
+    "AI_API_KEY": "test-ai-key",
+    "GITHUB_TOKEN": "test-github-token",
+    "GITHUB_REPO": "org/repo",
+    "GITHUB_WEBHOOK_SECRET": "test-secret",
+    "SUPABASE_URL": "https://example.supabase.co",
+    "SUPABASE_ANON_KEY": "test-anon-key",
+    "SUPABASE_SERVICE_ROLE_KEY": "test-service-key",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from api import webhooks  # noqa: E402
+
+
+SECRET = "test-secret"
+
+
+class FakeRequest:
+    """Request exposing only the headers and body stream the reader uses."""
+
+    def __init__(self, chunks, content_length=None):
+        self.headers = {}
+        if content_length is not None:
+            self.headers["content-length"] = str(content_length)
+        self._chunks = chunks
+
+    async def stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _signature(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def clear_deliveries():
+    """Start every test with an empty local delivery cache."""
+    webhooks._recent_deliveries.clear()
+    yield
+    webhooks._recent_deliveries.clear()
+
+
+@pytest.fixture
+def db_client(monkeypatch):
+    """Mock database client returned by create_supabase_client."""
+    client = Mock()
+    client.claim_webhook_delivery.return_value = True
+    monkeypatch.setattr(webhooks, "create_supabase_client", lambda url, key: client)
+    return client
+
+
+# ============================================
+# Body size cap and signature
+# ============================================
+
+async def test_read_body_feeds_the_mac():
+    mac = webhooks._hmac_prototype(SECRET).copy()
+
+    body = await webhooks.read_webhook_body(
+        FakeRequest([b'{"action": ', b'"opened"}']),
+        mac=mac
+    )
+
+    assert body == b'{"action": "opened"}'
+    assert webhooks.signature_matches(mac, _signature(body))
+
+
+async def test_declared_oversize_body_is_rejected_before_reading():
+    request = FakeRequest([b"x"], content_length=101)
+    request.stream = Mock(side_effect=AssertionError("body was read"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await webhooks.read_webhook_body(request, max_bytes=100)
+
+    assert exc_info.value.status_code == 413
+
+
+async def test_streamed_oversize_body_is_rejected():
+    # No Content-Length (chunked upload), so the cap applies while reading
+    request = FakeRequest([b"x" * 60, b"x" * 60])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await webhooks.read_webhook_body(request, max_bytes=100)
+
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.parametrize("signature", [
+    None,
+    "",
+    "sha1=abc",
+    _signature(b"other body"),
+    _signature(b"{}", secret="wrong-secret"),
+])
+def test_signature_mismatch(signature):
+    mac = webhooks._hmac_prototype(SECRET).copy()
+    mac.update(b"{}")
+
+    assert not webhooks.signature_matches(mac, signature)
+
+
+def test_hmac_prototype_copies_do_not_share_state():
+    first = webhooks._hmac_prototype(SECRET).copy()
+    first.update(b"first")
+    second = webhooks._hmac_prototype(SECRET).copy()
+    second.update(b"second")
+
+    assert webhooks.signature_matches(second, _signature(b"second"))
+    assert webhooks.signature_matches(first, _signature(b"first"))
+
+
+# ============================================
+# Delivery deduplication
+# ============================================
+
+async def test_new_delivery_is_claimed(db_client):
+    assert not await webhooks.is_duplicate_delivery("d-1", "issues")
+
+    db_client.claim_webhook_delivery.assert_called_once_with("d-1", "issues")
+
+
+async def test_redelivery_to_same_instance_skips_the_database(db_client):
+    await webhooks.is_duplicate_delivery("d-1", "issues")
+
+    assert await webhooks.is_duplicate_delivery("d-1", "issues")
+    assert db_client.claim_webhook_delivery.call_count == 1
+
+
+async def test_delivery_claimed_elsewhere_is_duplicate(db_client):
+    db_client.claim_webhook_delivery.return_value = False
+
+    assert await webhooks.is_duplicate_delivery("d-1", "issues")
+
+
+async def test_database_failure_processes_the_delivery(db_client):
+    db_client.claim_webhook_delivery.side_effect = RuntimeError("db down")
+
+    assert not await webhooks.is_duplicate_delivery("d-1", "issues")
+
+
+async def test_missing_delivery_id_is_never_duplicate(db_client):
+    assert not await webhooks.is_duplicate_delivery(None, "issues")
+    assert not await webhooks.is_duplicate_delivery(None, "issues")
+
+    db_client.claim_webhook_delivery.assert_not_called()
+
+
+async def test_released_delivery_can_be_redelivered(db_client):
+    await webhooks.is_duplicate_delivery("d-1", "issues")
+
+    await webhooks.release_delivery("d-1")
+
+    db_client.release_webhook_delivery.assert_called_once_with("d-1")
+    assert not await webhooks.is_duplicate_delivery("d-1", "issues")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))